@@ -211,9 +211,11 @@ class KeywordExtractor:
             ]
             results.append(keywords)
 
-        log.debug(
-            f"키워드 추출 완료: {len(texts)}건 처리, "
-            f"평균 {sum(len(k) for k in results)/max(len(results), 1):.1f}개/건"
+        # 평균 계산은 DEBUG를 받는 sink가 있을 때만 수행 (lazy)
+        log.opt(lazy=True).debug(
+            "키워드 추출 완료: {}건 처리, 평균 {:.1f}개/건",
+            lambda: len(texts),
+            lambda: sum(len(k) for k in results) / max(len(results), 1),
         )
         return results
 
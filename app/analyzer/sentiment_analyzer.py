@@ -171,8 +171,9 @@ class SentimentAnalyzer:
         # -1.00 ~ 1.00 범위로 클램핑 (수식 특성상 이미 범위 내이지만 안전하게)
         score = max(-1.0, min(1.0, score))
 
+        # 건별 호출이므로 f-string 대신 인자로 넘겨 DEBUG 비활성 시 포맷팅 생략
         log.debug(
-            f"감정 분석: pos={positive_count}, neg={negative_count}, score={score:.2f}"
+            "감정 분석: pos={}, neg={}, score={:.2f}", positive_count, negative_count, score
         )
         return round(score, 2)
 
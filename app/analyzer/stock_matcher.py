@@ -148,7 +148,7 @@ class StockMatcher:
                 mention_counts[code] = mention_counts.get(code, 0) + len(matches)
 
         if mention_counts:
-            log.debug(f"종목 감지: {mention_counts}")
+            log.debug("종목 감지: {}", mention_counts)
 
         return mention_counts
 
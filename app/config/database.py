@@ -24,9 +24,22 @@ DATABASE_URL = (
     f"/{os.getenv('DB_NAME', 'lucr_db')}"
 )
 
-# Engine: DB 연결 풀 관리 (앱 전체에서 1개만 생성)
+# 프로세스당 연결 풀 크기 (기본: 연결 20개 + 순간 부하 시 최대 40개 추가)
+# 다중 Worker 실행 시 app.worker가 Worker 수로 나눈 값을 지정하므로,
+# 전체 연결 수는 Worker 수와 관계없이 DB max_connections 안에 머무름
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+
+# Engine: DB 연결 풀 관리 (프로세스 전체에서 1개만 생성)
 # echo=False: SQL 로그 출력 안함 (True로 바꾸면 디버깅용 SQL 출력)
-engine = create_engine(DATABASE_URL, echo=False)
+# pool_pre_ping=True: 풀에서 꺼낸 연결이 끊겼으면 자동으로 재연결
+engine = create_engine(
+    DATABASE_URL,
+    echo=False,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+)
 
 # SessionLocal: 호출할 때마다 새 세션(트랜잭션 단위) 생성
 # autocommit=False: 명시적으로 commit() 해야 반영
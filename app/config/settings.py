@@ -0,0 +1,53 @@
+"""
+Worker 실행 설정
+
+역할:
+  - .env 로드(load_dotenv)와 환경 변수 파싱을 프로세스당 1번만 수행
+  - RabbitMQ 접속 정보 / Consumer 튜닝 값을 타입이 정해진 불변 객체로 제공
+
+사용법:
+  from app.config.settings import get_settings
+
+  settings = get_settings()
+  settings.rabbitmq_host
+"""
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+from dotenv import load_dotenv
+
+
+@dataclass(frozen=True)
+class Settings:
+    """환경 변수에서 읽은 Worker 설정 (생성 후 변경 불가)"""
+
+    # RabbitMQ 접속 정보 (Consumer/Publisher 공용)
+    rabbitmq_host: str = "localhost"
+    rabbitmq_port: int = 5672
+    rabbitmq_user: str = "charlie0701"
+    rabbitmq_password: str = "alpha5059"
+    # ACK 전에 RabbitMQ가 이 Consumer에 미리 보내 둘 메시지 수 = 프로세스당 동시 처리 작업 수
+    # 작업 1건이 5개 언론사 크롤링 + DB 세션 1개를 쓰므로 기본은 1 (올리면 DB 풀 크기도 함께 조정)
+    rabbitmq_prefetch: int = 1
+    # 크롤러가 yield한 뉴스를 몇 건씩 모아 저장할지 (분석 + INSERT 1회 단위)
+    crawl_save_batch_size: int = 100
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """.env를 로드한 뒤 환경 변수로 Settings 생성 (없는 값은 기본값 사용)"""
+        load_dotenv()
+        return cls(
+            rabbitmq_host=os.getenv("RABBITMQ_HOST", cls.rabbitmq_host),
+            rabbitmq_port=int(os.getenv("RABBITMQ_PORT", cls.rabbitmq_port)),
+            rabbitmq_user=os.getenv("RABBITMQ_USER", cls.rabbitmq_user),
+            rabbitmq_password=os.getenv("RABBITMQ_PASSWORD", cls.rabbitmq_password),
+            rabbitmq_prefetch=int(os.getenv("RABBITMQ_PREFETCH", cls.rabbitmq_prefetch)),
+            crawl_save_batch_size=int(os.getenv("CRAWL_SAVE_BATCH_SIZE", cls.crawl_save_batch_size)),
+        )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """프로세스 전역 Settings 반환 (첫 호출 때만 .env를 읽고 이후에는 캐시 사용)"""
+    return Settings.from_env()
@@ -5,136 +5,195 @@
 작성일: 2026-02-03
 """
 
+import asyncio
 import httpx
-from bs4 import BeautifulSoup
+from lxml import etree
+from selectolax.lexbor import LexborHTMLParser
 from datetime import datetime
-from typing import List
-from dateutil import parser as date_parser
+from typing import AsyncIterator, Optional
+from email.utils import parsedate_to_datetime
 import re
 
 from app.models.news import CrawledNews
+from app.utils.http import fetch_limited, get_client
 from app.utils.logger import log
+from app.utils.parse_pool import run_in_parse_pool
+from app.utils.tasks import iter_completed
+from app.utils.url_filter import SEEN_URLS, is_duplicate_content
+
+
+# 제목 공백 정규화 패턴
+_WS_RE = re.compile(r'\s+')
+
+# 본문/이미지 선택자 (기사마다 새로 만들지 않도록 모듈 로드 시 1회 생성)
+_CONTENT_SELECTORS = (
+    '.article-body',
+    '.story-news-content',
+    'article .content',
+    '.news-body',
+    '[itemprop="articleBody"]',
+)
+_IMAGE_SELECTOR = '.article-body img, article img, .story-news-content img'
+
+# RSS 파서 (bytes를 UTF-8로 직접 디코딩, 깨진 항목이 있어도 나머지는 복구)
+_RSS_PARSER = etree.XMLParser(recover=True, encoding='utf-8')
+
+# RSS description이 이 길이(텍스트 기준)를 넘으면 전문으로 보고 상세 페이지 요청 생략
+_FULL_BODY_MIN_CHARS = 600
+
+
+def _extract_chosunbiz(body: bytes, base_url: str) -> tuple[str, Optional[str]]:
+    """조선비즈 기사 HTML에서 (본문, 이미지 URL) 추출 (파싱 프로세스 풀에서 실행)"""
+    tree = LexborHTMLParser(body)
+
+    # 본문 추출 (여러 선택자 시도)
+    content = ""
+    for selector in _CONTENT_SELECTORS:
+        content_tag = tree.css_first(selector)
+        if content_tag:
+            content = content_tag.text(separator=' ', strip=True)
+            break
+
+    # 이미지 추출
+    image_tag = tree.css_first(_IMAGE_SELECTOR)
+    image_url = None
+    if image_tag and image_tag.attributes.get('src'):
+        image_url = image_tag.attributes['src']
+        if not image_url.startswith('http'):
+            image_url = f"https:{image_url}" if image_url.startswith('//') else f"{base_url}{image_url}"
+
+    return content[:5000] if content else "본문 없음", image_url
+
+
+def _strip_html(html: str) -> str:
+    """RSS description(HTML 조각)에서 태그를 제거한 텍스트 추출"""
+    if not html:
+        return ""
+    return LexborHTMLParser(html).text(separator=' ', strip=True)
+
+
+def _extract_img_from_html(html: str) -> Optional[str]:
+    """RSS description(HTML 조각)에서 첫 번째 이미지 URL 추출"""
+    if not html:
+        return None
+    image_tag = LexborHTMLParser(html).css_first('img')
+    if image_tag and image_tag.attributes.get('src'):
+        return image_tag.attributes['src']
+    return None
 
 
 class ChosunbizCrawler:
     """조선비즈 뉴스 크롤러 (RSS 기반)"""
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         self.base_url = "https://biz.chosun.com"
         # 조선닷컴 경제 섹션 RSS 피드
         self.rss_url = "https://www.chosun.com/arc/outboundfeeds/rss/category/economy/?outputType=xml"
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        }
+        # 상세 페이지 동시 요청 수 제한 (대상 서버 부하 방지)
+        self._sem = asyncio.Semaphore(10)
+        # 외부에서 주입한 공유 HTTP 클라이언트 (없으면 get_client() 사용)
+        self._client = client
     
-    async def crawl(self, max_news: int = 50) -> List[CrawledNews]:
+    async def crawl(self, max_news: int = 50) -> AsyncIterator[CrawledNews]:
         """조선비즈 뉴스 크롤링 (RSS 피드 사용)"""
         log.info(f"조선비즈 뉴스 크롤링 시작 (최대 {max_news}개)")
         
+        # 발행 시간을 알 수 없는 기사에 공통으로 쓸 수집 시각 (크롤링 1회당 1번만 계산)
+        now = datetime.now()
+        # 실패 항목 (상세 페이지 실패는 _parse_*에서, 그 외 예외는 iter_completed 결과로 수집)
+        errors = []
+        
         try:
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                # RSS 피드 가져오기
-                response = await client.get(self.rss_url, headers=self.headers)
-                response.raise_for_status()
-                
-                # XML 파싱
-                soup = BeautifulSoup(response.text, 'xml')
-                items = soup.find_all('item')
-                
-                crawled_news = []
-                
-                for item in items[:max_news]:
-                    try:
-                        news = await self._parse_rss_item(item, client)
-                        if news:
-                            crawled_news.append(news)
-                    except Exception as e:
-                        log.error(f"조선비즈 뉴스 파싱 실패: {e}")
-                        continue
-                
-                log.info(f"조선비즈 뉴스 크롤링 완료: {len(crawled_news)}개")
-                return crawled_news
-                
+            # 공유 HTTP 클라이언트 (연결 풀/HTTP2 세션 재사용)
+            client = self._client or get_client()
+            # RSS 피드 가져오기
+            response = await client.get(self.rss_url)
+            response.raise_for_status()
+            
+            # XML 파싱
+            root = etree.fromstring(response.content, _RSS_PARSER)
+            # 이미 저장된 URL은 상세 페이지 요청 없이 건너뜀
+            items = [
+                item for item in root.findall('.//item')
+                if item.findtext('link', default='').strip() not in SEEN_URLS
+            ]
+            
+            # 상세 페이지 요청을 동시에 실행 (Semaphore로 동시 요청 수 제한)
+            tasks = [self._parse_rss_item(item, client, now, errors) for item in items[:max_news]]
         except Exception as e:
             log.error(f"조선비즈 뉴스 크롤링 실패: {e}")
-            return []
+            return
+        
+        count = 0
+        async for result in iter_completed(tasks):
+            # 파싱이 끝난 기사부터 바로 넘겨 전체 목록을 메모리에 모아두지 않음
+            if isinstance(result, Exception):
+                errors.append(result)
+            elif isinstance(result, CrawledNews):
+                count += 1
+                yield result
+        
+        # 실패 항목은 건별로 찍지 않고 한 줄로 요약 (앞 3건만 표시)
+        if errors:
+            log.error(f"조선비즈 뉴스 파싱/본문 수집 실패 {len(errors)}건: {errors[:3]}")
+        
+        log.info(f"조선비즈 뉴스 크롤링 완료: {count}개")
     
-    async def _parse_rss_item(self, item, client: httpx.AsyncClient) -> CrawledNews:
+    async def _parse_rss_item(self, item, client: httpx.AsyncClient, now: datetime, errors: list) -> CrawledNews:
         """RSS 아이템 파싱"""
+        # RSS 기본 정보 추출
+        title = item.findtext('title', default='').strip()
+        link = item.findtext('link', default='').strip()
+        description = item.findtext('description', default='').strip()
+        pub_date_str = (item.findtext('pubDate') or '').strip() or None
+        
+        if not title or not link:
+            return None
+        
+        # 제목 정규화 (500자 제한)
+        title = _WS_RE.sub(' ', title).strip()[:500]
+        
+        # 날짜 파싱 (RSS pubDate는 RFC 822 형식)
         try:
-            # RSS 기본 정보 추출
-            title = item.find('title').get_text(strip=True) if item.find('title') else ""
-            link = item.find('link').get_text(strip=True) if item.find('link') else ""
-            description = item.find('description').get_text(strip=True) if item.find('description') else ""
-            pub_date_str = item.find('pubDate').get_text(strip=True) if item.find('pubDate') else None
-            
-            if not title or not link:
-                return None
-            
-            # 제목 정규화 (500자 제한)
-            title = re.sub(r'\s+', ' ', title).strip()
-            if len(title) > 500:
-                title = title[:500]
-            
-            # 날짜 파싱
-            try:
-                published_at = date_parser.parse(pub_date_str) if pub_date_str else datetime.now()
-            except:
-                published_at = datetime.now()
-            
+            published_at = parsedate_to_datetime(pub_date_str) if pub_date_str else now
+        except:
+            published_at = now
+        
+        # RSS description에 전문이 실린 경우 상세 페이지 요청 생략
+        description_text = _strip_html(description)
+        if len(description_text) > _FULL_BODY_MIN_CHARS:
+            content = description_text[:5000]
+            image_url = _extract_img_from_html(description)
+        else:
             # 본문 가져오기 (RSS description을 fallback으로 사용)
-            content, image_url = await self._fetch_news_content(link, client)
+            try:
+                content, image_url = await self._fetch_news_content(link, client)
+            except Exception as e:
+                # 상세 페이지 실패는 요약 로그에 집계하고, 기사는 대체 본문으로 저장
+                errors.append(e)
+                content, image_url = "본문 없음", None
             
             if not content or content == "본문 없음":
-                content = description[:5000] if description else "본문 없음"
-            
-            return CrawledNews(
-                title=title,
-                content=content,
-                url=link,
-                source="CHOSUNBIZ",
-                published_at=published_at,
-                image_url=image_url
-            )
-            
-        except Exception as e:
-            log.error(f"조선비즈 RSS 아이템 파싱 오류: {e}")
+                content = description_text[:5000] if description_text else "본문 없음"
+        
+        # 다른 URL로 재송고된 동일 본문은 스킵
+        if is_duplicate_content(content):
             return None
+        
+        return CrawledNews(
+            title=title,
+            content=content,
+            url=link,
+            source="CHOSUNBIZ",
+            published_at=published_at,
+            image_url=image_url
+        )
     
     async def _fetch_news_content(self, url: str, client: httpx.AsyncClient) -> tuple[str, str]:
         """뉴스 본문 추출"""
-        try:
-            response = await client.get(url, headers=self.headers)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'lxml')
-            
-            # 본문 추출 (여러 선택자 시도)
-            content_selectors = [
-                '.article-body',
-                '.story-news-content',
-                'article .content',
-                '.news-body',
-                '[itemprop="articleBody"]'
-            ]
-            
-            content = ""
-            for selector in content_selectors:
-                content_tag = soup.select_one(selector)
-                if content_tag:
-                    content = content_tag.get_text(separator=' ', strip=True)
-                    break
-            
-            # 이미지 추출
-            image_tag = soup.select_one('.article-body img, article img, .story-news-content img')
-            image_url = None
-            if image_tag and 'src' in image_tag.attrs:
-                image_url = image_tag['src']
-                if not image_url.startswith('http'):
-                    image_url = f"https:{image_url}" if image_url.startswith('//') else f"{self.base_url}{image_url}"
-            
-            return content[:5000] if content else "본문 없음", image_url
-            
-        except Exception as e:
-            log.error(f"조선비즈 본문 가져오기 실패: {e}")
-            return "본문 없음", None
+        # 본문은 앞부분만 사용하므로 최대 MAX_BODY_BYTES까지만 수신
+        async with self._sem:
+            body = await fetch_limited(client, url)
+        
+        # 파싱(CPU 작업)은 프로세스 풀에서 실행해 이벤트 루프를 비워 둠
+        return await run_in_parse_pool(_extract_chosunbiz, body, self.base_url)
@@ -1,86 +1,145 @@
+import asyncio
 import httpx
-from bs4 import BeautifulSoup
+from lxml import etree
+from selectolax.lexbor import LexborHTMLParser
 from datetime import datetime
-from typing import List
-from dateutil import parser
+from typing import AsyncIterator, Optional
+from email.utils import parsedate_to_datetime
 
 from app.models.news import CrawledNews
+from app.utils.http import fetch_limited, get_client
 from app.utils.logger import log
+from app.utils.parse_pool import run_in_parse_pool
+from app.utils.tasks import iter_completed
+from app.utils.url_filter import SEEN_URLS, is_duplicate_content
+
+
+# 본문/이미지 선택자 (기사마다 새로 만들지 않도록 모듈 로드 시 1회 생성)
+_CONTENT_SELECTORS = (
+    '.news_body',
+    '.newsContents',
+    '#newsBody',
+    '.article_body',
+)
+_IMAGE_SELECTOR = '.news_photo img, .article_photo img'
+
+# RSS 파서 (bytes를 UTF-8로 직접 디코딩, 깨진 항목이 있어도 나머지는 복구)
+_RSS_PARSER = etree.XMLParser(recover=True, encoding='utf-8')
+
+
+def _extract_edaily(body: bytes) -> tuple[str, Optional[str]]:
+    """이데일리 기사 HTML에서 (본문, 이미지 URL) 추출 (파싱 프로세스 풀에서 실행)"""
+    tree = LexborHTMLParser(body)
+
+    # 본문 추출 시도
+    content = None
+    for selector in _CONTENT_SELECTORS:
+        content_tag = tree.css_first(selector)
+        if content_tag:
+            content = content_tag.text(strip=True)
+            break
+
+    if not content:
+        content = "본문 없음"
+
+    # 이미지 추출
+    image_tag = tree.css_first(_IMAGE_SELECTOR)
+    image_url = image_tag.attributes.get('src') if image_tag else None
+
+    return content[:5000], image_url
 
 
 class EdailyCrawler:
     """이데일리 뉴스 크롤러 (RSS 기반)"""
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         self.base_url = "https://www.edaily.co.kr"
         # RSS 피드 URL (전체 기사)
         self.rss_url = "https://www.idailynews.co.kr/rss/allArticle.xml"
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        }
+        # 상세 페이지 동시 요청 수 제한 (대상 서버 부하 방지)
+        self._sem = asyncio.Semaphore(10)
+        # 외부에서 주입한 공유 HTTP 클라이언트 (없으면 get_client() 사용)
+        self._client = client
     
-    async def crawl(self, max_news: int = 50) -> List[CrawledNews]:
+    async def crawl(self, max_news: int = 50) -> AsyncIterator[CrawledNews]:
         """이데일리 RSS 피드 크롤링"""
         log.info(f"이데일리 뉴스 크롤링 시작 (최대 {max_news}개)")
         
+        # 발행 시간을 알 수 없는 기사에 공통으로 쓸 수집 시각 (크롤링 1회당 1번만 계산)
+        now = datetime.now()
+        # 실패 항목 (상세 페이지 실패는 _parse_*에서, 그 외 예외는 iter_completed 결과로 수집)
+        errors = []
+        
         try:
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                response = await client.get(self.rss_url, headers=self.headers)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.text, 'xml')
-                items = soup.find_all('item')
-                
-                crawled_news = []
-                
-                for item in items[:max_news]:
-                    try:
-                        news = await self._parse_rss_item(item, client)
-                        if news:
-                            crawled_news.append(news)
-                    except Exception as e:
-                        log.error(f"뉴스 파싱 실패: {e}")
-                        continue
-                
-                log.info(f"이데일리 뉴스 크롤링 완료: {len(crawled_news)}개")
-                return crawled_news
-                
+            # 공유 HTTP 클라이언트 (연결 풀/HTTP2 세션 재사용)
+            client = self._client or get_client()
+            response = await client.get(self.rss_url)
+            response.raise_for_status()
+            
+            root = etree.fromstring(response.content, _RSS_PARSER)
+            # 이미 저장된 URL은 상세 페이지 요청 없이 건너뜀
+            items = [
+                item for item in root.findall('.//item')
+                if item.findtext('link', default='').strip() not in SEEN_URLS
+            ]
+            
+            # 상세 페이지 요청을 동시에 실행 (Semaphore로 동시 요청 수 제한)
+            tasks = [self._parse_rss_item(item, client, now, errors) for item in items[:max_news]]
         except Exception as e:
             log.error(f"이데일리 뉴스 크롤링 실패: {e}")
-            return []
+            return
+        
+        count = 0
+        async for result in iter_completed(tasks):
+            # 파싱이 끝난 기사부터 바로 넘겨 전체 목록을 메모리에 모아두지 않음
+            if isinstance(result, Exception):
+                errors.append(result)
+            elif isinstance(result, CrawledNews):
+                count += 1
+                yield result
+        
+        # 실패 항목은 건별로 찍지 않고 한 줄로 요약 (앞 3건만 표시)
+        if errors:
+            log.error(f"뉴스 파싱/본문 수집 실패 {len(errors)}건: {errors[:3]}")
+        
+        log.info(f"이데일리 뉴스 크롤링 완료: {count}개")
     
-    async def _parse_rss_item(self, item, client: httpx.AsyncClient) -> CrawledNews:
+    async def _parse_rss_item(self, item, client: httpx.AsyncClient, now: datetime, errors: list) -> CrawledNews:
         """RSS 아이템 파싱"""
-        title_tag = item.find('title')
-        link_tag = item.find('link')
-        desc_tag = item.find('description')
-        pubdate_tag = item.find('pubDate')
+        title = item.findtext('title', default='').strip()
+        news_url = item.findtext('link', default='').strip()
         
-        if not title_tag or not link_tag:
+        if not title or not news_url:
             return None
         
-        title = title_tag.get_text(strip=True)
-        news_url = link_tag.get_text(strip=True)
-        
         # 설명 (요약)
-        description = desc_tag.get_text(strip=True) if desc_tag else ""
+        description = item.findtext('description', default='').strip()
         
-        # 발행 시간 파싱
-        published_at = datetime.now()
-        if pubdate_tag:
+        # 발행 시간 파싱 (RSS pubDate는 RFC 822 형식)
+        published_at = now
+        pubdate_str = item.findtext('pubDate')
+        if pubdate_str:
             try:
-                pubdate_str = pubdate_tag.get_text(strip=True)
-                published_at = parser.parse(pubdate_str)
+                published_at = parsedate_to_datetime(pubdate_str.strip())
             except:
                 pass
         
         # 상세 페이지에서 본문 가져오기
-        content, image_url = await self._fetch_news_content(news_url, client)
+        try:
+            content, image_url = await self._fetch_news_content(news_url, client)
+        except Exception as e:
+            # 상세 페이지 실패는 요약 로그에 집계하고, 기사는 대체 본문으로 저장
+            errors.append(e)
+            content, image_url = "본문 없음", None
         
         # 본문이 없으면 설명을 사용
         if content == "본문 없음" and description:
             content = description
         
+        # 다른 URL로 재송고된 동일 본문은 스킵
+        if is_duplicate_content(content):
+            return None
+        
         return CrawledNews(
             title=title,
             content=content,
@@ -92,35 +151,9 @@ class EdailyCrawler:
     
     async def _fetch_news_content(self, url: str, client: httpx.AsyncClient) -> tuple[str, str]:
         """뉴스 상세 페이지에서 본문 추출"""
-        try:
-            response = await client.get(url, headers=self.headers)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'lxml')
-            
-            # 본문 추출 시도
-            content_selectors = [
-                '.news_body',
-                '.newsContents',
-                '#newsBody',
-                '.article_body'
-            ]
-            
-            content = None
-            for selector in content_selectors:
-                content_tag = soup.select_one(selector)
-                if content_tag:
-                    content = content_tag.get_text(strip=True)
-                    break
-            
-            if not content:
-                content = "본문 없음"
-            
-            # 이미지 추출
-            image_tag = soup.select_one('.news_photo img, .article_photo img')
-            image_url = image_tag.get('src') if image_tag and image_tag.get('src') else None
-            
-            return content[:5000], image_url
-        except Exception as e:
-            log.error(f"이데일리 본문 가져오기 실패 ({url}): {e}")
-            return "본문 없음", None
+        # 본문은 앞부분만 사용하므로 최대 MAX_BODY_BYTES까지만 수신
+        async with self._sem:
+            body = await fetch_limited(client, url)
+        
+        # 파싱(CPU 작업)은 프로세스 풀에서 실행해 이벤트 루프를 비워 둠
+        return await run_in_parse_pool(_extract_edaily, body)
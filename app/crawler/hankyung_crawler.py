@@ -1,78 +1,134 @@
+import asyncio
 import httpx
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 from datetime import datetime
-from typing import List
+from typing import AsyncIterator, Optional
 from dateutil import parser
 
 from app.models.news import CrawledNews
+from app.utils.http import fetch_limited, get_client
 from app.utils.logger import log
+from app.utils.parse_pool import run_in_parse_pool
+from app.utils.tasks import iter_completed
+from app.utils.url_filter import SEEN_URLS, is_duplicate_content
+
+
+# 본문/이미지 선택자 (기사마다 새로 만들지 않도록 모듈 로드 시 1회 생성)
+# 본문 우선순위: .article-body > #articletxt > [itemprop="articleBody"]
+_CONTENT_SELECTORS = (
+    '.article-body',
+    '#articletxt',
+    '[itemprop="articleBody"]',
+)
+_IMAGE_SELECTOR = 'article img'
+
+# 목록 페이지 기사 링크 선택자
+_LINK_SELECTOR = 'a[href*="/article/"]'
+
+
+def _extract_hankyung(body: bytes, base_url: str) -> tuple[str, Optional[str]]:
+    """한국경제 기사 HTML에서 (본문, 이미지 URL) 추출 (파싱 프로세스 풀에서 실행)"""
+    tree = LexborHTMLParser(body)
+
+    # 본문 추출 (우선순위 순서대로 시도)
+    content_tag = None
+    for selector in _CONTENT_SELECTORS:
+        content_tag = tree.css_first(selector)
+        if content_tag:
+            break
+
+    content = content_tag.text(strip=True) if content_tag else "본문 없음"
+
+    # 이미지 추출
+    image_tag = tree.css_first(_IMAGE_SELECTOR)
+    image_url = None
+    if image_tag and image_tag.attributes.get('src'):
+        image_url = image_tag.attributes['src']
+        # 상대 경로를 절대 경로로 변환
+        if image_url and not image_url.startswith('http'):
+            image_url = base_url + image_url
+
+    return content[:5000], image_url
 
 
 class HankyungCrawler:
     """한국경제 뉴스 크롤러"""
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         self.base_url = "https://www.hankyung.com"
         self.news_list_url = f"{self.base_url}/economy"
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        }
+        # 상세 페이지 동시 요청 수 제한 (대상 서버 부하 방지)
+        self._sem = asyncio.Semaphore(10)
+        # 외부에서 주입한 공유 HTTP 클라이언트 (없으면 get_client() 사용)
+        self._client = client
     
-    async def crawl(self, max_news: int = 50) -> List[CrawledNews]:
+    async def crawl(self, max_news: int = 50) -> AsyncIterator[CrawledNews]:
         """
         한국경제 뉴스 크롤링
         
         Args:
             max_news: 크롤링할 최대 뉴스 개수
             
-        Returns:
-            크롤링한 뉴스 리스트
+        Yields:
+            파싱이 끝난 순서대로 CrawledNews
         """
         log.info(f"한국경제 뉴스 크롤링 시작 (최대 {max_news}개)")
         
+        # 발행 시간을 알 수 없는 기사에 공통으로 쓸 수집 시각 (크롤링 1회당 1번만 계산)
+        now = datetime.now()
+        # 실패 항목 (상세 페이지 실패는 _parse_*에서, 그 외 예외는 iter_completed 결과로 수집)
+        errors = []
+        
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(self.news_list_url, headers=self.headers)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.text, 'lxml')
-                
-                # /article/ 링크를 가진 모든 a 태그 찾기
-                article_links = soup.find_all('a', href=lambda x: x and '/article/' in x)
-                
-                # 중복 URL 제거 (set 사용)
-                seen_urls = set()
-                unique_links = []
-                for link in article_links:
-                    url = link.get('href', '')
-                    if url and url not in seen_urls:
-                        seen_urls.add(url)
+            # 공유 HTTP 클라이언트 (연결 풀/HTTP2 세션 재사용)
+            client = self._client or get_client()
+            response = await client.get(self.news_list_url)
+            response.raise_for_status()
+            
+            # 한국경제는 UTF-8 페이지이므로 bytes를 그대로 Lexbor 파서에 전달
+            tree = LexborHTMLParser(response.content)
+            
+            # /article/ 링크를 가진 모든 a 태그 찾기 (속성 부분 일치 선택자로 파서 안에서 필터링)
+            article_links = tree.css(_LINK_SELECTOR)
+            
+            # 중복 URL 제거 (set 사용) + 이미 저장된 URL 제외
+            seen_urls = set()
+            unique_links = []
+            for link in article_links:
+                url = link.attributes.get('href') or ''
+                if url and url not in seen_urls:
+                    seen_urls.add(url)
+                    absolute_url = url if url.startswith('http') else self.base_url + url
+                    if absolute_url not in SEEN_URLS:
                         unique_links.append(link)
-                
-                log.info(f"한국경제: {len(unique_links)}개의 고유 뉴스 링크 발견")
-                
-                crawled_news = []
-                
-                for link in unique_links[:max_news]:
-                    try:
-                        news = await self._parse_news_link(link, client)
-                        if news:
-                            crawled_news.append(news)
-                    except Exception as e:
-                        log.error(f"뉴스 파싱 실패: {e}")
-                        continue
-                
-                log.info(f"한국경제 뉴스 크롤링 완료: {len(crawled_news)}개")
-                return crawled_news
-                
+            
+            log.info(f"한국경제: {len(unique_links)}개의 고유 뉴스 링크 발견")
+            
+            # 상세 페이지 요청을 동시에 실행 (Semaphore로 동시 요청 수 제한)
+            tasks = [self._parse_news_link(link, client, now, errors) for link in unique_links[:max_news]]
         except Exception as e:
             log.error(f"한국경제 뉴스 크롤링 실패: {e}")
-            return []
+            return
+        
+        count = 0
+        async for result in iter_completed(tasks):
+            # 파싱이 끝난 기사부터 바로 넘겨 전체 목록을 메모리에 모아두지 않음
+            if isinstance(result, Exception):
+                errors.append(result)
+            elif isinstance(result, CrawledNews):
+                count += 1
+                yield result
+        
+        # 실패 항목은 건별로 찍지 않고 한 줄로 요약 (앞 3건만 표시)
+        if errors:
+            log.error(f"뉴스 파싱/본문 수집 실패 {len(errors)}건: {errors[:3]}")
+        
+        log.info(f"한국경제 뉴스 크롤링 완료: {count}개")
     
-    async def _parse_news_link(self, link, client: httpx.AsyncClient) -> CrawledNews:
+    async def _parse_news_link(self, link, client: httpx.AsyncClient, now: datetime, errors: list) -> CrawledNews:
         """개별 뉴스 링크 파싱"""
-        title = link.get_text(strip=True)
-        news_url = link.get('href', '')
+        title = link.text(strip=True)
+        news_url = link.attributes.get('href') or ''
         
         # 제목이 없거나 너무 짧으면 스킵
         if not title or len(title) < 10:
@@ -85,11 +141,20 @@ class HankyungCrawler:
         if not news_url.startswith('http'):
             news_url = self.base_url + news_url
         
-        # 현재 시간으로 설정 (실제로는 기사 페이지에서 파싱 가능)
-        published_at = datetime.now()
+        # 수집 시각으로 설정 (실제로는 기사 페이지에서 파싱 가능)
+        published_at = now
         
         # 본문 가져오기
-        content, image_url = await self._fetch_news_content(news_url, client)
+        try:
+            content, image_url = await self._fetch_news_content(news_url, client)
+        except Exception as e:
+            # 상세 페이지 실패는 요약 로그에 집계하고, 기사는 대체 본문으로 저장
+            errors.append(e)
+            content, image_url = "본문 없음", None
+        
+        # 다른 URL로 재송고된 동일 본문은 스킵
+        if is_duplicate_content(content):
+            return None
         
         return CrawledNews(
             title=title,
@@ -102,32 +167,9 @@ class HankyungCrawler:
     
     async def _fetch_news_content(self, url: str, client: httpx.AsyncClient) -> tuple[str, str]:
         """뉴스 상세 페이지에서 본문과 이미지 추출"""
-        try:
-            response = await client.get(url, headers=self.headers)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'lxml')
-            
-            # 본문 추출 (우선순위: .article-body > #articletxt > [itemprop="articleBody"])
-            content_tag = soup.select_one('.article-body')
-            if not content_tag:
-                content_tag = soup.select_one('#articletxt')
-            if not content_tag:
-                content_tag = soup.select_one('[itemprop="articleBody"]')
-            
-            content = content_tag.get_text(strip=True) if content_tag else "본문 없음"
-            
-            # 이미지 추출
-            image_tag = soup.select_one('article img')
-            image_url = None
-            if image_tag and 'src' in image_tag.attrs:
-                image_url = image_tag['src']
-                # 상대 경로를 절대 경로로 변환
-                if image_url and not image_url.startswith('http'):
-                    image_url = self.base_url + image_url
-            
-            return content[:5000], image_url
-            
-        except Exception as e:
-            log.error(f"한국경제 뉴스 본문 가져오기 실패 ({url}): {e}")
-            return "본문 없음", None
+        # 본문은 앞부분만 사용하므로 최대 MAX_BODY_BYTES까지만 수신
+        async with self._sem:
+            body = await fetch_limited(client, url)
+        
+        # 파싱(CPU 작업)은 프로세스 풀에서 실행해 이벤트 루프를 비워 둠
+        return await run_in_parse_pool(_extract_hankyung, body, self.base_url)
@@ -1,93 +1,190 @@
+import asyncio
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
+from selectolax.lexbor import LexborHTMLParser
 from datetime import datetime
-from typing import List
+from typing import AsyncIterator, Optional
 from dateutil import parser
 import re
 
 from app.models.news import CrawledNews
+from app.utils.http import fetch_limited, get_client
 from app.utils.logger import log
+from app.utils.parse_pool import run_in_parse_pool
+from app.utils.tasks import iter_completed
+from app.utils.url_filter import SEEN_URLS, is_duplicate_content
+
+
+# 목록 제목에 붙은 날짜 패턴 (예: 2026.02.03 18:34)
+_DATE_RE = re.compile(r'\d{4}\.\d{2}\.\d{2}\s+\d{2}:\d{2}')
+_DATE_FORMAT = '%Y.%m.%d %H:%M'
+
+# 본문/이미지/날짜 선택자 (기사마다 새로 만들지 않도록 모듈 로드 시 1회 생성)
+_CONTENT_SELECTORS = (
+    '.article_view',
+    '#articleText',
+    '.article_txt',
+    '.article_body',
+)
+_IMAGE_SELECTOR = '.article_photo img, .art_photo img, img[src*="wimg.herald"]'
+_DATE_SELECTOR = '.article_date, .date, time'
+
+# 목록 페이지는 a 태그만 사용하므로 나머지 서브트리는 만들지 않음
+_LIST_STRAINER = SoupStrainer('a')
+# 기사 링크 선택자 (soupsieve 컴파일은 모듈 로드 시 1회만 수행)
+_LINK_SELECTOR = sv.compile('a[href*="/article/"]')
+
+
+def _extract_herald(body: bytes) -> tuple[str, Optional[str], Optional[datetime]]:
+    """헤럴드경제 기사 HTML에서 (본문, 이미지 URL, 발행 시간) 추출 (파싱 프로세스 풀에서 실행)"""
+    tree = LexborHTMLParser(body)
+
+    # 본문 추출 시도
+    content = None
+    for selector in _CONTENT_SELECTORS:
+        content_tag = tree.css_first(selector)
+        if content_tag:
+            content = content_tag.text(strip=True)
+            break
+
+    if not content:
+        content = "본문 없음"
+
+    # 이미지 추출
+    image_tag = tree.css_first(_IMAGE_SELECTOR)
+    image_url = image_tag.attributes.get('src') if image_tag else None
+
+    # 발행 시간 추출
+    pub_date = None
+    date_tag = tree.css_first(_DATE_SELECTOR)
+    if date_tag:
+        try:
+            date_str = date_tag.text(strip=True)
+            # "2025.11.18 09:35" 형식은 고정 포맷으로 바로 파싱, 그 외 형식만 범용 파서 사용
+            match = _DATE_RE.search(date_str)
+            if match:
+                pub_date = datetime.strptime(' '.join(match.group().split()), _DATE_FORMAT)
+            else:
+                pub_date = parser.parse(date_str.replace('.', '-'))
+        except:
+            pass
+
+    return content[:5000], image_url, pub_date
 
 
 class HeraldCrawler:
     """헤럴드경제 뉴스 크롤러"""
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         self.base_url = "https://biz.heraldcorp.com"
         # 경제 뉴스 페이지
         self.news_list_url = f"{self.base_url}/economy"
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        }
+        # 상세 페이지 동시 요청 수 제한 (대상 서버 부하 방지)
+        self._sem = asyncio.Semaphore(10)
+        # 외부에서 주입한 공유 HTTP 클라이언트 (없으면 get_client() 사용)
+        self._client = client
     
-    async def crawl(self, max_news: int = 50) -> List[CrawledNews]:
+    async def crawl(self, max_news: int = 50) -> AsyncIterator[CrawledNews]:
         """헤럴드경제 뉴스 크롤링"""
         log.info(f"헤럴드경제 뉴스 크롤링 시작 (최대 {max_news}개)")
         
+        # 발행 시간을 알 수 없는 기사에 공통으로 쓸 수집 시각 (크롤링 1회당 1번만 계산)
+        now = datetime.now()
+        # 실패 항목 (상세 페이지 실패는 _parse_*에서, 그 외 예외는 iter_completed 결과로 수집)
+        errors = []
+        
         try:
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                response = await client.get(self.news_list_url, headers=self.headers)
-                response.raise_for_status()
+            # 공유 HTTP 클라이언트 (연결 풀/HTTP2 세션 재사용)
+            client = self._client or get_client()
+            response = await client.get(self.news_list_url)
+            response.raise_for_status()
+            
+            # 디코딩은 파서에 맡김 (Content-Type charset 우선, 없으면 <meta charset>)
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=_LIST_STRAINER,
+                                 from_encoding=response.charset_encoding)
+            
+            # 뉴스 링크 찾기 (article 페이지만)
+            all_links = _LINK_SELECTOR.select(soup)
+            
+            # 1단계: 목록에서 (제목, URL) 후보를 최대 max_news개 수집
+            candidates = []
+            seen_urls = set()
+            
+            for link in all_links:
+                if len(candidates) >= max_news:
+                    break
+                
+                href = link.get('href', '')
+                if not href or href in seen_urls:
+                    continue
+                
+                # 절대 URL로 변환
+                if href.startswith('/'):
+                    href = self.base_url + href
+                elif not href.startswith('http'):
+                    continue
                 
-                soup = BeautifulSoup(response.text, 'lxml')
+                seen_urls.add(href)
                 
-                # 뉴스 링크 찾기 (article 페이지만)
-                all_links = soup.select('a[href*="/article/"]')
+                # 이미 저장된 URL은 상세 페이지 요청 없이 건너뜀
+                if href in SEEN_URLS:
+                    continue
                 
-                crawled_news = []
-                seen_urls = set()
+                # 텍스트 자식이 하나뿐이면 바로 사용, 아니면 하위 텍스트 전체를 모음
+                title = (link.string or '').strip() or link.get_text(strip=True)
                 
-                for link in all_links:
-                    if len(crawled_news) >= max_news:
-                        break
-                    
-                    try:
-                        href = link.get('href', '')
-                        if not href or href in seen_urls:
-                            continue
-                        
-                        # 절대 URL로 변환
-                        if href.startswith('/'):
-                            href = self.base_url + href
-                        elif not href.startswith('http'):
-                            continue
-                        
-                        seen_urls.add(href)
-                        
-                        title = link.get_text(strip=True)
-                        
-                        # 제목에서 날짜 패턴 제거 (예: 2026.02.03 18:34)
-                        title = re.sub(r'\d{4}\.\d{2}\.\d{2}\s+\d{2}:\d{2}', '', title).strip()
-                        
-                        # 제목이 너무 길면 500자로 자르기
-                        if len(title) > 500:
-                            title = title[:500]
-                        
-                        if not title or len(title) < 10:
-                            continue
-                        
-                        news = await self._parse_news_url(title, href, client)
-                        if news:
-                            crawled_news.append(news)
-                    except Exception as e:
-                        log.error(f"뉴스 파싱 실패: {e}")
-                        continue
+                # 제목에서 날짜 패턴 제거 (예: 2026.02.03 18:34)
+                title = _DATE_RE.sub('', title).strip()
                 
-                log.info(f"헤럴드경제 뉴스 크롤링 완료: {len(crawled_news)}개")
-                return crawled_news
+                # 제목이 너무 길면 500자로 자르기
+                if len(title) > 500:
+                    title = title[:500]
                 
+                if not title or len(title) < 10:
+                    continue
+                
+                candidates.append((title, href))
+            
+            # 2단계: 상세 페이지 요청을 동시에 실행 (Semaphore로 동시 요청 수 제한)
+            tasks = [self._parse_news_url(title, href, client, now, errors) for title, href in candidates]
         except Exception as e:
             log.error(f"헤럴드경제 뉴스 크롤링 실패: {e}")
-            return []
+            return
+        
+        count = 0
+        async for result in iter_completed(tasks):
+            # 파싱이 끝난 기사부터 바로 넘겨 전체 목록을 메모리에 모아두지 않음
+            if isinstance(result, Exception):
+                errors.append(result)
+            elif isinstance(result, CrawledNews):
+                count += 1
+                yield result
+        
+        # 실패 항목은 건별로 찍지 않고 한 줄로 요약 (앞 3건만 표시)
+        if errors:
+            log.error(f"뉴스 파싱/본문 수집 실패 {len(errors)}건: {errors[:3]}")
+        
+        log.info(f"헤럴드경제 뉴스 크롤링 완료: {count}개")
     
-    async def _parse_news_url(self, title: str, url: str, client: httpx.AsyncClient) -> CrawledNews:
+    async def _parse_news_url(self, title: str, url: str, client: httpx.AsyncClient,
+                              now: datetime, errors: list) -> CrawledNews:
         """뉴스 URL에서 상세 정보 추출"""
-        published_at = datetime.now()
-        content, image_url, pub_date = await self._fetch_news_content(url, client)
+        published_at = now
+        try:
+            content, image_url, pub_date = await self._fetch_news_content(url, client)
+        except Exception as e:
+            # 상세 페이지 실패는 요약 로그에 집계하고, 기사는 대체 본문으로 저장
+            errors.append(e)
+            content, image_url, pub_date = "본문 없음", None, None
         
         if pub_date:
             published_at = pub_date
         
+        # 다른 URL로 재송고된 동일 본문은 스킵
+        if is_duplicate_content(content):
+            return None
+        
         return CrawledNews(
             title=title,
             content=content,
@@ -99,46 +196,9 @@ class HeraldCrawler:
     
     async def _fetch_news_content(self, url: str, client: httpx.AsyncClient) -> tuple[str, str, datetime]:
         """뉴스 상세 페이지에서 본문 추출"""
-        try:
-            response = await client.get(url, headers=self.headers)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'lxml')
-            
-            # 본문 추출 시도
-            content_selectors = [
-                '.article_view',
-                '#articleText',
-                '.article_txt',
-                '.article_body'
-            ]
-            
-            content = None
-            for selector in content_selectors:
-                content_tag = soup.select_one(selector)
-                if content_tag:
-                    content = content_tag.get_text(strip=True)
-                    break
-            
-            if not content:
-                content = "본문 없음"
-            
-            # 이미지 추출
-            image_tag = soup.select_one('.article_photo img, .art_photo img, img[src*="wimg.herald"]')
-            image_url = image_tag.get('src') if image_tag and image_tag.get('src') else None
-            
-            # 발행 시간 추출
-            pub_date = None
-            date_tag = soup.select_one('.article_date, .date, time')
-            if date_tag:
-                try:
-                    date_str = date_tag.get_text(strip=True)
-                    # "2025.11.18 09:35" 형식 파싱
-                    pub_date = parser.parse(date_str.replace('.', '-'))
-                except:
-                    pass
-            
-            return content[:5000], image_url, pub_date
-        except Exception as e:
-            log.error(f"헤럴드경제 본문 가져오기 실패 ({url}): {e}")
-            return "본문 없음", None, None
+        # 본문은 앞부분만 사용하므로 최대 MAX_BODY_BYTES까지만 수신
+        async with self._sem:
+            body = await fetch_limited(client, url)
+        
+        # 파싱(CPU 작업)은 프로세스 풀에서 실행해 이벤트 루프를 비워 둠
+        return await run_in_parse_pool(_extract_herald, body)
@@ -1,85 +1,175 @@
+import asyncio
+import io
+import itertools
 import httpx
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lh
+from lxml.cssselect import CSSSelector
 from datetime import datetime
-from typing import List
-from dateutil import parser
+from typing import AsyncIterator, Optional
+from email.utils import parsedate_to_datetime
 
 from app.models.news import CrawledNews
+from app.utils.html_text import node_text
+from app.utils.http import fetch_limited_with_charset, get_client
 from app.utils.logger import log
+from app.utils.parse_pool import run_in_parse_pool
+from app.utils.tasks import iter_completed
+from app.utils.url_filter import SEEN_URLS, is_duplicate_content
+
+
+# 본문/이미지 선택자 (CSS → XPath 변환은 모듈 로드 시 1회만 수행)
+_CONTENT_SELECTORS = tuple(CSSSelector(selector) for selector in (
+    '.news_cnt_detail_wrap',
+    '.art_txt',
+    '#article-view-content-div',
+    '.news_content',
+))
+_IMAGE_SELECTOR = CSSSelector('.thumb_area img, .view_img img, .news_photo img')
+
+# RSS description이 이 길이 이상이면 본문으로 충분하다고 보고 상세 페이지 요청 생략
+_DESCRIPTION_MIN_CHARS = 400
+
+
+def _extract_mk(body: bytes, encoding: Optional[str]) -> tuple[str, Optional[str]]:
+    """매일경제 기사 HTML에서 (본문, 이미지 URL) 추출 (파싱 프로세스 풀에서 실행)"""
+    # 디코딩은 lxml에 맡김 (Content-Type charset 우선, 없으면 <meta charset>)
+    tree = lh.fromstring(body, parser=lh.HTMLParser(encoding=encoding))
+
+    # 본문 추출 시도
+    content = None
+    for selector in _CONTENT_SELECTORS:
+        nodes = selector(tree)
+        if nodes:
+            # script/style 제외 + 공백 정규화 후 5000자 제한
+            content = node_text(nodes[0])
+            break
+
+    if not content:
+        content = "본문 없음"
+
+    # 이미지 추출
+    image_tags = _IMAGE_SELECTOR(tree)
+    image_url = image_tags[0].get('src') if image_tags else None
+
+    return content[:5000], image_url
+
+
+def _iter_rss_items(content: bytes):
+    """
+    RSS를 스트리밍 파싱해 item을 dict로 하나씩 반환
+
+    전체 DOM을 만들지 않고, 처리한 item 요소는 바로 비워서 메모리를 일정하게 유지한다.
+    호출 측이 필요한 개수만 꺼내면 나머지 피드는 파싱하지 않는다.
+    """
+    context = etree.iterparse(io.BytesIO(content), events=('end',), tag='item', recover=True)
+    for _, elem in context:
+        item = {
+            'title': (elem.findtext('title') or '').strip(),
+            'link': (elem.findtext('link') or '').strip(),
+            'description': (elem.findtext('description') or '').strip(),
+            'pubDate': (elem.findtext('pubDate') or '').strip(),
+        }
+        # 처리한 요소와 앞선 형제 요소 해제
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+        yield item
 
 
 class MKCrawler:
     """매일경제 뉴스 크롤러 (RSS 기반)"""
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         self.base_url = "https://www.mk.co.kr"
         # RSS 피드 URL (증권 뉴스)
         self.rss_url = "https://www.mk.co.kr/rss/50200011/"
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        }
+        # 상세 페이지 동시 요청 수 제한 (대상 서버 부하 방지)
+        self._sem = asyncio.Semaphore(10)
+        # 외부에서 주입한 공유 HTTP 클라이언트 (없으면 get_client() 사용)
+        self._client = client
     
-    async def crawl(self, max_news: int = 50) -> List[CrawledNews]:
+    async def crawl(self, max_news: int = 50) -> AsyncIterator[CrawledNews]:
         """매일경제 RSS 피드 크롤링"""
         log.info(f"매일경제 뉴스 크롤링 시작 (최대 {max_news}개)")
         
+        # 발행 시간을 알 수 없는 기사에 공통으로 쓸 수집 시각 (크롤링 1회당 1번만 계산)
+        now = datetime.now()
+        # 실패 항목 (상세 페이지 실패는 _parse_*에서, 그 외 예외는 iter_completed 결과로 수집)
+        errors = []
+        
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(self.rss_url, headers=self.headers)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.text, 'xml')
-                items = soup.find_all('item')
-                
-                crawled_news = []
-                
-                for item in items[:max_news]:
-                    try:
-                        news = await self._parse_rss_item(item, client)
-                        if news:
-                            crawled_news.append(news)
-                    except Exception as e:
-                        log.error(f"뉴스 파싱 실패: {e}")
-                        continue
-                
-                log.info(f"매일경제 뉴스 크롤링 완료: {len(crawled_news)}개")
-                return crawled_news
-                
+            # 공유 HTTP 클라이언트 (연결 풀/HTTP2 세션 재사용)
+            client = self._client or get_client()
+            response = await client.get(self.rss_url)
+            response.raise_for_status()
+            
+            # RSS 스트리밍 파싱 (디코딩은 XML 선언의 encoding을 따름)
+            # 이미 저장된 URL은 먼저 거른 뒤 max_news개를 채움 (저장된 기사가 개수를 차지하지 않도록)
+            items = itertools.islice(
+                (item for item in _iter_rss_items(response.content) if item['link'] not in SEEN_URLS),
+                max_news,
+            )
+            
+            # 상세 페이지 요청을 동시에 실행 (Semaphore로 동시 요청 수 제한)
+            tasks = [self._parse_rss_item(item, client, now, errors) for item in items]
         except Exception as e:
             log.error(f"매일경제 뉴스 크롤링 실패: {e}")
-            return []
+            return
+        
+        count = 0
+        async for result in iter_completed(tasks):
+            # 파싱이 끝난 기사부터 바로 넘겨 전체 목록을 메모리에 모아두지 않음
+            if isinstance(result, Exception):
+                errors.append(result)
+            elif isinstance(result, CrawledNews):
+                count += 1
+                yield result
+        
+        # 실패 항목은 건별로 찍지 않고 한 줄로 요약 (앞 3건만 표시)
+        if errors:
+            log.error(f"뉴스 파싱/본문 수집 실패 {len(errors)}건: {errors[:3]}")
+        
+        log.info(f"매일경제 뉴스 크롤링 완료: {count}개")
     
-    async def _parse_rss_item(self, item, client: httpx.AsyncClient) -> CrawledNews:
+    async def _parse_rss_item(self, item: dict, client: httpx.AsyncClient, now: datetime, errors: list) -> CrawledNews:
         """RSS 아이템 파싱"""
-        title_tag = item.find('title')
-        link_tag = item.find('link')
-        desc_tag = item.find('description')
-        pubdate_tag = item.find('pubDate')
+        title = item['title']
+        news_url = item['link']
         
-        if not title_tag or not link_tag:
+        if not title or not news_url:
             return None
         
-        title = title_tag.get_text(strip=True)
-        news_url = link_tag.get_text(strip=True)
-        
         # 설명 (요약)을 임시 본문으로 사용
-        description = desc_tag.get_text(strip=True) if desc_tag else ""
+        description = item['description']
         
-        # 발행 시간 파싱
-        published_at = datetime.now()
-        if pubdate_tag:
+        # 발행 시간 파싱 (RSS pubDate는 RFC 822 형식)
+        published_at = now
+        if item['pubDate']:
             try:
-                pubdate_str = pubdate_tag.get_text(strip=True)
-                published_at = parser.parse(pubdate_str)
+                published_at = parsedate_to_datetime(item['pubDate'])
             except:
                 pass
         
-        # 상세 페이지에서 본문 가져오기
-        content, image_url = await self._fetch_news_content(news_url, client)
+        if len(description) >= _DESCRIPTION_MIN_CHARS:
+            # 설명이 충분히 길면 상세 페이지 요청 없이 본문으로 사용
+            content, image_url = description[:5000], None
+        else:
+            # 상세 페이지에서 본문 가져오기
+            try:
+                content, image_url = await self._fetch_news_content(news_url, client)
+            except Exception as e:
+                # 상세 페이지 실패는 요약 로그에 집계하고, 기사는 대체 본문으로 저장
+                errors.append(e)
+                content, image_url = "본문 없음", None
+            
+            # 본문이 없으면 설명을 사용
+            if content == "본문 없음" and description:
+                content = description
         
-        # 본문이 없으면 설명을 사용
-        if content == "본문 없음" and description:
-            content = description
+        # 다른 URL로 재송고된 동일 본문은 스킵
+        if is_duplicate_content(content):
+            return None
         
         return CrawledNews(
             title=title,
@@ -92,35 +182,9 @@ class MKCrawler:
     
     async def _fetch_news_content(self, url: str, client: httpx.AsyncClient) -> tuple[str, str]:
         """뉴스 상세 페이지에서 본문 추출"""
-        try:
-            response = await client.get(url, headers=self.headers)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'lxml')
-            
-            # 본문 추출 시도
-            content_selectors = [
-                '.news_cnt_detail_wrap',
-                '.art_txt',
-                '#article-view-content-div',
-                '.news_content'
-            ]
-            
-            content = None
-            for selector in content_selectors:
-                content_tag = soup.select_one(selector)
-                if content_tag:
-                    content = content_tag.get_text(strip=True)
-                    break
-            
-            if not content:
-                content = "본문 없음"
-            
-            # 이미지 추출
-            image_tag = soup.select_one('.thumb_area img, .view_img img, .news_photo img')
-            image_url = image_tag.get('src') if image_tag and image_tag.get('src') else None
-            
-            return content[:5000], image_url
-        except Exception as e:
-            log.error(f"매일경제 본문 가져오기 실패 ({url}): {e}")
-            return "본문 없음", None
+        # 본문을 스트리밍으로 최대 MAX_BODY_BYTES까지만 수신 (str 디코딩 없이 bytes + charset)
+        async with self._sem:
+            body, charset = await fetch_limited_with_charset(client, url)
+        
+        # 파싱(CPU 작업)은 프로세스 풀에서 실행해 이벤트 루프를 비워 둠
+        return await run_in_parse_pool(_extract_mk, body, charset)
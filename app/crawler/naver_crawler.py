@@ -1,96 +1,160 @@
+import asyncio
 import httpx
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lh
+from lxml.cssselect import CSSSelector
 from datetime import datetime
-from typing import List
+from typing import AsyncIterator, Optional
 from dateutil import parser
 
 from app.models.news import CrawledNews
+from app.utils.html_text import node_text
+from app.utils.http import fetch_limited_with_charset, get_client
 from app.utils.logger import log
+from app.utils.parse_pool import run_in_parse_pool
+from app.utils.tasks import iter_completed
+from app.utils.url_filter import SEEN_URLS, is_duplicate_content
+
+
+# 목록 페이지 XPath (선택자 컴파일은 모듈 로드 시 1회만 수행)
+# - 기사 링크: .articleSubject 바로 아래 첫 번째 a
+# - 날짜: 기사 항목(dl) 안의 .date
+_LIST_XPATH = etree.XPath('//*[contains(concat(" ", normalize-space(@class), " "), " articleSubject ")]/a[1]')
+_DATE_XPATH = etree.XPath('descendant::*[contains(concat(" ", normalize-space(@class), " "), " date ")][1]')
+
+# 목록 날짜 고정 포맷 (예: 2026.02.03 14:30)
+_DATE_FORMAT = '%Y.%m.%d %H:%M'
+
+# 상세 페이지 본문/이미지 선택자 (CSS → XPath 변환은 모듈 로드 시 1회만 수행)
+_CONTENT_SELECTOR = CSSSelector('#newsct_article, .news_end')
+_IMAGE_SELECTOR = CSSSelector('.end_photo_org img, .img_desc img')
+
+
+def _extract_naver(body: bytes, encoding: Optional[str]) -> tuple[str, Optional[str]]:
+    """네이버 금융 기사 HTML에서 (본문, 이미지 URL) 추출 (파싱 프로세스 풀에서 실행)"""
+    # 디코딩은 lxml에 맡김 (Content-Type charset 우선, 없으면 <meta charset>)
+    tree = lh.fromstring(body, parser=lh.HTMLParser(encoding=encoding))
+
+    # 본문 추출
+    content_tags = _CONTENT_SELECTOR(tree)
+    # script/style 제외 + 공백 정규화 후 5000자 제한
+    content = (node_text(content_tags[0]) if content_tags else "") or "본문 없음"
+
+    # 이미지 추출
+    image_tags = _IMAGE_SELECTOR(tree)
+    image_url = image_tags[0].get('src') if image_tags else None
+
+    return content[:5000], image_url  # 본문 최대 5000자
 
 
 class NaverFinanceCrawler:
     """네이버 금융 뉴스 크롤러"""
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         self.base_url = "https://finance.naver.com"
         self.news_list_url = f"{self.base_url}/news/news_list.naver?mode=LSS2D&section_id=101&section_id2=258"
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        }
+        # 상세 페이지 동시 요청 수 제한 (대상 서버 부하 방지)
+        self._sem = asyncio.Semaphore(10)
+        # 외부에서 주입한 공유 HTTP 클라이언트 (없으면 get_client() 사용)
+        self._client = client
     
-    async def crawl(self, max_news: int = 50) -> List[CrawledNews]:
+    async def crawl(self, max_news: int = 50) -> AsyncIterator[CrawledNews]:
         """
         네이버 금융 뉴스 크롤링
         
         Args:
             max_news: 크롤링할 최대 뉴스 개수
             
-        Returns:
-            크롤링한 뉴스 리스트
+        Yields:
+            파싱이 끝난 순서대로 CrawledNews
         """
         log.info(f"네이버 금융 뉴스 크롤링 시작 (최대 {max_news}개)")
         
+        # 발행 시간을 알 수 없는 기사에 공통으로 쓸 수집 시각 (크롤링 1회당 1번만 계산)
+        now = datetime.now()
+        # 실패 항목 (상세 페이지 실패는 _parse_*에서, 그 외 예외는 iter_completed 결과로 수집)
+        errors = []
+        
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                # 뉴스 목록 페이지 가져오기
-                response = await client.get(self.news_list_url, headers=self.headers)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.text, 'lxml')
-                # 수정: .articleSubject를 직접 선택
-                news_items = soup.select('.articleSubject')
-                
-                crawled_news = []
-                
-                for item in news_items[:max_news]:
-                    try:
-                        news = await self._parse_news_item(item, client)
-                        if news:
-                            crawled_news.append(news)
-                    except Exception as e:
-                        log.error(f"뉴스 파싱 실패: {e}")
-                        continue
-                
-                log.info(f"네이버 금융 뉴스 크롤링 완료: {len(crawled_news)}개")
-                return crawled_news
-                
+            # 공유 HTTP 클라이언트 (연결 풀/HTTP2 세션 재사용)
+            client = self._client or get_client()
+            # 뉴스 목록 페이지 가져오기
+            response = await client.get(self.news_list_url)
+            response.raise_for_status()
+            
+            # 디코딩은 lxml에 맡김 (Content-Type charset 우선, 없으면 <meta charset>)
+            tree = lh.fromstring(response.content, parser=lh.HTMLParser(encoding=response.charset_encoding))
+            # .articleSubject 아래 기사 링크(a)를 컴파일된 XPath로 직접 선택
+            # 이미 저장된 URL은 먼저 거른 뒤 max_news개를 채움 (저장된 기사가 개수를 차지하지 않도록)
+            anchors = [
+                anchor for anchor in _LIST_XPATH(tree)
+                if self._news_url(anchor) not in SEEN_URLS
+            ][:max_news]
+            
+            # 상세 페이지 요청을 동시에 실행 (Semaphore로 동시 요청 수 제한)
+            tasks = [self._parse_news_item(anchor, client, now, errors) for anchor in anchors]
         except Exception as e:
             log.error(f"네이버 금융 뉴스 크롤링 실패: {e}")
-            return []
+            return
+        
+        count = 0
+        async for result in iter_completed(tasks):
+            # 파싱이 끝난 기사부터 바로 넘겨 전체 목록을 메모리에 모아두지 않음
+            if isinstance(result, Exception):
+                errors.append(result)
+            elif isinstance(result, CrawledNews):
+                count += 1
+                yield result
+        
+        # 실패 항목은 건별로 찍지 않고 한 줄로 요약 (앞 3건만 표시)
+        if errors:
+            log.error(f"뉴스 파싱/본문 수집 실패 {len(errors)}건: {errors[:3]}")
+        
+        log.info(f"네이버 금융 뉴스 크롤링 완료: {count}개")
+    
+    def _news_url(self, anchor) -> str:
+        """기사 링크 요소의 href를 절대 URL로 변환 (href가 없으면 빈 문자열)"""
+        news_url = anchor.get('href', '')
+        if news_url and not news_url.startswith('http'):
+            news_url = self.base_url + news_url
+        return news_url
     
-    async def _parse_news_item(self, item, client: httpx.AsyncClient) -> CrawledNews:
+    async def _parse_news_item(self, anchor, client: httpx.AsyncClient, now: datetime, errors: list) -> CrawledNews:
         """
         개별 뉴스 아이템 파싱
         
         Args:
-            item: BeautifulSoup 뉴스 아이템 (dt.articleSubject)
+            anchor: 기사 링크 요소 (.articleSubject > a, lxml)
             client: HTTP 클라이언트
+            now: 날짜 파싱 실패 시 사용할 수집 시각
+            errors: 상세 페이지 실패를 모아 crawl() 요약 로그에 쓸 리스트
             
         Returns:
             파싱된 뉴스 데이터
         """
-        # 제목과 URL 추출 (item이 이미 .articleSubject이므로 a 태그만 찾기)
-        title_tag = item.select_one('a')
-        if not title_tag:
-            return None
-        
-        title = title_tag.get_text(strip=True)
-        news_url = title_tag.get('href', '')
+        # 제목과 URL 추출 (a의 직접 텍스트 우선, 비어 있으면 하위 텍스트 전체)
+        title = (anchor.text or '').strip() or anchor.text_content().strip()
+        news_url = self._news_url(anchor)
         
         if not news_url:
             return None
         
-        # 상대 URL을 절대 URL로 변환
-        if not news_url.startswith('http'):
-            news_url = self.base_url + news_url
-        
-        # 날짜 추출 (부모 요소에서 찾기)
-        parent = item.parent
-        date_tag = parent.select_one('.date') if parent else None
-        published_at = self._parse_date(date_tag.get_text(strip=True) if date_tag else None)
+        # 날짜 추출 (a → .articleSubject → 기사 항목(dl)에서 찾기)
+        item = anchor.getparent().getparent()
+        date_tags = _DATE_XPATH(item) if item is not None else []
+        published_at = self._parse_date((date_tags[0].text or '').strip() if date_tags else None, now)
         
         # 뉴스 상세 페이지에서 본문 가져오기
-        content, image_url = await self._fetch_news_content(news_url, client)
+        try:
+            content, image_url = await self._fetch_news_content(news_url, client)
+        except Exception as e:
+            # 상세 페이지 실패는 요약 로그에 집계하고, 기사는 대체 본문으로 저장
+            errors.append(e)
+            content, image_url = "본문 없음", None
+        
+        # 다른 URL로 재송고된 동일 본문은 스킵
+        if is_duplicate_content(content):
+            return None
         
         return CrawledNews(
             title=title,
@@ -112,39 +176,32 @@ class NaverFinanceCrawler:
         Returns:
             (본문, 이미지 URL)
         """
-        try:
-            response = await client.get(url, headers=self.headers)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'lxml')
-            
-            # 본문 추출
-            content_tag = soup.select_one('#newsct_article, .news_end')
-            content = content_tag.get_text(strip=True) if content_tag else "본문 없음"
-            
-            # 이미지 추출
-            image_tag = soup.select_one('.end_photo_org img, .img_desc img')
-            image_url = image_tag['src'] if image_tag and 'src' in image_tag.attrs else None
-            
-            return content[:5000], image_url  # 본문 최대 5000자
-            
-        except Exception as e:
-            log.error(f"뉴스 본문 가져오기 실패 ({url}): {e}")
-            return "본문 없음", None
+        # 본문을 스트리밍으로 최대 MAX_BODY_BYTES까지만 수신 (str 디코딩 없이 bytes + charset)
+        async with self._sem:
+            body, charset = await fetch_limited_with_charset(client, url)
+        
+        # 파싱(CPU 작업)은 프로세스 풀에서 실행해 이벤트 루프를 비워 둠
+        return await run_in_parse_pool(_extract_naver, body, charset)
     
-    def _parse_date(self, date_str: str) -> datetime:
+    def _parse_date(self, date_str: str, now: datetime) -> datetime:
         """
         날짜 문자열을 datetime으로 변환
         
         Args:
             date_str: 날짜 문자열 (예: "2026.02.03 14:30")
+            now: 파싱 실패 시 사용할 수집 시각
             
         Returns:
             datetime 객체
         """
         try:
-            # "2026.02.03 14:30" 형식 파싱
+            # "2026.02.03 14:30" 형식은 고정 포맷으로 바로 파싱
+            return datetime.strptime(date_str.strip(), _DATE_FORMAT)
+        except (TypeError, ValueError):
+            pass
+        try:
+            # 그 외 형식은 범용 파서로 재시도
             return parser.parse(date_str.replace('.', '-'))
         except:
-            # 파싱 실패 시 현재 시간
-            return datetime.now()
+            # 파싱 실패 시 수집 시각
+            return now
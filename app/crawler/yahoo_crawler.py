@@ -1,186 +1,240 @@
 """
-Yahoo Finance 뉴스 크롤러 (Selenium 기반)
+Yahoo Finance 뉴스 크롤러 (httpx + HTML 내장 JSON 기반)
 
 작성자: charlie0701
 작성일: 2026-02-03
 """
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from datetime import datetime
-from typing import List
 import asyncio
+import httpx
+import json
+from selectolax.lexbor import LexborHTMLParser
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
 import re
 
 from app.models.news import CrawledNews
+from app.utils.http import fetch_limited, get_client
 from app.utils.logger import log
+from app.utils.parse_pool import run_in_parse_pool
+from app.utils.tasks import iter_completed
+from app.utils.url_filter import SEEN_URLS, is_duplicate_content
+
+
+# 제목 공백 정규화 패턴
+_WS_RE = re.compile(r'\s+')
+
+# 목록 페이지 기사 링크 선택자 (h3/stream-item 링크도 모두 /news/ 경로이므로 하나로 충분)
+_LINK_SELECTOR = 'a[href*="/news/"]'
+
+# 내장 JSON이 없는 페이지용 본문/이미지 선택자
+_CONTENT_SELECTORS = (
+    '.caas-body',
+    'article[class*="body"]',
+    '.article-wrap',
+    'article',
+)
+_IMAGE_SELECTOR = '.caas-img img, article img, img[class*="featured"]'
+
+# Yahoo 상세 페이지 최대 수신 크기
+# __NEXT_DATA__ JSON은 페이지 맨 끝에 있고 큰 페이지는 수 MB이므로,
+# 공용 MAX_BODY_BYTES(512KB)로 자르면 JSON이 잘려 파싱에 실패함
+YAHOO_MAX_BODY_BYTES = 8 * 1024 * 1024
+
+
+def _find_article(data) -> Optional[dict]:
+    """내장 JSON에서 기사 본문(body/articleBody)을 가진 첫 번째 객체 탐색"""
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if isinstance(node.get('body') or node.get('articleBody'), str):
+                return node
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+    return None
+
+
+def _image_from(value) -> Optional[str]:
+    """JSON image 필드(str / {"url": ...} / 리스트)에서 URL 추출"""
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, dict):
+        value = value.get('url') or value.get('originalUrl')
+    return value if isinstance(value, str) else None
+
+
+def _extract_yahoo(body: bytes) -> tuple[str, Optional[str], Optional[datetime], Optional[str]]:
+    """
+    Yahoo Finance 기사 HTML에서 (본문, 이미지 URL, 발행 시간, JSON 파싱 오류) 추출
+    (파싱 프로세스 풀에서 실행)
+
+    로그는 부모 프로세스에서 남기도록 __NEXT_DATA__ 파싱 오류는 메시지로 반환 (없으면 None)
+    """
+    tree = LexborHTMLParser(body)
+
+    content = ""
+    image_url = None
+    pub_date = None
+
+    # 1순위: 페이지에 내장된 __NEXT_DATA__ JSON (본문/이미지가 구조화되어 있음)
+    script = tree.css_first('script#__NEXT_DATA__')
+    article = None
+    json_error = None
+    if script:
+        try:
+            article = _find_article(json.loads(script.text()))
+        except ValueError as e:
+            json_error = f"__NEXT_DATA__ JSON 파싱 실패: {e}"
+
+    if article:
+        # 본문은 HTML 조각이므로 태그 제거
+        raw_body = article.get('body') or article.get('articleBody')
+        content = LexborHTMLParser(raw_body).text(separator=' ', strip=True)
+        image_url = _image_from(article.get('image') or article.get('thumbnail'))
+        published = article.get('datePublished') or article.get('pubDate')
+        if isinstance(published, str):
+            try:
+                pub_date = datetime.fromisoformat(published)
+            except ValueError:
+                pub_date = None
+
+    # 2순위: 내장 JSON이 없거나 본문이 비어 있으면 CSS 선택자로 추출
+    if not content:
+        for selector in _CONTENT_SELECTORS:
+            content_tag = tree.css_first(selector)
+            if content_tag:
+                content = content_tag.text(separator=' ', strip=True)
+                if content:
+                    break
+
+    if not image_url:
+        image_tag = tree.css_first(_IMAGE_SELECTOR)
+        image_url = image_tag.attributes.get('src') if image_tag else None
+
+    return content[:5000] if content else "Content not available", image_url, pub_date, json_error
 
 
 class YahooCrawler:
-    """Yahoo Finance 뉴스 크롤러 (Selenium 기반)"""
+    """Yahoo Finance 뉴스 크롤러 (httpx + HTML 내장 JSON 기반)"""
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         self.base_url = "https://finance.yahoo.com"
         self.news_list_url = f"{self.base_url}/topic/stock-market-news"
+        # 상세 페이지 동시 요청 수 제한 (대상 서버 부하 방지)
+        self._sem = asyncio.Semaphore(10)
+        # 외부에서 주입한 공유 HTTP 클라이언트 (없으면 get_client() 사용)
+        self._client = client
     
-    def _create_driver(self):
-        """Chrome 드라이버 생성"""
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')  # 백그라운드 실행
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36')
-        
-        # 자동으로 ChromeDriver 다운로드 및 설치
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        driver.set_page_load_timeout(30)
-        
-        return driver
-    
-    async def crawl(self, max_news: int = 50) -> List[CrawledNews]:
-        """Yahoo Finance 뉴스 크롤링 (Selenium 사용)"""
+    async def crawl(self, max_news: int = 50) -> AsyncIterator[CrawledNews]:
+        """Yahoo Finance 뉴스 크롤링"""
         log.info(f"Yahoo Finance 뉴스 크롤링 시작 (최대 {max_news}개)")
         
-        crawled_news = []
-        driver = None
+        # 발행 시간을 알 수 없는 기사에 공통으로 쓸 수집 시각 (크롤링 1회당 1번만 계산)
+        now = datetime.now()
+        # 실패 항목 (상세 페이지 실패는 _parse_*에서, 그 외 예외는 iter_completed 결과로 수집)
+        errors = []
         
         try:
-            # 중요:
-            # macOS 환경에서 thread worker 안에서 subprocess(fork)가 발생하면
-            # Selenium/ChromeDriver 시작 시 간헐적인 SIGSEGV가 발생할 수 있다.
-            # (crashed on child side of fork pre-exec)
-            #
-            # 따라서 driver 생성은 메인 실행 흐름에서 동기 호출로 처리한다.
-            driver = self._create_driver()
-            
-            # 뉴스 리스트 페이지 로드
-            driver.get(self.news_list_url)
-            await asyncio.sleep(2)  # JavaScript 렌더링 대기
+            # 공유 HTTP 클라이언트 (연결 풀/HTTP2 세션 재사용)
+            client = self._client or get_client()
+            response = await client.get(self.news_list_url)
+            response.raise_for_status()
             
             # 뉴스 링크 추출
-            news_links = self._extract_news_links(driver)
+            news_links = self._extract_news_links(response.content)
             log.info(f"Yahoo Finance 뉴스 링크 {len(news_links)}개 발견")
             
-            # 각 뉴스 기사 크롤링
-            for link_info in news_links[:max_news]:
-                try:
-                    news = await self._fetch_news_content(driver, link_info['url'], link_info['title'])
-                    if news:
-                        crawled_news.append(news)
-                except Exception as e:
-                    log.error(f"Yahoo Finance 뉴스 파싱 실패 ({link_info['url']}): {e}")
-                    continue
-            
-            log.info(f"Yahoo Finance 뉴스 크롤링 완료: {len(crawled_news)}개")
-            return crawled_news
-            
+            # 상세 페이지 요청을 동시에 실행 (Semaphore로 동시 요청 수 제한)
+            tasks = [
+                self._parse_news_url(link_info['title'], link_info['url'], client, now, errors)
+                for link_info in news_links[:max_news]
+            ]
         except Exception as e:
             log.error(f"Yahoo Finance 뉴스 크롤링 실패: {e}")
-            return []
-        finally:
-            if driver:
-                # driver 종료도 동일 이유로 동기 호출
-                driver.quit()
+            return
+        
+        count = 0
+        async for result in iter_completed(tasks):
+            # 파싱이 끝난 기사부터 바로 넘겨 전체 목록을 메모리에 모아두지 않음
+            if isinstance(result, Exception):
+                errors.append(result)
+            elif isinstance(result, CrawledNews):
+                count += 1
+                yield result
+        
+        # 실패 항목은 건별로 찍지 않고 한 줄로 요약 (앞 3건만 표시)
+        if errors:
+            log.error(f"Yahoo Finance 뉴스 파싱/본문 수집 실패 {len(errors)}건: {errors[:3]}")
+        
+        log.info(f"Yahoo Finance 뉴스 크롤링 완료: {count}개")
     
-    def _extract_news_links(self, driver) -> List[dict]:
-        """뉴스 링크 추출"""
-        try:
-            # 여러 선택자 시도
-            selectors = [
-                'h3 a',
-                'a[data-test-locator="stream-item-title"]',
-                'a[href*="/news/"]'
-            ]
-            
-            links = []
-            for selector in selectors:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    for el in elements:
-                        href = el.get_attribute('href')
-                        title = el.text.strip()
-                        if href and title and '/news/' in href and len(title) > 10:
-                            links.append({'url': href, 'title': title})
-                except:
-                    continue
-            
-            # 중복 제거
-            seen = set()
-            unique_links = []
-            for item in links:
-                if item['url'] not in seen:
-                    seen.add(item['url'])
-                    unique_links.append(item)
-            
-            return unique_links
-            
-        except Exception as e:
-            log.error(f"Yahoo Finance 링크 추출 실패: {e}")
-            return []
+    def _extract_news_links(self, body: bytes) -> List[dict]:
+        """목록 페이지 HTML에서 뉴스 링크 추출"""
+        tree = LexborHTMLParser(body)
+        
+        # 선택자 1회 실행 + 한 번의 순회로 필터링/중복 제거
+        seen = set()
+        unique_links = []
+        for el in tree.css(_LINK_SELECTOR):
+            href = el.attributes.get('href') or ''
+            if not href:
+                continue
+            
+            # 상대 경로를 절대 경로로 변환
+            if not href.startswith('http'):
+                href = self.base_url + href
+            
+            # 중복 제거 + 이미 저장된 URL 제외
+            if href in seen or href in SEEN_URLS:
+                continue
+            
+            title = el.text(strip=True)
+            if len(title) <= 10:
+                continue
+            
+            seen.add(href)
+            unique_links.append({'url': href, 'title': title})
+        
+        return unique_links
     
-    async def _fetch_news_content(self, driver, url: str, title: str) -> CrawledNews:
-        """뉴스 본문 추출"""
+    async def _parse_news_url(self, title: str, url: str, client: httpx.AsyncClient,
+                              now: datetime, errors: list) -> CrawledNews:
+        """뉴스 URL에서 상세 정보 추출"""
         try:
-            driver.get(url)
-            await asyncio.sleep(1.5)
-            
-            # 본문 추출
-            content = ""
-            content_selectors = [
-                '.caas-body',
-                'article[class*="body"]',
-                '.article-wrap',
-                'article'
-            ]
-            
-            for selector in content_selectors:
-                try:
-                    element = driver.find_element(By.CSS_SELECTOR, selector)
-                    content = element.text.strip()
-                    if content:
-                        break
-                except:
-                    continue
-            
-            # 이미지 추출
-            image_url = None
-            image_selectors = [
-                '.caas-img img',
-                'article img',
-                'img[class*="featured"]'
-            ]
-            
-            for selector in image_selectors:
-                try:
-                    img_element = driver.find_element(By.CSS_SELECTOR, selector)
-                    image_url = img_element.get_attribute('src')
-                    if image_url:
-                        break
-                except:
-                    continue
-            
-            # 제목 정규화 (500자 제한)
-            title = re.sub(r'\s+', ' ', title).strip()
-            if len(title) > 500:
-                title = title[:500]
-            
-            return CrawledNews(
-                title=title,
-                content=content[:5000] if content else "Content not available",
-                url=url,
-                source="YAHOO_FINANCE",
-                published_at=datetime.now(),
-                image_url=image_url
-            )
-            
+            content, image_url, pub_date = await self._fetch_news_content(url, client)
         except Exception as e:
-            log.error(f"Yahoo Finance 본문 추출 실패: {e}")
+            # 상세 페이지 실패는 요약 로그에 집계하고, 기사는 대체 본문으로 저장
+            errors.append(e)
+            content, image_url, pub_date = "Content not available", None, None
+        
+        # 다른 URL로 재송고된 동일 본문은 스킵
+        if is_duplicate_content(content):
             return None
+        
+        # 제목 정규화 (500자 제한)
+        title = _WS_RE.sub(' ', title).strip()[:500]
+        
+        return CrawledNews(
+            title=title,
+            content=content,
+            url=url,
+            source="YAHOO_FINANCE",
+            published_at=pub_date or now,
+            image_url=image_url
+        )
+    
+    async def _fetch_news_content(self, url: str, client: httpx.AsyncClient) -> tuple[str, str, datetime]:
+        """뉴스 본문 추출"""
+        # __NEXT_DATA__ JSON이 페이지 끝에 있으므로 공용 상한보다 크게 수신
+        async with self._sem:
+            body = await fetch_limited(client, url, max_bytes=YAHOO_MAX_BODY_BYTES)
+        
+        # 파싱(CPU 작업)은 프로세스 풀에서 실행해 이벤트 루프를 비워 둠
+        content, image_url, pub_date, json_error = await run_in_parse_pool(_extract_yahoo, body)
+        if json_error:
+            # CSS 선택자 fallback으로 넘어가므로 조용히 삼키지 않고 기록
+            log.warning(f"Yahoo Finance {json_error} ({url}, {len(body)} bytes)")
+        return content, image_url, pub_date
+
@@ -1,4 +1,5 @@
-from fastapi import FastAPI, BackgroundTasks
+import asyncio
+from fastapi import FastAPI, HTTPException
 from contextlib import asynccontextmanager
 import os
 from dotenv import load_dotenv
@@ -9,21 +10,79 @@ from app.crawler.edaily_crawler import EdailyCrawler
 from app.crawler.herald_crawler import HeraldCrawler
 from app.crawler.yahoo_crawler import YahooCrawler
 from app.crawler.chosunbiz_crawler import ChosunbizCrawler
-from app.services.news_service import NewsService
+from app.services.news_service import API_CONCURRENCY, NewsService
+from app.utils.http import close_client, get_client
 from app.utils.logger import log
+from app.utils.parse_pool import shutdown_parse_pool
+from app.utils.url_filter import init_filters, remember_saved, save_filters
 
 # 환경변수 로드
 load_dotenv()
 
 MAX_NEWS = int(os.getenv("MAX_NEWS_PER_SOURCE", "50"))
 
+# 동시에 실행할 크롤링 작업 수 (요청이 몰려도 이 이상 동시에 크롤링하지 않음)
+CRAWL_WORKERS = int(os.getenv("CRAWL_WORKERS", "3"))
+
+# 대기 중인 크롤링 작업 최대 수 (가득 차면 요청을 503으로 거절)
+CRAWL_QUEUE_SIZE = int(os.getenv("CRAWL_QUEUE_SIZE", "20"))
+
+
+async def _crawl_worker(jobs: asyncio.Queue):
+    """큐에 쌓인 크롤링 작업(run_* 함수)을 하나씩 꺼내 실행"""
+    while True:
+        job = await jobs.get()
+        try:
+            await job()
+        except Exception as e:
+            log.error(f"크롤링 작업 실행 실패: {e}")
+        finally:
+            jobs.task_done()
+
+
+def _enqueue(job):
+    """크롤링 작업을 큐에 추가 (큐가 가득 차면 기다리지 않고 503 응답)"""
+    try:
+        app.state.jobs.put_nowait(job)
+    except asyncio.QueueFull:
+        log.warning(f"크롤링 작업 큐가 가득 참 ({CRAWL_QUEUE_SIZE}개): {job.__name__} 요청 거절")
+        raise HTTPException(
+            status_code=503,
+            detail="크롤링 작업이 너무 많습니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": "60"},
+        )
+
 
 # 앱 라이프사이클 관리
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """앱 시작/종료 시 실행되는 코드"""
     log.info("🚀 Lucr Crawler 시작")
+    # 지난 실행에서 저장한 URL/본문 중복 필터 로드
+    init_filters()
+    # 크롤러 공유 HTTP 클라이언트 (요청 간 연결/TLS 세션 유지)
+    app.state.http = get_client()
+    # Spring API 서비스 (요청 간 연결과 URL 존재 캐시를 유지하도록 앱 수명 동안 1개만 사용)
+    # 크롤러와 같은 HTTP 클라이언트(연결 풀)를 공유
+    app.state.news_service = NewsService(client=app.state.http)
+    # 크롤링 작업 큐(크기 제한) + 고정 개수 워커 (요청마다 무제한으로 크롤링이 생기지 않도록 제한)
+    app.state.jobs = asyncio.Queue(maxsize=CRAWL_QUEUE_SIZE)
+    app.state.workers = [
+        asyncio.create_task(_crawl_worker(app.state.jobs)) for _ in range(CRAWL_WORKERS)
+    ]
     yield
+    # 크롤링 워커 종료
+    for worker in app.state.workers:
+        worker.cancel()
+    await asyncio.gather(*app.state.workers, return_exceptions=True)
+    # Spring API 클라이언트 종료
+    await app.state.news_service.close()
+    # 수집한 URL/본문 중복 필터를 디스크에 저장 (다음 실행 시 재사용)
+    save_filters()
+    # 크롤러 공유 HTTP 클라이언트 연결 정리
+    await close_client()
+    # HTML 파싱 프로세스 풀 종료
+    shutdown_parse_pool()
     log.info("🛑 Lucr Crawler 종료")
 
 
@@ -46,56 +105,56 @@ async def root():
     }
 
 
-@app.post("/crawl/hankyung")
-async def crawl_hankyung_news(background_tasks: BackgroundTasks):
+@app.post("/crawl/hankyung", status_code=202)
+async def crawl_hankyung_news():
     """한국경제 뉴스 크롤링"""
     log.info("한국경제 뉴스 크롤링 요청 받음")
-    background_tasks.add_task(run_hankyung_crawler)
+    _enqueue(run_hankyung_crawler)
     return {"message": "한국경제 뉴스 크롤링이 시작되었습니다.", "status": "started"}
 
 
-@app.post("/crawl/mk")
-async def crawl_mk_news(background_tasks: BackgroundTasks):
+@app.post("/crawl/mk", status_code=202)
+async def crawl_mk_news():
     """매일경제 뉴스 크롤링"""
     log.info("매일경제 뉴스 크롤링 요청 받음")
-    background_tasks.add_task(run_mk_crawler)
+    _enqueue(run_mk_crawler)
     return {"message": "매일경제 뉴스 크롤링이 시작되었습니다.", "status": "started"}
 
 
-@app.post("/crawl/edaily")
-async def crawl_edaily_news(background_tasks: BackgroundTasks):
+@app.post("/crawl/edaily", status_code=202)
+async def crawl_edaily_news():
     """이데일리 뉴스 크롤링"""
     log.info("이데일리 뉴스 크롤링 요청 받음")
-    background_tasks.add_task(run_edaily_crawler)
+    _enqueue(run_edaily_crawler)
     return {"message": "이데일리 뉴스 크롤링이 시작되었습니다.", "status": "started"}
 
 
-@app.post("/crawl/herald")
-async def crawl_herald_news(background_tasks: BackgroundTasks):
+@app.post("/crawl/herald", status_code=202)
+async def crawl_herald_news():
     """헤럴드경제 뉴스 크롤링"""
     log.info("헤럴드경제 뉴스 크롤링 요청 받음")
-    background_tasks.add_task(run_herald_crawler)
+    _enqueue(run_herald_crawler)
     return {"message": "헤럴드경제 뉴스 크롤링이 시작되었습니다.", "status": "started"}
 
 
-@app.post("/crawl/yahoo")
-async def crawl_yahoo_news(background_tasks: BackgroundTasks):
+@app.post("/crawl/yahoo", status_code=202)
+async def crawl_yahoo_news():
     """Yahoo Finance 뉴스 크롤링"""
     log.info("Yahoo Finance 뉴스 크롤링 요청 받음")
-    background_tasks.add_task(run_yahoo_crawler)
+    _enqueue(run_yahoo_crawler)
     return {"message": "Yahoo Finance 뉴스 크롤링이 시작되었습니다.", "status": "started"}
 
 
-@app.post("/crawl/chosunbiz")
-async def crawl_chosunbiz_news(background_tasks: BackgroundTasks):
+@app.post("/crawl/chosunbiz", status_code=202)
+async def crawl_chosunbiz_news():
     """조선비즈 뉴스 크롤링"""
     log.info("조선비즈 뉴스 크롤링 요청 받음")
-    background_tasks.add_task(run_chosunbiz_crawler)
+    _enqueue(run_chosunbiz_crawler)
     return {"message": "조선비즈 뉴스 크롤링이 시작되었습니다.", "status": "started"}
 
 
-@app.post("/crawl/all")
-async def crawl_all_news(background_tasks: BackgroundTasks):
+@app.post("/crawl/all", status_code=202)
+async def crawl_all_news():
     """
     모든 출처의 뉴스 크롤링
     
@@ -104,8 +163,8 @@ async def crawl_all_news(background_tasks: BackgroundTasks):
     """
     log.info("전체 뉴스 크롤링 요청 받음")
     
-    # 백그라운드에서 크롤링 실행
-    background_tasks.add_task(run_all_crawlers)
+    # 작업 큐에 넣으면 크롤링 워커가 실행
+    _enqueue(run_all_crawlers)
     
     return {
         "message": "전체 뉴스 크롤링이 시작되었습니다 (6개 언론사).",
@@ -115,37 +174,37 @@ async def crawl_all_news(background_tasks: BackgroundTasks):
 
 async def run_hankyung_crawler():
     """한국경제 크롤러 실행"""
-    crawler = HankyungCrawler()
+    crawler = HankyungCrawler(client=app.state.http)
     await _run_crawler(crawler, "한국경제")
 
 
 async def run_mk_crawler():
     """매일경제 크롤러 실행"""
-    crawler = MKCrawler()
+    crawler = MKCrawler(client=app.state.http)
     await _run_crawler(crawler, "매일경제")
 
 
 async def run_edaily_crawler():
     """이데일리 크롤러 실행"""
-    crawler = EdailyCrawler()
+    crawler = EdailyCrawler(client=app.state.http)
     await _run_crawler(crawler, "이데일리")
 
 
 async def run_herald_crawler():
     """헤럴드경제 크롤러 실행"""
-    crawler = HeraldCrawler()
+    crawler = HeraldCrawler(client=app.state.http)
     await _run_crawler(crawler, "헤럴드경제")
 
 
 async def run_yahoo_crawler():
     """Yahoo Finance 크롤러 실행"""
-    crawler = YahooCrawler()
+    crawler = YahooCrawler(client=app.state.http)
     await _run_crawler(crawler, "Yahoo Finance")
 
 
 async def run_chosunbiz_crawler():
     """조선비즈 크롤러 실행"""
-    crawler = ChosunbizCrawler()
+    crawler = ChosunbizCrawler(client=app.state.http)
     await _run_crawler(crawler, "조선비즈")
 
 
@@ -160,42 +219,53 @@ async def _run_crawler(crawler, source_name: str):
       - 실서비스의 메인 비동기 파이프라인( Spring -> RabbitMQ -> Worker )은
         `app.messaging.consumer`에서 동작하며 DB에 직접 저장한다.
     """
-    news_service = NewsService()
+    # 앱 수명 동안 공유하는 서비스 (URL 존재 캐시 재사용)
+    news_service = app.state.news_service
     
     try:
         log.info(f"{source_name} 뉴스 크롤링 시작 (최대 {MAX_NEWS}개)")
-        news_list = await crawler.crawl(max_news=MAX_NEWS)
+        # crawl()은 async generator이므로 API 경로에서는 한 번에 모아 일괄 확인/전송
+        news_list = [news async for news in crawler.crawl(max_news=MAX_NEWS)]
         
         if not news_list:
             log.warning(f"{source_name}: 크롤링된 뉴스가 없습니다.")
             return
         
+        # URL 중복 확인을 한 번에 수행 (항목별 순차 요청 제거)
+        existing_urls = await news_service.check_urls_exist([news.url for news in news_list])
+        duplicate_count = len(existing_urls)
+        if duplicate_count:
+            log.info(f"{source_name}: 이미 존재하는 뉴스 {duplicate_count}개 스킵")
+        new_news = [news for news in news_list if news.url not in existing_urls]
+        
+        sem = asyncio.Semaphore(API_CONCURRENCY)
+        
+        async def _create(news):
+            # FastAPI 경로에서만 DTO 변환 후 HTTP 전송을 수행한다.
+            # Worker 경로는 이 변환 없이 DB에 직접 INSERT한다.
+            async with sem:
+                return await news_service.create_news(news.to_create_dto())
+        
+        results = await asyncio.gather(*(_create(news) for news in new_news), return_exceptions=True)
+        
         success_count = 0
-        duplicate_count = 0
         error_count = 0
+        for news, result in zip(new_news, results):
+            if isinstance(result, Exception):
+                error_count += 1
+                log.error(f"{source_name}: 뉴스 처리 중 오류: {result}")
+            elif result:
+                success_count += 1
+                # 201: 새로 저장된 기사 → URL + 본문을 중복 필터에 등록
+                remember_saved(news.url, news.content)
+            else:
+                error_count += 1
         
+        # Spring에 이미 있는 것으로 확인된 기사(exists/409)는 URL만 등록
+        # (그 외 실패한 기사는 등록하지 않아 다음 크롤링에서 다시 수집)
         for news in news_list:
-            try:
-                if await news_service.check_url_exists(news.url):
-                    log.info(f"{source_name}: 이미 존재하는 뉴스 (스킵)")
-                    duplicate_count += 1
-                    continue
-                
-                # FastAPI 경로에서만 DTO 변환 후 HTTP 전송을 수행한다.
-                # Worker 경로는 이 변환 없이 DB에 직접 INSERT한다.
-                news_dto = news.to_create_dto()
-                result = await news_service.create_news(news_dto)
-                
-                if result:
-                    success_count += 1
-                    log.info(f"{source_name}: 뉴스 저장 성공 [{success_count}]")
-                else:
-                    error_count += 1
-                    
-            except Exception as e:
-                error_count += 1
-                log.error(f"{source_name}: 뉴스 처리 중 오류: {e}")
-                continue
+            if news_service.is_known_url(news.url):
+                remember_saved(news.url)
         
         log.info(f"""
         ✅ {source_name} 뉴스 크롤링 완료
@@ -207,31 +277,26 @@ async def _run_crawler(crawler, source_name: str):
         
     except Exception as e:
         log.error(f"{source_name}: 크롤러 실행 중 오류 발생: {e}")
-    finally:
-        await news_service.close()
 
 
 async def run_all_crawlers():
-    """모든 크롤러 실행"""
+    """모든 크롤러 실행 (언론사별로 도메인이 달라 동시에 실행)"""
     log.info("=== 전체 크롤러 실행 시작 ===")
     
-    # 1. 한국경제
-    await run_hankyung_crawler()
-    
-    # 2. 매일경제
-    await run_mk_crawler()
-    
-    # 3. 이데일리
-    await run_edaily_crawler()
-    
-    # 4. 헤럴드경제
-    await run_herald_crawler()
-    
-    # 5. 조선비즈
-    await run_chosunbiz_crawler()
+    runners = {
+        "한국경제": run_hankyung_crawler,
+        "매일경제": run_mk_crawler,
+        "이데일리": run_edaily_crawler,
+        "헤럴드경제": run_herald_crawler,
+        "조선비즈": run_chosunbiz_crawler,
+        "Yahoo Finance": run_yahoo_crawler,
+    }
+    results = await asyncio.gather(*(run() for run in runners.values()), return_exceptions=True)
     
-    # 6. Yahoo Finance
-    await run_yahoo_crawler()
+    # 언론사별 실패는 gather 이후 한 번에 기록
+    for source_name, result in zip(runners, results):
+        if isinstance(result, Exception):
+            log.error(f"{source_name}: 크롤러 실행 실패: {result}")
     
     log.info("=== 전체 크롤러 실행 완료 ===")
 
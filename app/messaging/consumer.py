@@ -10,7 +10,7 @@
   2. RabbitMQ Binding 규칙에 따라 Request Queue(lucr.crawl.request)로 라우팅
   3. 이 Consumer가 Queue에서 메시지를 꺼내 처리:
      a. CrawlJob 상태를 RUNNING으로 업데이트
-     b. 6개 언론사 크롤러를 순차 실행
+     b. 6개 언론사 크롤러를 동시 실행 (asyncio.gather)
      c. 수집된 뉴스에 분석 결과(감정/키워드/종목)를 채움
      d. 분석 결과 포함해서 PostgreSQL에 직접 저장 (HTTP 호출 없이)
      e. CrawlJob 상태를 COMPLETED / FAILED로 업데이트
@@ -19,24 +19,26 @@
 
 모델/저장 경로 주의:
   - 이 Worker 경로는 `CrawledNews`를 분석 후
-    `DBManager.save_news_with_analysis()`로 직접 저장합니다.
+    `DBManager.save_news_with_analysis_bulk()`로 배치(CRAWL_SAVE_BATCH_SIZE건) 단위로 일괄 저장합니다.
   - `NewsCreate` DTO와 `NewsService`(HTTP POST)는 여기서 사용하지 않습니다.
   - `NewsCreate`는 FastAPI(`/crawl/*`) 경로에서만 사용됩니다.
 
 ACK/NACK 메커니즘:
   - ACK  (Acknowledge):  "이 메시지 처리 완료" → RabbitMQ가 큐에서 메시지 삭제
   - NACK (Negative ACK): "이 메시지 처리 실패" → requeue=False면 DLQ로 이동 또는 폐기
-  - auto_ack=False: 수동 ACK 모드. 처리 완료 후 명시적으로 ACK를 보내야 함
+  - no_ack=False: 수동 ACK 모드. 처리 완료 후 명시적으로 ACK를 보내야 함
     → 만약 Worker가 처리 중 죽으면, ACK를 안 보냈으므로 RabbitMQ가 다른 Consumer에 재전달
 
 @author Ekko0701
 @since 2026-02-06
 """
-import pika
-import json
 import asyncio
-import os
-from dotenv import load_dotenv
+import uuid
+from typing import Optional
+
+import aio_pika
+import orjson
+from aio_pika.abc import AbstractIncomingMessage
 
 # ── 크롤러 import ──
 # 각 언론사별 크롤러 (BaseCrawler를 상속, crawl() 메서드 구현)
@@ -48,29 +50,35 @@ from app.crawler.yahoo_crawler import YahooCrawler          # Yahoo Finance
 from app.crawler.chosunbiz_crawler import ChosunbizCrawler  # 조선비즈
 
 # ── 내부 서비스 import ──
+from app.config.settings import Settings, get_settings     # .env 기반 설정 (1회 로드)
 from app.services.db_manager import DBManager               # PostgreSQL 직접 저장
 from app.messaging.publisher import CrawlResultPublisher    # 완료 이벤트 발행
+from app.utils.http import close_client, get_client         # 크롤러 공유 HTTP 클라이언트
 from app.utils.logger import log
+from app.utils.url_filter import remember_saved             # 저장 확인된 기사만 중복 필터에 등록
 
 # ── 분석기 import ──
 from app.analyzer import SentimentAnalyzer, KeywordExtractor, StockMatcher
 
-load_dotenv()
-
 
 class CrawlConsumer:
     """
-    RabbitMQ 크롤링 요청 메시지를 수신하고 처리하는 Consumer
+    RabbitMQ 크롤링 요청 메시지를 수신하고 처리하는 Consumer (aio-pika 기반)
 
     동작 방식:
-      - start()를 호출하면 RabbitMQ Queue에 연결하여 무한 대기(blocking)
-      - Queue에 메시지가 들어오면 _on_message() 콜백이 자동 호출
+      - start()를 await하면 RabbitMQ Queue에 연결하여 무한 대기
+      - Queue에 메시지가 들어오면 _on_message() 코루틴이 자동 호출
       - _on_message()에서 크롤링 실행 → DB 저장 → 완료 이벤트 발행
       - 처리 완료 후 ACK, 실패 시 NACK
 
     RabbitMQ Consumer 패턴:
-      Push 방식 - basic_consume()으로 콜백을 등록하면,
+      Push 방식 - queue.consume()으로 콜백을 등록하면,
       RabbitMQ가 메시지를 "밀어넣어" 줍니다 (polling 아님).
+
+    이벤트 루프:
+      Worker 전체가 asyncio.run(consumer.start()) 1개의 루프에서 동작합니다.
+      메시지마다 루프를 새로 만들지 않으며, 크롤러가 I/O를 기다리는 동안에도
+      같은 루프에서 heartbeat가 처리되어 연결이 끊기지 않습니다.
     """
 
     # ── Spring RabbitMQConfig.CRAWL_REQUEST_QUEUE과 동일한 큐 이름 ──
@@ -78,35 +86,44 @@ class CrawlConsumer:
     # Binding 규칙에 따라 이 Queue로 도착합니다.
     QUEUE = "lucr.crawl.request"
 
-    def __init__(self):
+    def __init__(self, settings: Optional[Settings] = None):
         """
-        Consumer 초기화: RabbitMQ 연결 파라미터 + 내부 서비스 인스턴스 생성
+        Consumer 초기화: RabbitMQ 연결 정보 + 내부 서비스 인스턴스 생성
+
+        Args:
+            settings: Worker 설정 (None이면 get_settings()로 프로세스 공용 설정 사용)
 
         의존성:
           - DBManager: 크롤링된 뉴스를 PostgreSQL에 직접 저장 + CrawlJob 상태 업데이트
           - CrawlResultPublisher: 크롤링 완료/실패 이벤트를 RabbitMQ에 역발행
           - SentimentAnalyzer/KeywordExtractor/StockMatcher: 뉴스 분석기
         """
-        # PlainCredentials: 평문 사용자/비밀번호 인증
-        credentials = pika.PlainCredentials(
-            os.getenv("RABBITMQ_USER", "charlie0701"),
-            os.getenv("RABBITMQ_PASSWORD", "alpha5059"),
-        )
-        # ConnectionParameters: 연결 정보를 묶은 객체 (실제 연결은 start()에서 수행)
-        # heartbeat=600: 크롤링은 수 분이 걸리므로 heartbeat 간격을 10분으로 설정
-        #   기본값(60초)이면 크롤링 중 heartbeat 응답을 못 보내서 RabbitMQ가 연결을 끊음
-        #   BlockingConnection은 단일 스레드라 크롤링 중 heartbeat 프레임 처리 불가
-        # blocked_connection_timeout=300: RabbitMQ가 flow control로 연결을 차단했을 때
-        #   5분까지 대기 (기본값은 무한 대기)
-        self.params = pika.ConnectionParameters(
-            host=os.getenv("RABBITMQ_HOST", "localhost"),
-            port=int(os.getenv("RABBITMQ_PORT", "5672")),
-            credentials=credentials,
-            heartbeat=600,
-            blocked_connection_timeout=300,
-        )
+        settings = settings or get_settings()
+        # 연결 정보 (실제 연결은 start()에서 수행)
+        # heartbeat=60: 크롤링 중에도 이벤트 루프가 heartbeat 프레임을 처리하므로
+        #   긴 간격(기존 600초)으로 늘려 둘 필요가 없음
+        self.connection_kwargs = {
+            "host": settings.rabbitmq_host,
+            "port": settings.rabbitmq_port,
+            "login": settings.rabbitmq_user,
+            "password": settings.rabbitmq_password,
+            "heartbeat": 60,
+        }
+        # prefetch_count: ACK 전에 RabbitMQ가 이 Consumer에 미리 보내 둘 메시지 수
+        #   aio-pika는 받은 메시지를 같은 루프에서 동시에 처리하므로 프로세스당 동시 작업 수와 같음
+        #   기본값 1: 무거운 크롤링 작업을 여러 Worker 프로세스로 고르게 나눔
+        #   올리면 작업마다 DB 세션을 1개씩 잡으므로 DB 커넥션 풀 크기도 함께 늘리고,
+        #   분석기(감정/키워드/종목)를 여러 스레드에서 동시에 호출해도 되는지 먼저 확인한다.
+        self.prefetch = settings.rabbitmq_prefetch
+        # 크롤러가 yield한 뉴스를 몇 건씩 모아 저장 큐에 넣을지 (분석 + INSERT 1회 단위)
+        # 메모리에는 언론사 전체 기사 대신 배치 크기만큼만 머무름
+        self.save_batch_size = settings.crawl_save_batch_size
+        # 모든 크롤러가 공유할 HTTP 클라이언트 (이벤트 루프에 묶이므로 start()에서 생성)
+        self.http = None
+        # 메시지 간 재사용할 크롤러 인스턴스 (공유 HTTP 클라이언트를 주입하므로 start()에서 생성)
+        self.crawlers = None
         self.db = DBManager()                    # PostgreSQL 직접 조작
-        self.publisher = CrawlResultPublisher()  # 완료 이벤트 Publisher
+        self.publisher = CrawlResultPublisher(settings)  # 완료 이벤트 Publisher
         self._init_analyzers()
 
     def _init_analyzers(self):
@@ -139,191 +156,217 @@ class CrawlConsumer:
             log.warning(f"StockMatcher 초기화 실패 (종목 매칭 건너뜀): {e}")
             self.stock_matcher = None
 
-    def start(self):
+    async def start(self):
         """
         Consumer를 시작하고 RabbitMQ Queue에서 메시지를 무한 대기합니다.
 
-        이 메서드를 호출하면 다음 순서로 동작합니다:
-          1. RabbitMQ에 TCP 연결 (BlockingConnection)
+        이 코루틴을 await하면 다음 순서로 동작합니다:
+          1. RabbitMQ에 연결 (connect_robust: 끊기면 자동 재연결)
           2. Channel 생성 (논리적 통신 경로)
-          3. Queue 선언 (이미 존재하면 무시, 없으면 생성)
-          4. QoS 설정 (한 번에 처리할 메시지 수)
+          3. QoS 설정 (ACK 전에 미리 받아 둘 메시지 수)
+          4. Queue 선언 (이미 존재하면 무시, 없으면 생성)
           5. 콜백 등록 (메시지 도착 시 _on_message 호출)
-          6. 무한 대기 루프 진입 (start_consuming)
+          6. 무한 대기
 
         주의:
-          - start_consuming()은 블로킹 호출이므로 이 이후의 코드는 실행되지 않음
+          - 취소되기 전까지 반환하지 않음
           - Worker 종료는 Ctrl+C (KeyboardInterrupt)로 수행
         """
-        # 1. RabbitMQ에 TCP 연결 생성
-        #    BlockingConnection: 동기 방식. Consumer처럼 장시간 연결 유지에 적합
-        connection = pika.BlockingConnection(self.params)
-
-        # 2. Channel 생성
-        #    하나의 Connection 안에서 여러 Channel을 만들 수 있음
-        #    Consumer는 보통 1개 Channel이면 충분
-        channel = connection.channel()
-
-        # 3. Queue 선언 (멱등 연산: 이미 존재하면 아무것도 안 함)
-        #    Spring이 @Bean으로 이미 생성했지만, Python이 먼저 실행될 경우를 대비
-        #    durable=True: RabbitMQ 재시작 시에도 Queue가 유지됨
-        #    (Spring QueueBuilder.durable()과 동일)
-        channel.queue_declare(queue=self.QUEUE, durable=True)
-
-        # 4. QoS (Quality of Service) 설정
-        #    prefetch_count=1: RabbitMQ가 이 Consumer에게 한 번에 1개 메시지만 전달
-        #    → 현재 메시지를 ACK하기 전까지 다음 메시지를 보내지 않음
-        #    → 크롤링은 무거운 작업이므로 1개씩 순차 처리가 안전
-        #    → 만약 여러 Worker를 띄우면 Round-Robin으로 분배됨
-        channel.basic_qos(prefetch_count=1)
-
-        # 5. Consumer 등록: Queue에 메시지가 도착하면 _on_message 콜백 호출
-        #    auto_ack=False (기본값): 수동 ACK 모드
-        #    → _on_message에서 명시적으로 basic_ack() 또는 basic_nack() 호출 필요
-        channel.basic_consume(
-            queue=self.QUEUE,
-            on_message_callback=self._on_message,
-        )
-
-        log.info(f"Consumer 시작: '{self.QUEUE}' 큐 대기 중...")
-
-        # 6. 무한 대기 루프 진입
-        #    Queue에 메시지가 올 때까지 블로킹
-        #    메시지가 오면 _on_message 콜백이 호출되고, 처리 후 다시 대기
-        channel.start_consuming()
-
-    def _on_message(self, channel, method, properties, body):
-        """
-        메시지 수신 시 자동 호출되는 콜백 함수
+        # Worker 루프 전체에서 재사용할 HTTP 클라이언트 (HTTP/2 + keep-alive 연결 풀)
+        self.http = get_client()
+        self.crawlers = self._create_crawlers()
 
-        RabbitMQ가 Queue에서 메시지를 꺼내 이 함수의 파라미터로 전달합니다.
+        # 1. RabbitMQ에 연결
+        #    connect_robust: 네트워크 장애로 연결이 끊기면 채널/큐/consume까지 자동 복구
+        connection = await aio_pika.connect_robust(**self.connection_kwargs)
+
+        try:
+            async with connection:
+                # 2. Channel 생성
+                #    Consumer는 보통 1개 Channel이면 충분
+                channel = await connection.channel()
+
+                # 3. QoS (Quality of Service) 설정
+                #    prefetch_count=N: ACK하지 않은 메시지를 최대 N개까지 이 Consumer에 전달
+                #    → 기본값 1 (RABBITMQ_PREFETCH 환경변수로 변경)
+                #    → 전달받은 메시지는 같은 이벤트 루프에서 동시에 처리됨
+                await channel.set_qos(prefetch_count=self.prefetch)
+
+                # 4. Queue 선언 (멱등 연산: 이미 존재하면 아무것도 안 함)
+                #    Spring이 @Bean으로 이미 생성했지만, Python이 먼저 실행될 경우를 대비
+                #    durable=True: RabbitMQ 재시작 시에도 Queue가 유지됨
+                #    (Spring QueueBuilder.durable()과 동일)
+                queue = await channel.declare_queue(self.QUEUE, durable=True)
+
+                # 5. Consumer 등록: Queue에 메시지가 도착하면 _on_message 코루틴 호출
+                #    no_ack=False (기본값): 수동 ACK 모드
+                #    → _on_message에서 명시적으로 ack() 또는 nack() 호출 필요
+                await queue.consume(self._on_message)
+
+                log.info(f"Consumer 시작: '{self.QUEUE}' 큐 대기 중...")
+
+                # 6. 무한 대기 (취소될 때까지)
+                await asyncio.Future()
+        finally:
+            # 크롤러 공유 HTTP 클라이언트는 Worker 루프 전체에서 재사용하고 종료 시 1번만 정리
+            await close_client()
+            # 닫힌 클라이언트를 들고 있는 크롤러는 버림 (다시 start()하면 새로 생성)
+            self.crawlers = None
+            # 완료 이벤트 Publisher가 재사용하던 RabbitMQ 연결도 종료
+            await asyncio.to_thread(self.publisher.close)
+
+    async def _on_message(self, message: AbstractIncomingMessage):
+        """
+        메시지 수신 시 자동 호출되는 콜백 코루틴
 
         Args:
-            channel:    현재 사용 중인 Channel 객체
-                        ACK/NACK 응답을 보내는 데 사용
-            method:     메시지 전달 메타데이터
-                        - method.delivery_tag: 메시지 고유 ID (ACK/NACK 시 사용)
-                        - method.routing_key: 이 메시지의 Routing Key
-                        - method.exchange: 이 메시지가 발행된 Exchange
-            properties: 메시지 속성 (content_type, delivery_mode, headers 등)
-            body:       메시지 본문 (bytes)
-                        Spring이 보낸 JSON: {"jobId": "550e8400-...", "maxArticles": 50}
+            message: 수신한 메시지
+                     - message.body: 메시지 본문 (bytes)
+                       Spring이 보낸 JSON: {"jobId": "550e8400-...", "maxArticles": 50}
+                     - message.delivery_tag: 메시지 고유 ID (ACK/NACK 시 사용)
+                     - message.routing_key: 이 메시지의 Routing Key
 
         처리 흐름:
             성공 시: 파싱 → RUNNING → 크롤링 → DB저장 → COMPLETED → 이벤트발행 → ACK
             실패 시: 에러캐치 → FAILED → 이벤트발행 → NACK
 
         ACK/NACK 설명:
-            - basic_ack(delivery_tag):   "처리 완료" → RabbitMQ가 큐에서 삭제
-            - basic_nack(delivery_tag, requeue=False):
+            - message.ack():   "처리 완료" → RabbitMQ가 큐에서 삭제
+            - message.nack(requeue=False):
               "처리 실패, 재시도 안 함" → 메시지 폐기 (DLQ 설정 시 DLQ로 이동)
-            - delivery_tag: RabbitMQ가 메시지마다 부여하는 일련번호
-              (같은 Channel 내에서 유일)
+
+        동기 I/O 주의:
+            DBManager(psycopg2)와 CrawlResultPublisher(pika)는 블로킹 호출이므로
+            asyncio.to_thread()로 실행해 이벤트 루프(heartbeat, 다른 메시지)를 막지 않는다.
         """
-        job_id = None
-        try:
-            # ── Step 1: 메시지 파싱 ──
-            # body는 bytes이므로 json.loads()가 자동으로 UTF-8 디코딩
-            message = json.loads(body)
-            job_id = message.get("jobId")              # Spring CrawlJob의 UUID
-            max_articles = message.get("maxArticles", 50)  # 언론사당 최대 수집 건수 (기본 50)
-
-            log.info(f"크롤링+분석 요청 수신: jobId={job_id}, maxArticles={max_articles}")
-
-            # ── Step 2: CrawlJob 상태 → RUNNING ──
-            # DB의 crawl_jobs 테이블에서 해당 Job을 PENDING → RUNNING으로 업데이트
-            self.db.update_job_status(job_id, "RUNNING")
-
-            # ── Step 3: 6개 언론사 크롤러 순차 실행 + DB 저장 ──
-            # 크롤러는 async로 구현되어 있으므로 asyncio.run()으로 동기 환경에서 실행
-            # asyncio.run(): 새 이벤트 루프를 생성하고, 코루틴 완료 후 루프를 닫음
-            # pika의 _on_message 콜백은 동기 함수이므로 asyncio.run() 필요
-            media_results = asyncio.run(self._run_all_crawlers(max_articles))
-
-            # ── Step 4: 총 수집 건수 계산 ──
-            # media_results: {"hankyung": 45, "mk": 38, ...}
-            total = sum(media_results.values())
-
-            # ── Step 5: CrawlJob 상태 → COMPLETED ──
-            # 총 수집 건수와 언론사별 결과를 DB에 기록
-            self.db.update_job_status(
-                job_id, "COMPLETED",
-                total_articles=total,
-                media_results=media_results,
-            )
+        # 작업 1건 동안 DB 세션 1개를 재사용 (상태 업데이트/저장/상태 조회 공용)
+        with self.db.session_scope() as session:
+            job_id = None
+            job_uuid = None  # 메시지 파싱 시 1번만 검증/변환한 UUID (DB 조회/갱신에 재사용)
+            try:
+                # ── Step 1: 메시지 파싱 ──
+                # orjson.loads()는 bytes를 바로 파싱 (UTF-8 디코딩 단계 없음)
+                payload = orjson.loads(message.body)
+                job_id = payload.get("jobId")              # Spring CrawlJob의 UUID
+                job_uuid = uuid.UUID(job_id)               # 형식이 잘못되면 ValueError → FAILED 처리 생략
+                max_articles = payload.get("maxArticles", 50)  # 언론사당 최대 수집 건수 (기본 50)
+
+                log.info(f"크롤링+분석 요청 수신: jobId={job_id}, maxArticles={max_articles}")
+
+                # ── Step 2: CrawlJob 상태 → RUNNING ──
+                # DB의 crawl_jobs 테이블에서 해당 Job을 PENDING → RUNNING으로 업데이트
+                await asyncio.to_thread(
+                    self.db.update_job_status, job_uuid, "RUNNING", session=session
+                )
 
-            # ── Step 6: Spring에 완료 이벤트 발행 ──
-            # Publisher를 통해 Exchange(lucr.crawl.exchange) → "crawl.result" 키로 발행
-            # Spring Listener가 이 이벤트를 수신하여 후속 처리 (알림, 캐시 갱신 등)
-            self.publisher.publish(job_id, "COMPLETED", total, media_results)
+                # ── Step 3: 6개 언론사 크롤러 동시 실행 + DB 저장 ──
+                # Worker의 이벤트 루프에서 바로 await (메시지마다 루프를 새로 만들지 않음)
+                media_results = await self._run_all_crawlers(max_articles, session)
+
+                # ── Step 4: 총 수집 건수 계산 ──
+                # media_results: {"hankyung": 45, "mk": 38, ...}
+                total = sum(media_results.values())
+
+                # ── Step 5: CrawlJob 상태 → COMPLETED ──
+                # 총 수집 건수와 언론사별 결과를 DB에 기록
+                await asyncio.to_thread(
+                    self.db.update_job_status,
+                    job_uuid, "COMPLETED",
+                    total_articles=total,
+                    media_results=media_results,
+                    session=session,
+                )
 
-            # ── Step 7: ACK 전송 ──
-            # "이 메시지 처리 완료"를 RabbitMQ에 알림
-            # → RabbitMQ가 Queue에서 해당 메시지를 영구 삭제
-            # → ACK를 보내지 않으면 RabbitMQ는 메시지를 Unacked 상태로 유지하고,
-            #   Consumer가 죽으면 다른 Consumer에게 재전달
-            channel.basic_ack(delivery_tag=method.delivery_tag)
+                # ── Step 6: Spring에 완료 이벤트 발행 ──
+                # Publisher를 통해 Exchange(lucr.crawl.exchange) → "crawl.result" 키로 발행
+                # Spring Listener가 이 이벤트를 수신하여 후속 처리 (알림, 캐시 갱신 등)
+                await asyncio.to_thread(self.publisher.publish, job_id, "COMPLETED", total, media_results)
 
-            log.info(f"크롤링+분석 완료: jobId={job_id}, total={total}")
+                # ── Step 7: ACK 전송 ──
+                # "이 메시지 처리 완료"를 RabbitMQ에 알림
+                # → RabbitMQ가 Queue에서 해당 메시지를 영구 삭제
+                # → ACK를 보내지 않으면 RabbitMQ는 메시지를 Unacked 상태로 유지하고,
+                #   Consumer가 죽으면 다른 Consumer에게 재전달
+                await message.ack()
 
-        except Exception as e:
-            log.error(f"크롤링+분석 처리 실패: {e}")
+                log.info(f"크롤링+분석 완료: jobId={job_id}, total={total}")
+
+            except Exception as e:
+                log.error(f"크롤링+분석 처리 실패: {e}")
+
+                # ── 실패 처리 ──
+                # 주의: ACK 전송 단계에서 연결 끊김 등으로 실패한 경우,
+                # 크롤링 자체는 성공하고 DB에 COMPLETED가 이미 기록된 상태일 수 있음.
+                # 이 경우 FAILED로 덮어쓰면 안 되므로, 현재 DB 상태를 확인 후 처리.
+                if job_uuid:
+                    current_status = await asyncio.to_thread(
+                        self.db.get_job_status, job_uuid, session=session
+                    )
 
-            # ── 실패 처리 ──
-            # 주의: ACK 전송 단계에서 연결 끊김(heartbeat timeout 등)으로 실패한 경우,
-            # 크롤링 자체는 성공하고 DB에 COMPLETED가 이미 기록된 상태일 수 있음.
-            # 이 경우 FAILED로 덮어쓰면 안 되므로, 현재 DB 상태를 확인 후 처리.
-            if job_id:
+                    if current_status == "COMPLETED":
+                        # 이미 COMPLETED로 기록됨 → FAILED로 덮어쓰지 않음
+                        log.warning(
+                            f"ACK 전송 실패했으나 크롤링+분석은 성공 "
+                            f"(DB 상태: COMPLETED): jobId={job_id}"
+                        )
+                    else:
+                        # 실제 크롤링 실패 → FAILED 기록
+                        await asyncio.to_thread(
+                            self.db.update_job_status, job_uuid, "FAILED",
+                            error_message=str(e), session=session,
+                        )
+                        await asyncio.to_thread(self.publisher.publish, job_id, "FAILED")
+
+                # ── NACK 전송 ──
+                # requeue=False: 이 메시지를 Queue에 다시 넣지 않음 (무한 재시도 방지)
+                # → DLQ(Dead Letter Queue) 설정이 있으면 DLQ로 이동, 없으면 폐기
+                # requeue=True로 하면 큐 맨 뒤에 다시 들어가지만,
+                # 크롤링 실패는 재시도해도 대부분 같은 결과이므로 False가 적절
                 try:
-                    from app.config.database import SessionLocal
-                    from app.models.db_models import CrawlJobModel
-                    import uuid as uuid_mod
-                    session = SessionLocal()
-                    current_job = session.query(CrawlJobModel).filter(
-                        CrawlJobModel.id == uuid_mod.UUID(job_id)
-                    ).first()
-                    current_status = current_job.status if current_job else None
-                    session.close()
+                    await message.nack(requeue=False)
                 except Exception:
-                    current_status = None
+                    # 연결이 이미 끊어진 경우 NACK도 실패할 수 있음 → 무시
+                    log.warning("NACK 전송 실패 (연결 끊김)")
 
-                if current_status == "COMPLETED":
-                    # 이미 COMPLETED로 기록됨 → FAILED로 덮어쓰지 않음
-                    log.warning(
-                        f"ACK 전송 실패했으나 크롤링+분석은 성공 "
-                        f"(DB 상태: COMPLETED): jobId={job_id}"
-                    )
-                else:
-                    # 실제 크롤링 실패 → FAILED 기록
-                    self.db.update_job_status(job_id, "FAILED", error_message=str(e))
-                    self.publisher.publish(job_id, "FAILED")
-
-            # ── NACK 전송 ──
-            # requeue=False: 이 메시지를 Queue에 다시 넣지 않음 (무한 재시도 방지)
-            # → DLQ(Dead Letter Queue) 설정이 있으면 DLQ로 이동, 없으면 폐기
-            # requeue=True로 하면 큐 맨 뒤에 다시 들어가지만,
-            # 크롤링 실패는 재시도해도 대부분 같은 결과이므로 False가 적절
-            try:
-                channel.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
-            except Exception:
-                # 연결이 이미 끊어진 경우 NACK도 실패할 수 있음 → 무시
-                log.warning("NACK 전송 실패 (연결 끊김)")
+    def _create_crawlers(self) -> list:
+        """
+        언론사별 크롤러 인스턴스를 만듭니다 (Worker 수명 동안 1번).
+
+        크롤러는 작업별 상태를 갖지 않으므로(URL, Semaphore, HTTP 클라이언트만 보관)
+        메시지마다 새로 만들지 않고 재사용합니다.
+        """
+        # 크롤러 목록: (식별자명, 크롤러 인스턴스) 튜플 리스트
+        # 식별자명은 media_results dict의 키로 사용되며,
+        # Spring 측에서 언론사별 결과를 구분하는 데 활용
+        # 모든 크롤러에 같은 HTTP 클라이언트를 주입해 연결 풀/TLS 세션을 공유
+        return [
+            ("hankyung", HankyungCrawler(client=self.http)),     # 한국경제
+            ("mk", MKCrawler(client=self.http)),                 # 매일경제
+            ("edaily", EdailyCrawler(client=self.http)),          # 이데일리
+            ("herald", HeraldCrawler(client=self.http)),          # 헤럴드경제
+            ("chosunbiz", ChosunbizCrawler(client=self.http)),    # 조선비즈
+            # ("yahoo", YahooCrawler(client=self.http)),          # Yahoo Finance (비활성화)
+        ]
 
-    async def _run_all_crawlers(self, max_articles: int) -> dict:
+    async def _run_all_crawlers(self, max_articles: int, session=None) -> dict:
         """
-        등록된 모든 크롤러를 순차 실행하고 분석 후 저장합니다.
+        등록된 모든 크롤러를 동시 실행하고, 끝난 언론사부터 분석 후 저장합니다.
 
         실행 순서:
-          1. 크롤러 인스턴스 리스트 생성
-          2. 각 크롤러의 crawl() 메서드 호출 (비동기, 최대 max_articles건 수집)
-          3. 수집된 뉴스 리스트에 분석 파이프라인 적용
-          4. DBManager.save_news_with_analysis()로 1건씩 PostgreSQL에 저장
-          5. URL 중복 뉴스는 자동 스킵 (save_news_with_analysis에서 처리)
+          1. start()에서 만들어 둔 크롤러 인스턴스 재사용 (없으면 이때 생성)
+          2. 모든 크롤러의 crawl()을 asyncio.gather로 동시 실행 (최대 max_articles건 수집)
+             → 전체 소요 시간이 "언론사별 시간의 합"에서 "가장 느린 언론사 시간"으로 줄어듦
+          3. crawl()이 yield하는 뉴스를 save_batch_size건씩 모아 asyncio.Queue에 넣음
+             (크롤링이 끝나면 남은 뉴스도 넣음)
+          4. 저장 태스크 1개가 큐에서 꺼내 분석 + save_news_with_analysis_bulk()로 일괄 저장
+             → 느린 언론사가 크롤링하는 동안 먼저 모인 배치의 분석/DB 저장이 진행됨
+          5. URL 중복 뉴스는 자동 스킵 (ON CONFLICT (url) DO NOTHING)
           6. 특정 크롤러 실패 시 해당 크롤러만 0건으로 기록, 나머지는 계속 진행
 
         Args:
             max_articles: 언론사당 최대 수집할 기사 수
                           예: 50이면 한경 50건, 매경 50건, ... (최대 총 300건)
+            session:      저장에 재사용할 DB 세션 (None이면 저장마다 새로 열고 닫음)
 
         Returns:
             언론사별 성공적으로 저장된 기사 수 dict
@@ -331,46 +374,102 @@ class CrawlConsumer:
                  "herald": 50, "chosunbiz": 33, "yahoo": 47}
             (중복 URL로 스킵된 건수는 제외)
         """
-        # 크롤러 목록: (식별자명, 크롤러 인스턴스) 튜플 리스트
-        # 식별자명은 media_results dict의 키로 사용되며,
-        # Spring 측에서 언론사별 결과를 구분하는 데 활용
-        crawlers = [
-            ("hankyung", HankyungCrawler()),     # 한국경제
-            ("mk", MKCrawler()),                 # 매일경제
-            ("edaily", EdailyCrawler()),          # 이데일리
-            ("herald", HeraldCrawler()),          # 헤럴드경제
-            ("chosunbiz", ChosunbizCrawler()),    # 조선비즈
-            # ("yahoo", YahooCrawler()),          # Yahoo Finance (비활성화)
-        ]
+        if self.crawlers is None:
+            self.crawlers = self._create_crawlers()
+        crawlers = self.crawlers
 
         media_results = {}  # 언론사별 저장 건수를 누적할 dict
 
-        for name, crawler in crawlers:
-            try:
-                log.info(f"{name} 크롤링 시작")
+        # 크롤러(생산자) → 큐 → 저장 태스크(소비자 1개)
+        # 저장 태스크가 1개뿐이므로 DB 세션을 동시에 쓰지 않음
+        # 큐 크기를 제한해 저장이 밀리면 크롤러가 기다리도록 함 (메모리 상한 = 크롤러 수 × 배치 크기)
+        queue = asyncio.Queue(maxsize=len(crawlers))
+        writer = asyncio.create_task(self._save_results(queue, session, media_results))
 
-                # crawler.crawl(): 비동기 메서드로, CrawledNews 객체 리스트 반환
-                # max_news: 이 언론사에서 최대 수집할 기사 수
-                news_list = await crawler.crawl(max_news=max_articles)
-                analyzed_list = self._analyze_news_batch(news_list)
+        try:
+            # 크롤링(HTTP 대기)은 언론사끼리 겹쳐서 실행
+            # _crawl_one이 예외를 잡아 모은 만큼만 넣으므로 한 언론사 실패가 다른 언론사에 영향 없음
+            await asyncio.gather(
+                *(self._crawl_one(name, crawler, max_articles, queue) for name, crawler in crawlers),
+                return_exceptions=True,
+            )
+        finally:
+            # 종료 신호(None)를 넣고 남은 저장이 끝날 때까지 대기
+            await queue.put(None)
+            await writer
 
-                # 수집된 뉴스를 1건씩 DB에 저장
-                # save_news_with_analysis()는 URL 중복 시 False를 반환
-                success_count = 0
-                for news in analyzed_list:
-                    if self.db.save_news_with_analysis(news):
-                        success_count += 1
+        # 결과를 못 넣은 언론사는 0건, 키 순서는 크롤러 목록 순서로 고정
+        return {name: media_results.get(name, 0) for name, _ in crawlers}
 
-                media_results[name] = success_count
-                log.info(f"{name} 완료: {success_count}/{len(news_list)}건 저장 (분석 포함)")
+    async def _crawl_one(self, name: str, crawler, max_articles: int, queue: asyncio.Queue):
+        """
+        크롤러 1개를 실행하고 (언론사명, 뉴스 배치)를 save_batch_size건씩 저장 큐에 넣습니다.
+
+        실패 시 예외를 올리지 않고 그때까지 모은 뉴스만 넣으므로
+        gather로 함께 실행 중인 다른 크롤러는 영향을 받지 않습니다.
+        """
+        batch = []
+        try:
+            log.info(f"{name} 크롤링 시작")
+            # crawler.crawl(): async generator로, 파싱이 끝난 CrawledNews를 하나씩 yield
+            # max_news: 이 언론사에서 최대 수집할 기사 수
+            async for news in crawler.crawl(max_news=max_articles):
+                batch.append(news)
+                if len(batch) >= self.save_batch_size:
+                    await queue.put((name, batch))
+                    batch = []
+        except Exception as e:
+            log.error(f"{name} 크롤링 실패: {e}")
+        # 남은 뉴스 (없어도 넣어서 해당 언론사를 0건으로 기록)
+        await queue.put((name, batch))
+
+    async def _save_results(self, queue: asyncio.Queue, session, media_results: dict):
+        """
+        저장 큐를 비우며 언론사별 뉴스 배치를 분석 후 일괄 저장합니다 (종료 신호: None).
+
+        한 언론사의 배치가 여러 번 들어올 수 있으므로 저장 건수는 언론사별로 누적합니다.
+
+        분석(CPU)과 DB 드라이버(psycopg2)는 동기 방식이므로 별도 스레드에서 실행해
+        다른 크롤러의 HTTP 요청이 진행되는 이벤트 루프를 막지 않습니다.
+        """
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+
+            name, news_list = item
+            media_results.setdefault(name, 0)
+            if not news_list:
+                continue
+            try:
+                success_count = await asyncio.to_thread(
+                    self._analyze_and_save, news_list, session
+                )
+                media_results[name] += success_count
+                log.info(f"{name} 배치 저장: {success_count}/{len(news_list)}건 (분석 포함)")
 
             except Exception as e:
-                # 특정 크롤러 실패 시 해당 크롤러만 0건 기록
-                # 나머지 크롤러는 정상 진행 (전체 중단하지 않음)
-                log.error(f"{name} 크롤링+분석 실패: {e}")
-                media_results[name] = 0
+                # 특정 배치 실패 시 해당 배치만 0건으로 처리
+                # 나머지 배치/크롤러는 정상 진행 (전체 중단하지 않음)
+                log.error(f"{name} 분석+저장 실패: {e}")
 
-        return media_results
+    def _analyze_and_save(self, news_list: list, session) -> int:
+        """
+        뉴스 리스트를 분석한 뒤 INSERT 1회 + COMMIT 1회로 저장하고 저장 건수를 반환합니다.
+
+        COMMIT이 끝난 뒤에만 중복 필터에 등록합니다.
+        (저장이 ROLLBACK되면 예외가 올라오므로 등록되지 않고 다음 크롤링에서 다시 수집)
+          - RETURNING으로 돌아온 URL: 새로 저장된 기사 → URL + 본문 등록
+          - 나머지: ON CONFLICT로 스킵된 기사 (이미 DB에 있음) → URL만 등록
+        """
+        analyzed_list = self._analyze_news_batch(news_list)
+        inserted_urls = set(self.db.save_news_with_analysis_bulk(analyzed_list, session=session))
+        for news in analyzed_list:
+            if news.url in inserted_urls:
+                remember_saved(news.url, news.content)
+            else:
+                remember_saved(news.url)
+        return len(inserted_urls)
 
     def _analyze_news_batch(self, news_list: list) -> list:
         """
@@ -8,7 +8,7 @@
 
 메시지 흐름:
   publish() 호출
-    → Python dict → JSON 문자열로 직렬화 (json.dumps)
+    → Python dict → JSON bytes로 직렬화 (orjson.dumps)
     → pika로 RabbitMQ에 연결
     → Exchange(lucr.crawl.exchange)에 "crawl.result" Routing Key로 발행
     → RabbitMQ가 Binding 규칙에 따라 Result Queue(lucr.crawl.result)로 라우팅
@@ -23,14 +23,14 @@ Spring 측 대응:
 @since 2026-02-06
 """
 import pika
-import json
-import os
-from dotenv import load_dotenv
+import orjson
+import threading
+from typing import Optional
+from pika.exceptions import AMQPChannelError, AMQPConnectionError
 
+from app.config.settings import Settings, get_settings
 from app.utils.logger import log
 
-load_dotenv()
-
 
 class CrawlResultPublisher:
     """
@@ -40,8 +40,12 @@ class CrawlResultPublisher:
       - Spring CrawlJobPublisher: 요청 발행 (crawl.request)
       - Python CrawlResultPublisher: 결과 발행 (crawl.result)
 
-    매 publish() 호출마다 새 연결을 생성하고 닫습니다.
-    크롤링 완료 시 1번만 호출되므로 연결 풀 없이 단순 구조로 충분합니다.
+    연결/채널은 첫 publish() 때 열어 두고 재사용합니다.
+      - 매 발행마다 TCP + AMQP 핸드셰이크를 반복하지 않음
+      - 연결이 끊겨 있으면 (유휴 중 heartbeat 만료 등) 새로 연결해 1번 재시도
+      - Publisher Confirm을 켜서 브로커가 거부한 발행을 예외로 확인
+      - Consumer가 asyncio.to_thread()로 여러 스레드에서 호출하므로 Lock으로 직렬화
+      - Worker 종료 시 close()로 연결을 닫음
     """
 
     # ── Spring RabbitMQConfig.java와 동일한 상수 ──
@@ -50,11 +54,14 @@ class CrawlResultPublisher:
     # Routing Key: Exchange가 이 키를 보고 lucr.crawl.result Queue로 라우팅
     ROUTING_KEY = "crawl.result"
 
-    def __init__(self):
+    def __init__(self, settings: Optional[Settings] = None):
         """
         RabbitMQ 연결 파라미터 초기화
 
-        .env에서 읽어오는 값:
+        Args:
+            settings: Worker 설정 (None이면 get_settings()로 프로세스 공용 설정 사용)
+
+        Settings가 .env에서 읽어오는 값:
           - RABBITMQ_HOST: RabbitMQ 서버 주소 (기본: localhost)
           - RABBITMQ_PORT: AMQP 포트 (기본: 5672, 관리 UI는 15672)
           - RABBITMQ_USER: 인증 사용자명
@@ -63,15 +70,46 @@ class CrawlResultPublisher:
         PlainCredentials: 평문 사용자/비밀번호 인증 방식
         ConnectionParameters: 연결 시 사용할 호스트/포트/인증 정보를 묶은 객체
         """
+        settings = settings or get_settings()
         credentials = pika.PlainCredentials(
-            os.getenv("RABBITMQ_USER", "charlie0701"),
-            os.getenv("RABBITMQ_PASSWORD", "alpha5059"),
+            settings.rabbitmq_user,
+            settings.rabbitmq_password,
         )
         self.params = pika.ConnectionParameters(
-            host=os.getenv("RABBITMQ_HOST", "localhost"),
-            port=int(os.getenv("RABBITMQ_PORT", "5672")),
+            host=settings.rabbitmq_host,
+            port=settings.rabbitmq_port,
             credentials=credentials,
         )
+        self._conn = None    # 재사용할 BlockingConnection (첫 발행 시 생성)
+        self._ch = None      # 재사용할 Channel
+        # BlockingConnection은 스레드 안전하지 않으므로 발행/종료를 직렬화
+        self._lock = threading.Lock()
+
+    def _ensure_channel(self):
+        """연결/채널이 없거나 닫혀 있으면 새로 열고 Publisher Confirm 활성화"""
+        if self._conn is None or self._conn.is_closed or self._ch is None or self._ch.is_closed:
+            self._reset()
+            self._conn = pika.BlockingConnection(self.params)
+            self._ch = self._conn.channel()
+            # Publisher Confirm: 브로커가 메시지를 받았는지 basic_publish에서 확인
+            # (거부되면 NackError 예외 → 조용히 유실되지 않음)
+            self._ch.confirm_delivery()
+        return self._ch
+
+    def _reset(self):
+        """현재 연결을 (열려 있으면) 닫고 참조를 비움"""
+        if self._conn is not None and self._conn.is_open:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+        self._conn = None
+        self._ch = None
+
+    def close(self):
+        """재사용 중인 연결 종료 (Worker 종료 시 호출)"""
+        with self._lock:
+            self._reset()
 
     def publish(self, job_id: str, status: str,
                 total_articles: int = 0, media_results: dict = None):
@@ -104,30 +142,32 @@ class CrawlResultPublisher:
             "mediaResults": media_results or {},
         }
 
+        # orjson.dumps는 bytes를 반환하므로 basic_publish에 바로 전달 (encode 불필요)
+        body = orjson.dumps(message)
+        properties = pika.BasicProperties(
+            content_type="application/json",  # Spring이 JSON으로 인식
+            delivery_mode=2,  # 2 = persistent (메시지 영속화)
+            #   1 = transient (메모리만, RabbitMQ 재시작 시 소실)
+            #   2 = persistent (디스크 저장, RabbitMQ 재시작 시에도 유지)
+        )
+
         try:
-            # 1. RabbitMQ에 TCP 연결 생성
-            #    BlockingConnection: 동기 방식 연결 (메시지 1개 보내고 닫으므로 적합)
-            connection = pika.BlockingConnection(self.params)
-
-            # 2. Channel 생성 (하나의 Connection 안에서 논리적 통신 경로)
-            #    실제 메시지 발행/소비는 Channel을 통해 수행
-            channel = connection.channel()
-
-            # 3. 메시지 발행
-            channel.basic_publish(
-                exchange=self.EXCHANGE,       # 목적지 Exchange (Topic Exchange)
-                routing_key=self.ROUTING_KEY,  # Exchange가 Queue를 찾는 키
-                body=json.dumps(message),      # Python dict → JSON 문자열
-                properties=pika.BasicProperties(
-                    content_type="application/json",  # Spring이 JSON으로 인식
-                    delivery_mode=2,  # 2 = persistent (메시지 영속화)
-                    #   1 = transient (메모리만, RabbitMQ 재시작 시 소실)
-                    #   2 = persistent (디스크 저장, RabbitMQ 재시작 시에도 유지)
-                ),
-            )
-
-            # 4. 연결 종료 (리소스 해제)
-            connection.close()
+            with self._lock:
+                # 1. 재사용 중인 Channel로 발행
+                #    연결이 끊겼으면(StreamLostError, ConnectionClosed 등) 새로 연결해 1번만 재시도
+                for attempt in range(2):
+                    try:
+                        self._ensure_channel().basic_publish(
+                            exchange=self.EXCHANGE,       # 목적지 Exchange (Topic Exchange)
+                            routing_key=self.ROUTING_KEY,  # Exchange가 Queue를 찾는 키
+                            body=body,                     # Python dict → JSON bytes
+                            properties=properties,
+                        )
+                        break
+                    except (AMQPConnectionError, AMQPChannelError):
+                        self._reset()
+                        if attempt == 1:
+                            raise
 
             log.info(f"완료 이벤트 발행: jobId={job_id}, status={status}, total={total_articles}")
 
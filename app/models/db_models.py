@@ -24,7 +24,7 @@ from sqlalchemy import (
     String,
     Text,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 import uuid
 from datetime import datetime
 
@@ -62,13 +62,18 @@ class CrawlJobModel(Base):
     컬럼 매핑 예시:
       Java:   @Column(name = "status", nullable = false, length = 20)
       Python: status = Column(String(20), nullable=False, default="PENDING")
+
+    media_results:
+      dict를 그대로 대입하면 SQLAlchemy가 직렬화합니다 (json.dumps 불필요).
+      JSONB로 매핑해도 파라미터는 JSON 문자열로 전달되므로 기존 TEXT 컬럼에도 저장되며,
+      Spring Entity 컬럼을 jsonb로 바꾸면 DB에서 바이너리 형태로 저장/조회됩니다.
     """
     __tablename__ = "crawl_jobs"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     status = Column(String(20), nullable=False, default="PENDING")
     total_articles = Column(Integer, default=0)
-    media_results = Column(Text)
+    media_results = Column(JSONB(none_as_null=True))
     error_message = Column(Text)
     created_at = Column(DateTime, default=datetime.now)
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
@@ -1,5 +1,8 @@
 """
-Pydantic 모델 정의
+뉴스 모델 정의
+
+  - NewsCreate:  Spring API로 보내는 요청 DTO (Pydantic)
+  - CrawledNews: 크롤러 → 분석기 → 저장 경로로 전달되는 내부 데이터 (slots dataclass)
 
 CrawledNews 분석 결과 필드:
   - sentiment_score: 감정 분석 점수 (-1.00 ~ 1.00)
@@ -9,6 +12,7 @@ CrawledNews 분석 결과 필드:
 @author Ekko0701
 @since 2026-03-03
 """
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from typing import Dict, List, Optional
@@ -43,10 +47,14 @@ class NewsCreate(BaseModel):
         }
 
 
-class CrawledNews(BaseModel):
+@dataclass(slots=True)
+class CrawledNews:
     """
     크롤링한 원본 뉴스 데이터
 
+    내부 전달용 타입이므로 pydantic 대신 slots dataclass를 사용한다.
+    (필드 검증/`__dict__` 비용 없음, HTTP 전송 시 검증은 to_create_dto()의 NewsCreate가 담당)
+
     분석 결과 필드:
         sentiment_score: SentimentAnalyzer가 계산한 감정 점수
                          None이면 분석 전 또는 분석 실패 상태
@@ -68,13 +76,8 @@ class CrawledNews(BaseModel):
 
     # ── 분석 결과 필드 ──
     sentiment_score: Optional[float] = None
-    keywords: List[str] = Field(default_factory=list)
-    stock_codes: Dict[str, int] = Field(default_factory=dict)
-
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
+    keywords: List[str] = field(default_factory=list)
+    stock_codes: Dict[str, int] = field(default_factory=dict)
 
     def to_create_dto(self) -> NewsCreate:
         """
@@ -82,6 +85,8 @@ class CrawledNews(BaseModel):
 
         참고:
           Worker 직접 저장 경로에서는 이 메서드가 호출되지 않는다.
+          크롤러마다 제목 길이 처리가 달라서, 길이 제약(title 5~500자, content 1자 이상)을
+          Spring 400 응답이 아니라 여기서 ValidationError로 먼저 걸러낸다.
         """
         sentiment = None
         if self.sentiment_score is not None:
@@ -9,54 +9,84 @@ DB Manager - PostgreSQL 직접 저장
 @author Ekko0701
 @since 2026-02-06
 """
+from contextlib import contextmanager
 from datetime import datetime
 from decimal import Decimal
-import json
 import uuid
 
+from sqlalchemy import text as sql_text, update
+from sqlalchemy.dialects.postgresql import insert
+
 from app.config.database import SessionLocal
 from app.models.db_models import CrawlJobModel, Keyword, News, NewsKeyword, NewsStock
 from app.utils.logger import log
 
 
 class DBManager:
-    """PostgreSQL 직접 저장 매니저"""
+    """
+    PostgreSQL 직접 저장 매니저
+
+    모든 저장/조회 메서드는 session 인자를 선택적으로 받습니다.
+    Worker는 session_scope()로 작업(Job)당 세션 1개를 열어 넘기고,
+    각 메서드는 단계별로 commit만 수행합니다 (세션 획득/반납은 Job당 1회).
+    """
+
+    @contextmanager
+    def session_scope(self):
+        """
+        작업 1건 동안 재사용할 세션을 열고, 블록이 끝나면 닫습니다.
+
+        commit/rollback은 세션을 넘겨받은 각 메서드가 단계별로 수행합니다.
+
+        사용법:
+            with db.session_scope() as session:
+                db.update_job_status(job_id, "RUNNING", session=session)
+        """
+        session = SessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
 
-    def save_news(self, news_data) -> bool:
+    def save_news(self, news_data, session=None) -> bool:
         """
-        뉴스 1건 저장 (중복 URL 체크 포함)
+        뉴스 1건 저장 (중복 URL은 DB가 스킵)
+
+        사전 SELECT 없이 INSERT ... ON CONFLICT (url) DO NOTHING 1번으로 처리합니다.
+        news.url의 UNIQUE 인덱스가 중복 판정을 대신하므로 왕복이 1회로 줄어듭니다.
 
         참고:
             분석 결과까지 함께 저장해야 할 때는 save_news_with_analysis()를 사용합니다.
 
         Args:
             news_data: CrawledNews 객체 (app.models.news.CrawledNews)
+            session: 재사용할 세션 (None이면 새로 열고 닫음)
 
         Returns:
             True: 저장 성공, False: 중복 또는 실패
         """
-        session = SessionLocal()
+        owned = session is None
+        if owned:
+            session = SessionLocal()
         try:
-            # URL 중복 확인
-            exists = session.query(News).filter(News.url == news_data.url).first()
-            if exists:
-                log.debug(f"중복 URL 스킵: {news_data.url}")
-                return False
-
-            # News 객체 생성 및 저장
-            news = News(
+            now = datetime.now()
+            stmt = insert(News).values(
                 id=uuid.uuid4(),
                 title=news_data.title,
                 content=news_data.content,
                 url=news_data.url,
                 source=news_data.source,
                 published_at=news_data.published_at,
-                crawled_at=datetime.now(),
-                created_at=datetime.now(),
-                updated_at=datetime.now(),
-            )
-            session.add(news)
+                crawled_at=now,
+                created_at=now,
+                updated_at=now,
+            ).on_conflict_do_nothing(index_elements=["url"])
+            result = session.execute(stmt)
             session.commit()
+
+            if result.rowcount != 1:
+                log.debug("중복 URL 스킵: {}", news_data.url)
+                return False
             return True
 
         except Exception as e:
@@ -64,9 +94,61 @@ class DBManager:
             log.error(f"뉴스 저장 실패: {e}")
             return False
         finally:
-            session.close()
+            if owned:
+                session.close()
 
-    def save_news_with_analysis(self, news_data) -> bool:
+    def save_news_bulk(self, news_list: list, session=None) -> int:
+        """
+        뉴스 여러 건을 INSERT 1회로 저장 (중복 URL은 DB가 스킵)
+
+        save_news()를 건별로 호출하면 (SELECT + INSERT + COMMIT) × N번 왕복하지만,
+        이 메서드는 INSERT ... ON CONFLICT (url) DO NOTHING 1번으로 처리합니다.
+        news.url의 UNIQUE 인덱스가 중복 판정을 대신합니다.
+
+        Args:
+            news_list: CrawledNews 객체 리스트
+            session: 재사용할 세션 (None이면 새로 열고 닫음)
+
+        Returns:
+            실제로 저장된 건수 (중복 URL 제외), 실패 시 0
+        """
+        if not news_list:
+            return 0
+
+        now = datetime.now()
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "title": news_data.title,
+                "content": news_data.content,
+                "url": news_data.url,
+                "source": news_data.source,
+                "published_at": news_data.published_at,
+                "crawled_at": now,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for news_data in news_list
+        ]
+
+        owned = session is None
+        if owned:
+            session = SessionLocal()
+        try:
+            stmt = insert(News).values(rows).on_conflict_do_nothing(index_elements=["url"])
+            result = session.execute(stmt)
+            session.commit()
+            return result.rowcount
+
+        except Exception as e:
+            session.rollback()
+            log.error(f"뉴스 일괄 저장 실패: {e}")
+            return 0
+        finally:
+            if owned:
+                session.close()
+
+    def save_news_with_analysis(self, news_data, session=None) -> bool:
         """
         뉴스 + 분석 결과를 하나의 트랜잭션에서 저장합니다.
 
@@ -82,23 +164,24 @@ class DBManager:
 
         Args:
             news_data: CrawledNews 객체 (analysis 필드 포함)
+            session: 재사용할 세션 (None이면 새로 열고 닫음)
 
         Returns:
             True: 저장 성공, False: 중복 URL 또는 예외
         """
-        session = SessionLocal()
+        owned = session is None
+        if owned:
+            session = SessionLocal()
         try:
             # 1) URL 중복 확인
             exists = session.query(News).filter(News.url == news_data.url).first()
             if exists:
-                log.debug(f"중복 URL 스킵: {news_data.url}")
+                log.debug("중복 URL 스킵: {}", news_data.url)
                 return False
 
             # 2) 뉴스 저장 (감정 점수 포함)
-            sentiment = None
-            if news_data.sentiment_score is not None:
-                clamped = max(-1.0, min(1.0, news_data.sentiment_score))
-                sentiment = Decimal(str(round(clamped, 2)))
+            sentiment = self._to_sentiment(news_data.sentiment_score)
+            now = datetime.now()
 
             news = News(
                 id=uuid.uuid4(),
@@ -107,10 +190,10 @@ class DBManager:
                 url=news_data.url,
                 source=news_data.source,
                 published_at=news_data.published_at,
-                crawled_at=datetime.now(),
+                crawled_at=now,
                 sentiment_score=sentiment,
-                created_at=datetime.now(),
-                updated_at=datetime.now(),
+                created_at=now,
+                updated_at=now,
             )
             session.add(news)
             session.flush()  # news.id 확보
@@ -118,20 +201,22 @@ class DBManager:
             # 3) 키워드 저장
             keywords = getattr(news_data, "keywords", []) or []
             if keywords:
-                self._save_keywords(session, news, keywords)
+                self._save_keywords(session, news.id, keywords)
 
             # 4) 종목 언급 저장
             stock_codes = getattr(news_data, "stock_codes", {}) or {}
             if stock_codes:
-                self._save_stock_mentions(session, news, stock_codes)
+                self._save_stock_mentions(session, news.id, stock_codes)
 
             # 5) 전체 커밋
             session.commit()
-            log.debug(
-                f"뉴스+분석 저장 완료: '{news_data.title[:30]}...' "
-                f"| sentiment={news_data.sentiment_score} "
-                f"| keywords={keywords[:3]} "
-                f"| stocks={list(stock_codes.keys())[:3]}"
+            # 슬라이싱/리스트 변환은 DEBUG를 받는 sink가 있을 때만 수행 (lazy)
+            log.opt(lazy=True).debug(
+                "뉴스+분석 저장 완료: '{}...' | sentiment={} | keywords={} | stocks={}",
+                lambda: news_data.title[:30],
+                lambda: news_data.sentiment_score,
+                lambda: keywords[:3],
+                lambda: list(stock_codes.keys())[:3],
             )
             return True
 
@@ -140,62 +225,174 @@ class DBManager:
             log.error(f"뉴스+분석 저장 실패: {e}")
             return False
         finally:
-            session.close()
+            if owned:
+                session.close()
 
-    def _save_keywords(self, session, news: News, keywords: list[str]):
+    def save_news_with_analysis_bulk(self, news_list: list, session=None) -> list[str]:
         """
-        키워드를 keywords / news_keywords 테이블에 저장합니다.
+        뉴스 + 분석 결과 여러 건을 하나의 트랜잭션에서 저장합니다.
 
-        - keywords: 동일 단어는 frequency를 1 증가 (UPSERT 성격)
-        - news_keywords: 뉴스-키워드 매핑 + rank 기반 tfidf_score 저장
+        save_news_with_analysis()를 건별로 호출하면 (SELECT + INSERT + COMMIT) × N번
+        왕복하지만, 이 메서드는 뉴스를 INSERT ... ON CONFLICT (url) DO NOTHING
+        RETURNING id, url 1번으로 저장하고, 실제로 INSERT된 뉴스에만
+        키워드/종목 언급을 저장한 뒤 1번 COMMIT합니다.
+        중복 판정은 news.url의 UNIQUE 인덱스가 대신합니다 (사전 SELECT 없음).
 
-        COMMIT은 호출자(save_news_with_analysis)에서 수행합니다.
-        """
-        seen_words: set[str] = set()
+        중간 단계에서 예외가 나면 배치 전체를 ROLLBACK하고 예외를 다시 올립니다.
+        (호출자가 저장되지 않은 배치를 중복 필터에 등록하지 않도록 실패를 숨기지 않음)
 
-        for rank, raw_word in enumerate(keywords):
-            word = (raw_word or "").strip()
-            if not word or word in seen_words:
-                continue
-            seen_words.add(word)
-
-            keyword_obj = session.query(Keyword).filter(Keyword.word == word).first()
-            if keyword_obj:
-                keyword_obj.frequency += 1
-                keyword_obj.updated_at = datetime.now()
-            else:
-                keyword_obj = Keyword(
-                    id=uuid.uuid4(),
-                    word=word,
-                    frequency=1,
-                    created_at=datetime.now(),
-                    updated_at=datetime.now(),
-                )
-                session.add(keyword_obj)
-                session.flush()  # keyword_id 확보
+        Args:
+            news_list: CrawledNews 객체 리스트 (analysis 필드 포함)
+            session: 재사용할 세션 (None이면 새로 열고 닫음)
 
-            # rank(0-based) 기반 점수: 1.00, 0.90, ... 최소 0.10
-            tfidf_score = max(
-                Decimal("0.10"),
-                Decimal("1.00") - Decimal(str(rank)) * Decimal("0.10"),
+        Returns:
+            실제로 INSERT된 뉴스 URL 리스트 (RETURNING 결과, 중복 URL 제외)
+        """
+        if not news_list:
+            return []
+
+        # 같은 배치 안의 중복 URL은 먼저 온 1건만 사용
+        # (DO NOTHING은 배치 내 중복도 스킵하지만, RETURNING의 url → 뉴스 매핑이
+        #  1:1이어야 INSERT된 행에 어느 뉴스의 분석 결과를 붙일지 모호하지 않음)
+        by_url = {}
+        for news_data in news_list:
+            by_url.setdefault(news_data.url, news_data)
+
+        now = datetime.now()
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "title": news_data.title,
+                "content": news_data.content,
+                "url": url,
+                "source": news_data.source,
+                "published_at": news_data.published_at,
+                "crawled_at": now,
+                "sentiment_score": self._to_sentiment(news_data.sentiment_score),
+                "created_at": now,
+                "updated_at": now,
+            }
+            for url, news_data in by_url.items()
+        ]
+
+        owned = session is None
+        if owned:
+            session = SessionLocal()
+        try:
+            # 1) 뉴스 일괄 저장: 중복 URL은 DB가 스킵하고, INSERT된 행의 (id, url)만 반환
+            stmt = (
+                insert(News)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=["url"])
+                .returning(News.id, News.url)
             )
+            inserted = session.execute(stmt).all()
 
-            session.add(
-                NewsKeyword(
-                    news_id=news.id,
-                    keyword_id=keyword_obj.id,
-                    tfidf_score=tfidf_score,
-                    created_at=datetime.now(),
-                )
+            # 2) 새로 저장된 뉴스에만 키워드/종목 언급 저장
+            for news_id, url in inserted:
+                news_data = by_url[url]
+
+                keywords = getattr(news_data, "keywords", []) or []
+                if keywords:
+                    self._save_keywords(session, news_id, keywords)
+
+                stock_codes = getattr(news_data, "stock_codes", {}) or {}
+                if stock_codes:
+                    self._save_stock_mentions(session, news_id, stock_codes)
+
+            # 3) 전체 커밋
+            session.commit()
+            # 중복 URL은 건별로 찍지 않고 배치당 한 줄로 요약
+            log.debug(
+                "뉴스+분석 일괄 저장 완료: inserted={} dup_skipped={}",
+                len(inserted), len(news_list) - len(inserted),
             )
+            return [url for _, url in inserted]
 
-    def _save_stock_mentions(self, session, news: News, stock_codes: dict[str, int]):
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            if owned:
+                session.close()
+
+    @staticmethod
+    def _as_uuid(job_id: str | uuid.UUID) -> uuid.UUID:
+        """이미 파싱된 uuid.UUID는 그대로, 문자열이면 파싱해서 반환"""
+        return job_id if isinstance(job_id, uuid.UUID) else uuid.UUID(job_id)
+
+    @staticmethod
+    def _to_sentiment(score):
+        """감정 점수를 -1.00 ~ 1.00 범위의 Decimal(소수 2자리)로 변환 (None은 그대로)"""
+        if score is None:
+            return None
+        clamped = max(-1.0, min(1.0, score))
+        return Decimal(str(round(clamped, 2)))
+
+    def _save_keywords(self, session, news_id: uuid.UUID, keywords: list[str]):
+        """
+        키워드를 keywords / news_keywords 테이블에 저장합니다.
+
+        - keywords: INSERT ... ON CONFLICT (word) DO UPDATE 1번으로 저장
+          (이미 있는 단어는 frequency를 1 증가, 사전 SELECT 없이 동시 저장에도 안전)
+        - news_keywords: 뉴스-키워드 매핑 + rank 기반 tfidf_score를 INSERT 1번으로 저장
+
+        COMMIT은 호출자(save_news_with_analysis / save_news_with_analysis_bulk)에서 수행합니다.
+        """
+        # 같은 단어는 먼저 나온(rank가 높은) 1건만 사용
+        # (ON CONFLICT DO UPDATE는 한 INSERT 안에서 같은 행을 두 번 갱신하면 에러)
+        ranks: dict[str, int] = {}
+        for rank, raw_word in enumerate(keywords):
+            word = (raw_word or "").strip()
+            if word:
+                ranks.setdefault(word, rank)
+        if not ranks:
+            return
+
+        now = datetime.now()  # 키워드마다 시계를 읽지 않도록 1번만 계산
+
+        stmt = insert(Keyword).values([
+            {
+                "id": uuid.uuid4(),
+                "word": word,
+                "frequency": 1,
+                "created_at": now,
+                "updated_at": now,
+            }
+            # 단어 순으로 정렬해 트랜잭션끼리 같은 순서로 행 잠금을 잡음
+            # (rank 순이면 키워드가 겹치는 동시 배치가 반대 순서로 잠가 데드락 발생)
+            for word in sorted(ranks)
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["word"],
+            set_={"frequency": Keyword.frequency + 1, "updated_at": now},
+        ).returning(Keyword.id, Keyword.word)
+        # RETURNING 순서는 VALUES 순서를 보장하지 않으므로 word 기준으로 매핑
+        keyword_ids = {word: keyword_id for keyword_id, word in session.execute(stmt).all()}
+
+        session.execute(
+            insert(NewsKeyword).values([
+                {
+                    "news_id": news_id,
+                    "keyword_id": keyword_ids[word],
+                    # rank(0-based) 기반 점수: 1.00, 0.90, ... 최소 0.10
+                    "tfidf_score": max(
+                        Decimal("0.10"),
+                        Decimal("1.00") - Decimal(str(rank)) * Decimal("0.10"),
+                    ),
+                    "created_at": now,
+                }
+                for word, rank in ranks.items()
+            ])
+        )
+
+    def _save_stock_mentions(self, session, news_id: uuid.UUID, stock_codes: dict[str, int]):
         """
         종목 언급 정보를 news_stocks 테이블에 저장합니다.
 
         외래키 제약을 위해 stocks 테이블에 존재하는 종목코드만 저장합니다.
         """
-        from sqlalchemy import text as sql_text
+        now = datetime.now()
 
         for stock_code, mention_count in stock_codes.items():
             code = (stock_code or "").strip()
@@ -207,54 +404,64 @@ class DBManager:
                 {"code": code},
             ).fetchone()
             if not exists:
-                log.debug(f"종목코드 미등록, 스킵: {code}")
+                log.debug("종목코드 미등록, 스킵: {}", code)
                 continue
 
             safe_count = int(mention_count) if mention_count and mention_count > 0 else 1
 
             session.add(
                 NewsStock(
-                    news_id=news.id,
+                    news_id=news_id,
                     stock_code=code,
                     mention_count=safe_count,
-                    created_at=datetime.now(),
+                    created_at=now,
                 )
             )
 
-    def update_job_status(self, job_id: str, status: str,
+    def update_job_status(self, job_id: str | uuid.UUID, status: str,
                           total_articles: int = 0,
                           media_results: dict = None,
-                          error_message: str = None):
+                          error_message: str = None,
+                          session=None):
         """
         CrawlJob 상태 업데이트
 
         Args:
-            job_id: 작업 UUID (문자열)
+            job_id: 작업 UUID (uuid.UUID 또는 문자열)
             status: 변경할 상태 ("RUNNING" / "COMPLETED" / "FAILED")
             total_articles: 수집된 총 기사 수
             media_results: 언론사별 수집 결과 dict
             error_message: 실패 시 에러 메시지
+            session: 재사용할 세션 (None이면 새로 열고 닫음)
         """
-        session = SessionLocal()
+        owned = session is None
+        if owned:
+            session = SessionLocal()
         try:
-            job = session.query(CrawlJobModel).filter(
-                CrawlJobModel.id == uuid.UUID(job_id)
-            ).first()
-
-            if not job:
-                log.error(f"CrawlJob을 찾을 수 없음: {job_id}")
-                return
-
-            job.status = status
-            job.updated_at = datetime.now()
+            now = datetime.now()
+            fields = {"status": status, "updated_at": now}
 
             if status == "COMPLETED":
-                job.total_articles = total_articles
-                job.media_results = json.dumps(media_results) if media_results else None
-                job.completed_at = datetime.now()
+                fields["total_articles"] = total_articles
+                # JSONB 컬럼이므로 dict를 그대로 전달 (직렬화는 SQLAlchemy가 처리)
+                fields["media_results"] = media_results or None
+                fields["completed_at"] = now
             elif status == "FAILED":
-                job.error_message = error_message
-                job.completed_at = datetime.now()
+                fields["error_message"] = error_message
+                fields["completed_at"] = now
+
+            # SELECT 후 객체를 수정하지 않고 UPDATE 1번으로 처리 (왕복 1회, ORM 객체 생성 없음)
+            stmt = (
+                update(CrawlJobModel)
+                .where(CrawlJobModel.id == self._as_uuid(job_id))
+                .values(**fields)
+            )
+            result = session.execute(stmt)
+
+            if result.rowcount == 0:
+                session.rollback()
+                log.error(f"CrawlJob을 찾을 수 없음: {job_id}")
+                return
 
             session.commit()
             log.info(f"CrawlJob 상태 업데이트: {job_id} → {status}")
@@ -263,4 +470,33 @@ class DBManager:
             session.rollback()
             log.error(f"CrawlJob 업데이트 실패: {e}")
         finally:
-            session.close()
+            if owned:
+                session.close()
+
+    def get_job_status(self, job_id: str | uuid.UUID, session=None):
+        """
+        현재 DB에 기록된 CrawlJob 상태 조회
+
+        Args:
+            job_id: 작업 UUID (uuid.UUID 또는 문자열)
+            session: 재사용할 세션 (None이면 새로 열고 닫음)
+
+        Returns:
+            상태 문자열 ("RUNNING" / "COMPLETED" / ...), 없거나 조회 실패 시 None
+        """
+        owned = session is None
+        if owned:
+            session = SessionLocal()
+        try:
+            job = session.query(CrawlJobModel).filter(
+                CrawlJobModel.id == self._as_uuid(job_id)
+            ).first()
+            return job.status if job else None
+
+        except Exception as e:
+            session.rollback()
+            log.error(f"CrawlJob 상태 조회 실패: {e}")
+            return None
+        finally:
+            if owned:
+                session.close()
@@ -1,5 +1,7 @@
+import asyncio
 import httpx
 import os
+from collections import OrderedDict
 from typing import Optional
 from dotenv import load_dotenv
 
@@ -11,6 +13,15 @@ load_dotenv()
 
 SPRING_API_URL = os.getenv("SPRING_API_URL", "http://localhost:8081")
 
+# Spring API 동시 요청 수 제한 (백엔드 부하 방지)
+API_CONCURRENCY = int(os.getenv("SPRING_API_CONCURRENCY", "10"))
+
+# Spring API 요청 타임아웃 (공유 클라이언트를 쓰더라도 요청 단위로 적용)
+API_TIMEOUT = float(os.getenv("SPRING_API_TIMEOUT", "30.0"))
+
+# 존재가 확인된 URL을 기억해 둘 최대 개수 (LRU, 초과 시 가장 오래된 URL부터 제거)
+SEEN_URL_CACHE_SIZE = int(os.getenv("SEEN_URL_CACHE_SIZE", "5000"))
+
 
 class NewsService:
     """
@@ -19,15 +30,32 @@ class NewsService:
     이 서비스는 FastAPI(`/crawl/*`) 실행 경로에서만 사용된다.
     RabbitMQ Worker 경로는 DBManager를 통해 DB에 직접 저장하므로
     이 HTTP 서비스와 `NewsCreate` DTO를 사용하지 않는다.
+
+    client를 넘기면 크롤러와 같은 연결 풀을 공유하고 close()에서 닫지 않는다.
     """
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         self.base_url = SPRING_API_URL
-        self.client = httpx.AsyncClient(timeout=30.0)
+        # 외부에서 주입한 공유 HTTP 클라이언트 (없으면 전용 클라이언트 생성)
+        self.client = client or httpx.AsyncClient(timeout=API_TIMEOUT)
+        self._owns_client = client is None
+        # Spring에 이미 있는 것으로 확인된 URL (LRU). 재크롤링 시 같은 URL을 다시 묻지 않기 위함
+        self._seen_urls: OrderedDict[str, None] = OrderedDict()
+    
+    def _remember_url(self, url: str):
+        """존재하는 URL을 LRU 캐시에 기록"""
+        self._seen_urls[url] = None
+        self._seen_urls.move_to_end(url)
+        if len(self._seen_urls) > SEEN_URL_CACHE_SIZE:
+            self._seen_urls.popitem(last=False)
+    
+    def is_known_url(self, url: str) -> bool:
+        """Spring에 있는 것으로 확인된 URL인지 (exists/201/409 응답으로 확인, API 호출 없음)"""
+        return url in self._seen_urls
     
     async def check_url_exists(self, url: str) -> bool:
         """
-        URL 중복 확인
+        URL 중복 확인 (최근 존재가 확인된 URL은 API 호출 없이 캐시로 응답)
         
         Args:
             url: 확인할 뉴스 URL
@@ -35,16 +63,23 @@ class NewsService:
         Returns:
             True: 이미 존재, False: 존재하지 않음
         """
+        if url in self._seen_urls:
+            self._seen_urls.move_to_end(url)
+            return True
+        
         try:
             response = await self.client.get(
                 f"{self.base_url}/api/v1/news/exists",
-                params={"url": url}
+                params={"url": url},
+                timeout=API_TIMEOUT,
             )
             
             if response.status_code == 200:
                 data = response.json()
                 exists = data.get("data", False)
-                log.debug(f"URL 존재 여부 확인: {url} → {exists}")
+                log.debug("URL 존재 여부 확인: {} → {}", url, exists)
+                if exists:
+                    self._remember_url(url)
                 return exists
             else:
                 log.warning(f"URL 확인 실패 (status: {response.status_code}): {url}")
@@ -54,6 +89,28 @@ class NewsService:
             log.error(f"URL 확인 중 오류 발생: {e}")
             return False
     
+    async def check_urls_exist(self, urls: list[str]) -> set[str]:
+        """
+        여러 URL의 중복 여부를 한 번에 확인
+        
+        Spring에 일괄 확인 API가 없으므로 check_url_exists()를
+        API_CONCURRENCY개씩 동시에 호출한다 (N×RTT → 약 N/API_CONCURRENCY×RTT).
+        
+        Args:
+            urls: 확인할 뉴스 URL 목록
+            
+        Returns:
+            이미 존재하는 URL 집합
+        """
+        sem = asyncio.Semaphore(API_CONCURRENCY)
+        
+        async def _check(url: str) -> bool:
+            async with sem:
+                return await self.check_url_exists(url)
+        
+        results = await asyncio.gather(*(_check(url) for url in urls))
+        return {url for url, exists in zip(urls, results) if exists}
+    
     async def create_news(self, news: NewsCreate) -> Optional[dict]:
         """
         Spring API로 뉴스 생성 요청
@@ -71,15 +128,18 @@ class NewsService:
             response = await self.client.post(
                 f"{self.base_url}/api/v1/news",
                 json=news_dict,
-                headers={"Content-Type": "application/json"}
+                headers={"Content-Type": "application/json"},
+                timeout=API_TIMEOUT,
             )
             
             if response.status_code == 201:
                 result = response.json()
                 log.info(f"뉴스 생성 성공: {news.title[:30]}...")
+                self._remember_url(news.url)
                 return result.get("data")
             elif response.status_code == 409:
                 log.warning(f"중복된 URL (이미 존재): {news.url}")
+                self._remember_url(news.url)
                 return None
             else:
                 log.error(f"뉴스 생성 실패 (status: {response.status_code}): {response.text}")
@@ -90,5 +150,6 @@ class NewsService:
             return None
     
     async def close(self):
-        """HTTP 클라이언트 종료"""
-        await self.client.aclose()
+        """HTTP 클라이언트 종료 (주입받은 공유 클라이언트는 소유자가 닫음)"""
+        if self._owns_client:
+            await self.client.aclose()
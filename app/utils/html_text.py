@@ -0,0 +1,25 @@
+"""
+lxml 요소 본문 텍스트 추출
+
+역할:
+  - 본문 컨테이너 안의 <script>/<style> 내용을 제외하고 텍스트만 추출
+  - 줄바꿈/탭 연속을 공백 1칸으로 정규화 (저장/분석되는 본문과 [:5000] 자르기 기준을 깨끗하게 유지)
+
+사용법:
+  from app.utils.html_text import node_text
+
+  content = node_text(nodes[0])
+"""
+import re
+
+from lxml import etree
+
+# 연속 공백(줄바꿈/탭 포함) 정규화 패턴
+_WS_RE = re.compile(r"\s+")
+
+
+def node_text(node) -> str:
+    """script/style을 제거한 요소의 텍스트를 공백 정규화해서 반환 (요소는 제자리에서 수정됨)"""
+    # with_tail=False: 태그 뒤에 이어지는 본문 텍스트(tail)는 남김
+    etree.strip_elements(node, "script", "style", with_tail=False)
+    return _WS_RE.sub(" ", node.text_content()).strip()
@@ -0,0 +1,123 @@
+"""
+공유 HTTP 클라이언트
+
+역할:
+  - 모든 크롤러가 하나의 httpx.AsyncClient(연결 풀)를 재사용
+  - HTTP/2 + keep-alive로 같은 호스트에 대한 TLS 핸드셰이크를 1회로 줄임
+
+주의:
+  - httpx 연결은 생성된 이벤트 루프에 묶이므로, 루프가 바뀌면 새 클라이언트를 만든다.
+    (Worker는 프로세스당 루프 1개를 계속 사용하므로 클라이언트도 1개를 유지하고,
+     테스트처럼 asyncio.run()을 여러 번 호출할 때만 다시 생성됨)
+  - 종료 시 close_client()를 호출해 연결을 정리한다.
+  - 기사 상세 페이지는 fetch_limited()로 최대 MAX_BODY_BYTES까지만 수신한다.
+    (UTF-8이 아닌 사이트는 fetch_limited_with_charset()으로 charset도 함께 받는다)
+
+사용법:
+  from app.utils.http import get_client
+
+  client = get_client()
+  response = await client.get(url)
+"""
+import asyncio
+from typing import Optional
+
+import httpx
+
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+
+# 상세 페이지 최대 수신 크기 (본문은 5000자만 사용하므로 512KB면 충분)
+# 광고/스크립트로 수 MB가 되는 페이지를 통째로 메모리에 올리지 않기 위함
+MAX_BODY_BYTES = 512 * 1024
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def create_client() -> httpx.AsyncClient:
+    """크롤러 공용 설정으로 새 AsyncClient 생성"""
+    return httpx.AsyncClient(
+        http2=True,
+        # keepalive_expiry=30: 유휴 연결을 30초간 유지해 같은 호스트 요청에 재사용
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=50,
+            keepalive_expiry=30.0,
+        ),
+        # 응답 없는 호스트가 gather 전체를 오래 붙잡지 않도록 짧게 설정
+        timeout=httpx.Timeout(8.0, connect=3.0),
+        # 공통 헤더는 클라이언트에 지정 (요청마다 headers= 전달 불필요)
+        headers={"User-Agent": USER_AGENT},
+        follow_redirects=True,
+    )
+
+
+def get_client() -> httpx.AsyncClient:
+    """현재 이벤트 루프에서 사용할 공유 AsyncClient 반환"""
+    global _client, _client_loop
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = create_client()
+        _client_loop = loop
+    return _client
+
+
+async def close_client():
+    """공유 AsyncClient 종료 (연결 풀 정리)"""
+    global _client, _client_loop
+
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
+
+
+async def fetch_limited(client: httpx.AsyncClient, url: str,
+                        headers: Optional[dict] = None,
+                        max_bytes: int = MAX_BODY_BYTES) -> bytes:
+    """
+    응답 본문을 스트리밍으로 읽되 최대 max_bytes까지만 반환
+
+    Args:
+        client: HTTP 클라이언트
+        url: 요청 URL
+        headers: 요청 헤더
+        max_bytes: 최대 수신 바이트 수 (초과분은 읽지 않고 연결 종료)
+
+    Returns:
+        응답 본문 bytes (max_bytes 이하)
+
+    Raises:
+        httpx.HTTPStatusError: 4xx/5xx 응답
+    """
+    body, _ = await fetch_limited_with_charset(client, url, headers, max_bytes)
+    return body
+
+
+async def fetch_limited_with_charset(client: httpx.AsyncClient, url: str,
+                                     headers: Optional[dict] = None,
+                                     max_bytes: int = MAX_BODY_BYTES) -> tuple[bytes, Optional[str]]:
+    """
+    fetch_limited()와 같되 Content-Type 헤더의 charset도 함께 반환
+
+    본문을 str로 디코딩하지 않고, charset은 파서(lxml 등)에 그대로 넘기기 위한 용도
+
+    Returns:
+        (응답 본문 bytes (max_bytes 이하), Content-Type charset 또는 None)
+
+    Raises:
+        httpx.HTTPStatusError: 4xx/5xx 응답
+    """
+    chunks = []
+    total = 0
+    async with client.stream("GET", url, headers=headers) as response:
+        response.raise_for_status()
+        charset = response.charset_encoding
+        async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= max_bytes:
+                break
+    return b"".join(chunks)[:max_bytes], charset
@@ -1,3 +1,4 @@
+import os
 import sys
 from loguru import logger
 from pathlib import Path
@@ -21,13 +22,20 @@ def setup_logger():
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
     
+    # enqueue=True: 로그 레코드를 큐에 넣고 백그라운드 스레드가 파일에 기록
+    #   → 크롤링/DB 저장 중 log 호출이 디스크 I/O를 기다리지 않음
+    # 기본 레벨은 INFO (건별 "중복 URL 스킵" 같은 DEBUG 로그로 파일이 불어나지 않도록)
+    #   → 디버깅 시 LOG_FILE_LEVEL=DEBUG로 변경
     logger.add(
         "logs/crawler_{time:YYYY-MM-DD}.log",
         rotation="00:00",  # 매일 자정에 새 파일
         retention="30 days",  # 30일 보관
         compression="zip",  # 압축
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-        level="DEBUG"
+        level=os.getenv("LOG_FILE_LEVEL", "INFO"),
+        enqueue=True,
+        backtrace=False,  # 예외 시 호출 스택 전체 확장 안 함
+        diagnose=False,  # 예외 시 변수 값 출력 안 함 (비용 + 민감 정보 노출 방지)
     )
     
     logger.info("Logger initialized successfully")
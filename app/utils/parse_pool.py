@@ -0,0 +1,47 @@
+"""
+HTML 파싱 전용 프로세스 풀
+
+역할:
+  - 기사 본문 HTML 파싱(CPU 작업)을 별도 프로세스에서 실행
+  - asyncio 이벤트 루프는 단일 스레드이므로, 파싱을 넘겨야
+    여러 크롤러의 파싱이 모든 CPU 코어에서 동시에 진행되고
+    루프는 그동안 다른 소켓 응답을 계속 처리할 수 있음
+
+주의:
+  - 풀에 넘기는 함수는 pickle 가능해야 하므로 모듈 최상위 함수만 사용
+    (예: chosunbiz_crawler._extract_chosunbiz)
+  - 인자/반환값(bytes, str, datetime 등)도 pickle 가능한 타입이어야 함
+  - 종료 시 shutdown_parse_pool()로 자식 프로세스를 정리
+  - 자식 프로세스는 fork가 아니라 spawn으로 생성
+    (풀은 loguru 기록 스레드/to_thread 스레드가 이미 떠 있는 시점에 생성되므로,
+     fork하면 그 스레드들이 잡고 있던 락을 복사한 자식이 멈출 수 있음)
+
+사용법:
+  from app.utils.parse_pool import run_in_parse_pool
+
+  content, image_url = await run_in_parse_pool(_extract_chosunbiz, body, base_url)
+"""
+import asyncio
+import concurrent.futures
+import multiprocessing
+import os
+
+# 풀 크기 (기본: CPU 코어 수, 다중 Worker 실행 시 app.worker가 코어 수 / Worker 수로 지정)
+PARSE_POOL_WORKERS = int(os.getenv("PARSE_POOL_WORKERS", str(os.cpu_count() or 1)))
+
+# 자식 프로세스는 첫 작업 제출 시점에 생성됨 (import만으로는 생성되지 않음)
+PARSE_POOL = concurrent.futures.ProcessPoolExecutor(
+    max_workers=PARSE_POOL_WORKERS,
+    mp_context=multiprocessing.get_context("spawn"),
+)
+
+
+async def run_in_parse_pool(func, *args):
+    """func(*args)를 파싱 프로세스 풀에서 실행하고 결과를 기다림"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(PARSE_POOL, func, *args)
+
+
+def shutdown_parse_pool():
+    """파싱 프로세스 풀 종료 (대기 중인 작업은 취소)"""
+    PARSE_POOL.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,37 @@
+"""
+비동기 태스크 유틸
+
+역할:
+  - 여러 코루틴을 동시에 실행하고 끝나는 순서대로 결과를 하나씩 넘겨줌
+  - 크롤러가 상세 페이지 결과를 전부 모은 뒤 반환하지 않고,
+    파싱이 끝난 기사부터 바로 yield하기 위함 (메모리 상주량 감소)
+
+사용법:
+  from app.utils.tasks import iter_completed
+
+  async for result in iter_completed(coros):
+      if isinstance(result, Exception):
+          ...
+"""
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Iterable
+
+
+async def iter_completed(coros: Iterable[Awaitable]) -> AsyncIterator[Any]:
+    """
+    코루틴을 동시에 실행하고 완료 순서대로 결과를 yield
+
+    asyncio.gather(return_exceptions=True)처럼 예외는 올리지 않고 결과 값으로 넘김
+    소비하는 쪽이 중간에 멈추면(aclose/취소) 아직 끝나지 않은 태스크는 취소함
+    """
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                result = await next_done
+            except Exception as e:
+                result = e
+            yield result
+    finally:
+        for task in tasks:
+            task.cancel()
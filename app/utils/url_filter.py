@@ -0,0 +1,240 @@
+"""
+URL / 본문 중복 필터 (Bloom Filter)
+
+역할:
+  - 이미 수집한 기사 URL이면 상세 페이지 GET + 파싱을 건너뛰도록 판단
+  - 서로 다른 URL이지만 본문이 같은 기사(재전송/중복 송고)를 걸러냄
+
+Bloom Filter 특성:
+  - "없음" 판정은 100% 정확, "있음" 판정은 error_rate 확률로 오탐 가능
+  - 오탐 시 해당 기사 1건을 건너뛸 뿐이므로 크롤러에서는 허용 가능한 수준
+  - 용량을 넘으면 더 큰 필터를 이어 붙여 오탐률이 유지되도록 확장 (Scalable)
+
+등록 시점:
+  - 크롤러는 조회만 함 (SEEN_URLS 포함 여부 / is_duplicate_content())
+  - 저장이 확인된 기사만 remember_saved()로 등록
+    (Worker: COMMIT된 배치, FastAPI: Spring 201/409 응답)
+  - 저장에 실패한 기사는 등록하지 않으므로 다음 크롤링에서 다시 수집됨
+
+영속화:
+  - 프로세스 시작 시(FastAPI lifespan / Worker 시작) init_filters()로
+    URL_FILTER_PATH(기본: data/url_filter.pkl)에서 로드 (import 시에는 디스크를 읽지 않음)
+  - 종료 시(FastAPI lifespan / Worker 종료) save_filters()로 디스크에 저장
+    (파일 잠금 안에서 디스크의 필터와 합친 뒤 교체하므로,
+     여러 Worker 프로세스가 저장해도 다른 프로세스가 등록한 기사를 덮어쓰지 않음)
+
+사용법:
+  from app.utils.url_filter import SEEN_URLS, is_duplicate_content, remember_saved
+
+  if url in SEEN_URLS:
+      continue
+  ...
+  # 저장 확인 후
+  remember_saved(url, content)
+"""
+import copy
+import hashlib
+import math
+import os
+import pickle
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+from app.utils.logger import log
+
+try:
+    import fcntl
+except ImportError:  # Windows: 파일 잠금 없이 저장 (단일 프로세스 실행 전제)
+    fcntl = None
+
+FILTER_PATH = Path(os.getenv("URL_FILTER_PATH", "data/url_filter.pkl"))
+
+# 본문 비교 전 공백 차이를 없애기 위한 정규식
+_WS_RE = re.compile(r"\s+")
+
+# 크롤러가 본문을 못 찾았을 때 넣는 대체 문구 (본문 중복 판정/등록 대상에서 제외)
+NO_CONTENT_MARKERS = frozenset({"본문 없음", "Content not available"})
+
+
+class BloomFilter:
+    """고정 용량 Bloom Filter (blake2b 기반 double hashing)"""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        # 최적 비트 수 m = -n·ln(p) / (ln2)², 해시 개수 k = (m/n)·ln2
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def add(self, key: str):
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def update(self, other: "BloomFilter"):
+        """같은 크기의 다른 필터와 합집합 (비트 OR)"""
+        if (other.num_bits, other.num_hashes) != (self.num_bits, self.num_hashes):
+            raise ValueError("크기가 다른 Bloom Filter는 합칠 수 없습니다")
+        self._bits = bytearray(a | b for a, b in zip(self._bits, other._bits))
+        # 양쪽에 같은 키가 있을 수 있으므로 개수는 켜진 비트 수로 추정
+        # n ≈ -(m/k)·ln(1 - X/m)  (X: 켜진 비트 수)
+        set_bits = sum(bin(byte).count("1") for byte in self._bits)
+        if set_bits >= self.num_bits:
+            self.count = self.capacity
+        else:
+            estimated = -self.num_bits / self.num_hashes * math.log(1 - set_bits / self.num_bits)
+            self.count = max(self.count, other.count, round(estimated))
+
+
+class ScalableBloomFilter:
+    """
+    용량이 차면 2배 크기의 필터를 추가하는 Bloom Filter
+
+    새 필터의 error_rate는 절반으로 줄여서 전체 오탐률이
+    초기 error_rate의 약 2배 이내로 유지됩니다.
+    """
+
+    def __init__(self, initial_capacity: int = 100_000, error_rate: float = 1e-4):
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self._filters = [BloomFilter(initial_capacity, error_rate / 2)]
+
+    def __contains__(self, key: str) -> bool:
+        return any(key in f for f in self._filters)
+
+    def __len__(self) -> int:
+        return sum(f.count for f in self._filters)
+
+    def add(self, key: str):
+        if key in self:
+            return
+        current = self._filters[-1]
+        if current.count >= current.capacity:
+            current = BloomFilter(current.capacity * 2, current.error_rate / 2)
+            self._filters.append(current)
+        current.add(key)
+
+    def update(self, other: "ScalableBloomFilter"):
+        """
+        다른 필터의 키를 모두 포함하도록 합집합
+
+        초기 용량/오탐률이 같으면 i번째 하위 필터의 크기도 같으므로 하위 필터끼리 비트 OR
+        """
+        if (other.initial_capacity, other.error_rate) != (self.initial_capacity, self.error_rate):
+            raise ValueError("설정이 다른 Scalable Bloom Filter는 합칠 수 없습니다")
+        for i, sub_filter in enumerate(other._filters):
+            if i < len(self._filters):
+                self._filters[i].update(sub_filter)
+            else:
+                self._filters.append(copy.deepcopy(sub_filter))
+
+
+def content_digest(text: str) -> str:
+    """공백을 정규화한 본문의 blake2b 다이제스트 (16바이트 hex)"""
+    normalized = _WS_RE.sub(" ", text).strip()
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def load_filters(path: Path = FILTER_PATH) -> tuple[ScalableBloomFilter, ScalableBloomFilter]:
+    """디스크에서 (URL 필터, 본문 필터)를 로드. 없거나 손상되었으면 빈 필터 생성"""
+    if path.exists():
+        try:
+            with path.open("rb") as f:
+                seen_urls, seen_contents = pickle.load(f)
+            log.info(f"중복 필터 로드: URL {len(seen_urls)}건, 본문 {len(seen_contents)}건")
+            return seen_urls, seen_contents
+        except Exception as e:
+            log.warning(f"중복 필터 로드 실패 (새로 생성): {e}")
+    return ScalableBloomFilter(), ScalableBloomFilter()
+
+
+@contextmanager
+def _file_lock(path: Path):
+    """path 옆의 .lock 파일로 프로세스 간 배타 잠금 (fcntl이 없으면 잠금 없이 진행)"""
+    with path.with_suffix(".lock").open("a") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _merge_into_globals(seen_urls: ScalableBloomFilter, seen_contents: ScalableBloomFilter):
+    """다른 필터를 프로세스 전역 필터에 합침 (크롤러가 들고 있는 참조가 유지되도록 제자리 갱신)"""
+    try:
+        SEEN_URLS.update(seen_urls)
+        SEEN_CONTENTS.update(seen_contents)
+    except ValueError as e:
+        log.warning(f"중복 필터 합치기 실패 (현재 필터만 사용): {e}")
+
+
+def save_filters(path: Path = FILTER_PATH):
+    """
+    현재 (URL 필터, 본문 필터)를 디스크에 저장
+
+    마지막에 저장한 프로세스가 다른 Worker의 등록분을 지우지 않도록,
+    파일 잠금 안에서 디스크의 필터를 먼저 합친 뒤 교체함
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with _file_lock(path):
+            if path.exists():
+                _merge_into_globals(*load_filters(path))
+            # 임시 파일에 쓴 뒤 교체 (저장 도중 종료되어도 기존 파일은 온전히 남음)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with tmp_path.open("wb") as f:
+                pickle.dump((SEEN_URLS, SEEN_CONTENTS), f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(path)
+        log.info(f"중복 필터 저장: URL {len(SEEN_URLS)}건, 본문 {len(SEEN_CONTENTS)}건")
+    except Exception as e:
+        log.error(f"중복 필터 저장 실패: {e}")
+
+
+def init_filters(path: Path = FILTER_PATH):
+    """디스크에 저장된 필터를 프로세스 전역 필터에 합침 (프로세스 시작 시 1번 호출)"""
+    _merge_into_globals(*load_filters(path))
+
+
+def is_duplicate_content(text: str) -> bool:
+    """
+    이미 저장된 본문인지 확인 (필터에 등록하지 않음)
+
+    Returns:
+        True: 이미 저장된 본문, False: 새 본문
+    """
+    if text in NO_CONTENT_MARKERS:
+        return False
+    return content_digest(text) in SEEN_CONTENTS
+
+
+def remember_saved(url: str, content: Optional[str] = None):
+    """
+    저장이 확인된 기사를 필터에 등록 (이후 크롤링에서 상세 페이지 요청/본문 중복 스킵)
+
+    Args:
+        url: 기사 URL
+        content: 기사 본문 (None이면 URL만 등록)
+    """
+    SEEN_URLS.add(url)
+    if content and content not in NO_CONTENT_MARKERS:
+        SEEN_CONTENTS.add(content_digest(content))
+
+
+# 프로세스 전역 필터 (모든 크롤러가 공유, 디스크 로드는 init_filters()에서 수행)
+SEEN_URLS, SEEN_CONTENTS = ScalableBloomFilter(), ScalableBloomFilter()
@@ -6,26 +6,123 @@ RabbitMQ에서 크롤링 요청 메시지를 수신하고 처리합니다.
 
 실행 방법:
     python -m app.worker
+    WORKERS=4 python -m app.worker   # Consumer 프로세스 4개
+
+다중 Worker:
+  - WORKERS개의 자식 프로세스가 각각 CrawlConsumer를 실행하고
+    같은 큐(lucr.crawl.request)를 구독 → RabbitMQ가 Round-Robin으로 분배
+  - 자식은 spawn 방식으로 생성 (부모의 이벤트 루프/프로세스 풀 상태를 물려받지 않음)
+  - HTML 파싱 프로세스 풀(PARSE_POOL_WORKERS)과 DB 연결 풀(DB_POOL_SIZE / DB_MAX_OVERFLOW)은
+    Worker 수로 나눠 자식마다 작게 생성 (프로세스 수가 늘어도 전체 합계는 그대로)
+  - 종료 시 각 자식은 디스크의 중복 필터와 자기 필터를 파일 잠금 안에서 합쳐 저장
+    (먼저 종료한 Worker의 등록분이 덮어써지지 않음)
+  - SIGTERM을 받으면 부모는 자식에게 SIGTERM을 전달하고,
+    자식은 consume을 멈추고 연결/필터/풀을 정리한 뒤 종료
 
 @author Ekko0701
 @since 2026-02-06
 """
+import asyncio
+import multiprocessing
+import os
+import signal
+
+try:
+    # uvloop: libuv 기반 이벤트 루프 (기본 asyncio 루프보다 I/O 처리량이 높음)
+    # Windows 등 설치되지 않은 환경에서는 기본 루프 사용
+    import uvloop
+except ImportError:
+    uvloop = None
+
+from app.config.database import DB_MAX_OVERFLOW, DB_POOL_SIZE
 from app.messaging.consumer import CrawlConsumer
 from app.utils.logger import log
+from app.utils.parse_pool import shutdown_parse_pool
+from app.utils.url_filter import init_filters, save_filters
 
+# Consumer 프로세스 수 (기본: CPU 코어 수)
+WORKERS = int(os.getenv("WORKERS", str(os.cpu_count() or 2)))
 
-def main():
-    log.info("=== Lucr Crawler Worker 시작 ===")
-    log.info("RabbitMQ 큐 대기 중... (종료: Ctrl+C)")
+
+async def _serve(consumer: CrawlConsumer):
+    """SIGTERM을 받으면 consume을 멈추도록 등록한 뒤 Consumer 실행"""
+    loop = asyncio.get_running_loop()
+    task = asyncio.current_task()
+    try:
+        # start()가 취소되면 finally에서 HTTP 클라이언트/Publisher 연결을 정리함
+        loop.add_signal_handler(signal.SIGTERM, task.cancel)
+    except NotImplementedError:
+        # Windows 이벤트 루프는 signal handler 미지원
+        pass
+
+    try:
+        await consumer.start()  # 무한 대기
+    except asyncio.CancelledError:
+        log.info("Worker 종료 (SIGTERM)")
+
+
+def _run_worker():
+    """Worker 프로세스 1개 실행 (Consumer 실행 → 종료 시 필터 저장/파싱 풀 정리)"""
+    log.info(f"Worker 프로세스 시작 (pid={os.getpid()})")
+    # 지난 실행에서 저장한 URL/본문 중복 필터 로드
+    init_filters()
 
     try:
         consumer = CrawlConsumer()
-        consumer.start()  # 무한 대기
+        # Worker 전체를 이벤트 루프 1개에서 실행 (메시지마다 루프를 새로 만들지 않음)
+        if uvloop is not None:
+            uvloop.run(_serve(consumer))
+        else:
+            asyncio.run(_serve(consumer))
     except KeyboardInterrupt:
         log.info("Worker 종료 (Ctrl+C)")
     except Exception as e:
         log.error(f"Worker 오류: {e}")
         raise
+    finally:
+        # 수집한 URL/본문 중복 필터를 디스크에 저장 (다음 실행 시 재사용)
+        save_filters()
+        # HTML 파싱 프로세스 풀 종료
+        shutdown_parse_pool()
+
+
+def main():
+    log.info(f"=== Lucr Crawler Worker 시작 (프로세스 {WORKERS}개) ===")
+    log.info("RabbitMQ 큐 대기 중... (종료: Ctrl+C)")
+
+    if WORKERS <= 1:
+        _run_worker()
+        return
+
+    # 자식마다 파싱 풀을 CPU 코어 수만큼 만들면 WORKERS × 코어 수 프로세스가 생기므로 나눠서 배분
+    # (spawn된 자식은 부모의 환경변수를 물려받아 parse_pool 모듈 로드 시 이 값을 사용)
+    os.environ.setdefault("PARSE_POOL_WORKERS", str(max(1, (os.cpu_count() or 1) // WORKERS)))
+    # DB 연결 풀도 같은 방식으로 나눠서 전체 연결 수가 DB max_connections를 넘지 않게 함
+    # (직접 지정한 값이 있으면 그대로 사용)
+    os.environ.setdefault("DB_POOL_SIZE", str(max(1, DB_POOL_SIZE // WORKERS)))
+    os.environ.setdefault("DB_MAX_OVERFLOW", str(max(1, DB_MAX_OVERFLOW // WORKERS)))
+
+    ctx = multiprocessing.get_context("spawn")
+    processes = [ctx.Process(target=_run_worker, name=f"crawl-worker-{i}") for i in range(WORKERS)]
+    for process in processes:
+        process.start()
+
+    def _terminate_children(_signum, _frame):
+        # 자식에게 SIGTERM 전달 → 각자 consume 중단 후 정리
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    signal.signal(signal.SIGTERM, _terminate_children)
+
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        # Ctrl+C는 자식에게도 전달되므로 자식이 정리를 마칠 때까지 대기
+        for process in processes:
+            process.join()
+        log.info("Worker 종료 (Ctrl+C)")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,26 @@
+"""
+크롤링 요청 엔드포인트 단위 테스트.
+
+목표:
+- 작업 큐가 가득 차면 요청을 기다리게 하지 않고 503으로 거절하는지 검증한다.
+"""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app import main
+
+
+def test_enqueue_rejects_with_503_when_queue_is_full(monkeypatch):
+    """큐에 자리가 있으면 추가되고, 가득 차면 503 HTTPException이 나야 한다."""
+    jobs = asyncio.Queue(maxsize=1)
+    monkeypatch.setattr(main.app.state, "jobs", jobs, raising=False)
+
+    main._enqueue(main.run_mk_crawler)
+    with pytest.raises(HTTPException) as exc_info:
+        main._enqueue(main.run_hankyung_crawler)
+
+    assert exc_info.value.status_code == 503
+    assert jobs.qsize() == 1
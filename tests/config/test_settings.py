@@ -0,0 +1,39 @@
+"""
+Settings 단위 테스트.
+
+목표:
+- 환경 변수 값을 타입에 맞게 파싱하는지 검증한다.
+- get_settings()가 .env를 한 번만 읽고 같은 객체를 재사용하는지 검증한다.
+"""
+
+from app.config import settings as settings_module
+from app.config.settings import Settings, get_settings
+
+
+def test_from_env_parses_values_and_uses_defaults(monkeypatch):
+    """지정한 값은 int로 파싱되고, 없는 값은 기본값을 사용해야 한다."""
+    monkeypatch.setattr(settings_module, "load_dotenv", lambda: None)
+    monkeypatch.setenv("RABBITMQ_HOST", "mq.internal")
+    monkeypatch.setenv("RABBITMQ_PREFETCH", "5")
+    monkeypatch.delenv("RABBITMQ_PORT", raising=False)
+
+    settings = Settings.from_env()
+
+    assert settings.rabbitmq_host == "mq.internal"
+    assert settings.rabbitmq_prefetch == 5
+    assert settings.rabbitmq_port == 5672
+
+
+def test_get_settings_loads_dotenv_once(monkeypatch):
+    """get_settings()를 여러 번 호출해도 .env는 1번만 읽어야 한다."""
+    calls = []
+    monkeypatch.setattr(settings_module, "load_dotenv", lambda: calls.append(1))
+    get_settings.cache_clear()
+    try:
+        first = get_settings()
+        second = get_settings()
+    finally:
+        get_settings.cache_clear()
+
+    assert first is second
+    assert calls == [1]
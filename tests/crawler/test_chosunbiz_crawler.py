@@ -0,0 +1,75 @@
+"""
+ChosunbizCrawler 단위 테스트.
+
+목표:
+- 상세 페이지 요청이 실패해도 기사를 버리지 않고 RSS description으로 저장하는지 검증한다.
+- 상세 페이지 실패는 crawl() 요약 로그용 errors 리스트에 집계되는지 검증한다.
+- RSS description HTML 조각과 기사 HTML에서 본문/이미지를 추출하는지 검증한다.
+"""
+
+import asyncio
+from datetime import datetime
+
+import httpx
+from lxml import etree
+
+from app.crawler.chosunbiz_crawler import (
+    ChosunbizCrawler,
+    _extract_chosunbiz,
+    _extract_img_from_html,
+    _strip_html,
+)
+
+NOW = datetime(2026, 3, 8, 10, 0, 0)
+
+
+def _rss_item(description):
+    return etree.fromstring(
+        "<item><title>삼성전자  실적\n발표</title><link>https://biz.chosun.com/a/1</link>"
+        f"<description>{description}</description>"
+        "<pubDate>Sun, 08 Mar 2026 09:00:00 +0900</pubDate></item>"
+    )
+
+
+def test_parse_rss_item_falls_back_to_description_when_fetch_fails():
+    """상세 페이지가 타임아웃이어도 RSS description을 본문으로 쓰고 실패는 errors에 남겨야 한다."""
+    crawler = ChosunbizCrawler()
+
+    async def _timeout(_url, _client):
+        raise httpx.ReadTimeout("timed out")
+
+    crawler._fetch_news_content = _timeout
+    errors = []
+
+    news = asyncio.run(crawler._parse_rss_item(_rss_item("&lt;p&gt;요약 본문&lt;/p&gt;"), None, NOW, errors))
+
+    assert news.title == "삼성전자 실적 발표"
+    assert news.content == "요약 본문"
+    assert news.image_url is None
+    assert news.published_at.hour == 9
+    assert len(errors) == 1 and isinstance(errors[0], httpx.ReadTimeout)
+
+
+def test_strip_html_and_extract_img_from_description():
+    """description HTML 조각에서 태그를 뺀 텍스트와 첫 이미지 src를 추출해야 한다."""
+    description = '<p>코스피 <b>상승</b></p><img src="https://img/1.jpg"><img src="https://img/2.jpg">'
+
+    assert _strip_html(description) == "코스피 상승"
+    assert _extract_img_from_html(description) == "https://img/1.jpg"
+    assert _strip_html("") == ""
+    assert _extract_img_from_html("<p>이미지 없음</p>") is None
+
+
+def test_extract_chosunbiz_reads_content_and_resolves_image_url():
+    """본문 선택자를 순서대로 시도하고, 상대/프로토콜 생략 이미지 URL은 절대 URL로 바꿔야 한다."""
+    body = """<html><body><article>
+    <div class="story-news-content"><p>반도체</p><p>수출 증가</p><img src="//img.chosun.com/1.jpg"></div>
+    </article></body></html>""".encode("utf-8")
+
+    content, image_url = _extract_chosunbiz(body, "https://biz.chosun.com")
+
+    assert content == "반도체 수출 증가"
+    assert image_url == "https://img.chosun.com/1.jpg"
+
+    _, relative = _extract_chosunbiz(b'<div class="article-body"><img src="/a.jpg">x</div>', "https://biz.chosun.com")
+    assert relative == "https://biz.chosun.com/a.jpg"
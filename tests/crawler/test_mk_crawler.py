@@ -0,0 +1,79 @@
+"""
+매일경제 RSS/기사 추출 단위 테스트.
+
+목표:
+- _iter_rss_items()가 item을 dict로 하나씩 넘겨주고, 중간에 멈출 수 있는지 검증한다.
+- _extract_mk()가 선택자 순서대로 본문/이미지를 추출하는지 검증한다.
+"""
+
+import itertools
+
+from app.crawler.mk_crawler import _extract_mk, _iter_rss_items
+
+RSS = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>매일경제 증권</title>
+<item>
+  <title> 코스피 상승 마감 </title>
+  <link>https://www.mk.co.kr/news/stock/1</link>
+  <description>외국인 매수세</description>
+  <pubDate>Fri, 06 Mar 2026 15:40:00 +0900</pubDate>
+</item>
+<item>
+  <title>환율 하락</title>
+  <link>https://www.mk.co.kr/news/stock/2</link>
+</item>
+<item>
+  <title>깨진 항목<broken></title>
+</item>
+</channel></rss>""".encode("utf-8")
+
+
+def test_iter_rss_items_yields_item_dicts():
+    """item마다 title/link/description/pubDate를 공백 제거 후 dict로 넘겨야 한다 (없는 값은 빈 문자열)."""
+    items = list(itertools.islice(_iter_rss_items(RSS), 2))
+
+    assert items == [
+        {
+            "title": "코스피 상승 마감",
+            "link": "https://www.mk.co.kr/news/stock/1",
+            "description": "외국인 매수세",
+            "pubDate": "Fri, 06 Mar 2026 15:40:00 +0900",
+        },
+        {
+            "title": "환율 하락",
+            "link": "https://www.mk.co.kr/news/stock/2",
+            "description": "",
+            "pubDate": "",
+        },
+    ]
+
+
+def test_iter_rss_items_can_stop_early():
+    """제너레이터이므로 필요한 개수만 꺼내고 멈출 수 있어야 한다."""
+    items = _iter_rss_items(RSS)
+
+    assert next(items)["link"] == "https://www.mk.co.kr/news/stock/1"
+    items.close()
+
+
+def test_extract_mk_uses_first_matching_selector():
+    """첫 번째로 일치하는 본문 선택자를 쓰고 이미지 src를 함께 돌려줘야 한다."""
+    body = """<html><head><meta charset="utf-8"></head><body>
+    <div class="thumb_area"><img src="https://img.mk.co.kr/1.jpg"></div>
+    <div class="art_txt">두 번째 선택자</div>
+    <div class="news_cnt_detail_wrap">코스피가
+        상승했다.<script>ad()</script></div>
+    </body></html>""".encode("utf-8")
+
+    content, image_url = _extract_mk(body, None)
+
+    assert content == "코스피가 상승했다."
+    assert image_url == "https://img.mk.co.kr/1.jpg"
+
+
+def test_extract_mk_returns_marker_when_no_selector_matches():
+    """본문 선택자가 하나도 맞지 않으면 '본문 없음'을 돌려줘야 한다."""
+    content, image_url = _extract_mk("<html><body><p>광고</p></body></html>".encode("euc-kr"), "euc-kr")
+
+    assert content == "본문 없음"
+    assert image_url is None
@@ -0,0 +1,82 @@
+"""
+네이버 금융 목록/기사 추출 단위 테스트.
+
+목표:
+- _LIST_XPATH/_DATE_XPATH로 목록 페이지의 기사 링크와 날짜를 찾는지 검증한다.
+- _parse_news_item()이 제목/절대 URL/날짜를 채우는지 검증한다.
+- _extract_naver()가 본문/이미지를 추출하는지 검증한다.
+"""
+
+import asyncio
+from datetime import datetime
+
+from lxml import html as lh
+
+from app.crawler.naver_crawler import _DATE_XPATH, _LIST_XPATH, NaverFinanceCrawler, _extract_naver
+
+NOW = datetime(2026, 3, 8, 10, 0, 0)
+
+LIST_PAGE = """<html><body><ul class="realtimeNewsList">
+<li><dl>
+  <dd class="articleSubject"><a href="/news/news_read.naver?article_id=1">삼성전자 신고가</a></dd>
+  <dd class="articleSummary">요약<span class="press">한경</span><span class="wdate date">2026.03.06 14:30</span></dd>
+</dl></li>
+<li><dl>
+  <dt class="thumb"><a href="/news/news_read.naver?article_id=2"><img src="t.jpg"></a></dt>
+  <dt class="articleSubject big"><a href="https://n.news.naver.com/article/2"><strong>SK하이닉스 급등</strong></a></dt>
+  <dd class="articleSummary"><span class="date">2026-03-06 09:05</span></dd>
+</dl></li>
+</ul></body></html>"""
+
+
+def test_list_and_date_xpath_find_article_links_and_dates():
+    """class 토큰 단위로 .articleSubject > a 와 기사 항목 안의 .date를 찾아야 한다."""
+    tree = lh.fromstring(LIST_PAGE)
+
+    anchors = _LIST_XPATH(tree)
+
+    assert [a.get("href") for a in anchors] == [
+        "/news/news_read.naver?article_id=1",
+        "https://n.news.naver.com/article/2",
+    ]
+    dates = [_DATE_XPATH(a.getparent().getparent())[0].text for a in anchors]
+    assert dates == ["2026.03.06 14:30", "2026-03-06 09:05"]
+
+
+def test_parse_news_item_fills_title_url_and_date():
+    """
+    상대 경로는 절대 URL로 바꾸고, 고정 포맷/그 외 형식 날짜를 모두 파싱해야 한다.
+
+    a에 직접 텍스트가 없으면 하위 요소 텍스트를 제목으로 사용해야 한다.
+    """
+    crawler = NaverFinanceCrawler()
+
+    async def _fetch(_url, _client):
+        return "본문", "https://img/1.jpg"
+
+    crawler._fetch_news_content = _fetch
+    anchors = _LIST_XPATH(lh.fromstring(LIST_PAGE))
+
+    async def _run():
+        return [await crawler._parse_news_item(a, None, NOW, []) for a in anchors]
+
+    first, second = asyncio.run(_run())
+
+    assert first.title == "삼성전자 신고가"
+    assert first.url == "https://finance.naver.com/news/news_read.naver?article_id=1"
+    assert first.published_at == datetime(2026, 3, 6, 14, 30)
+    assert first.image_url == "https://img/1.jpg"
+    assert second.title == "SK하이닉스 급등"
+    assert second.url == "https://n.news.naver.com/article/2"
+    assert second.published_at == datetime(2026, 3, 6, 9, 5)
+
+
+def test_extract_naver_reads_content_and_image():
+    """#newsct_article 본문과 .end_photo_org 이미지를 추출해야 한다."""
+    body = """<html><body>
+    <span class="end_photo_org"><img src="https://img/naver.jpg"></span>
+    <article id="newsct_article">반도체 업황이
+        개선되고 있다.<style>.ad{}</style></article>
+    </body></html>""".encode("utf-8")
+
+    assert _extract_naver(body, "utf-8") == ("반도체 업황이 개선되고 있다.", "https://img/naver.jpg")
@@ -0,0 +1,87 @@
+"""
+Yahoo Finance 기사 추출 단위 테스트.
+
+목표:
+- __NEXT_DATA__ JSON에서 본문/이미지/발행 시간을 추출하는지 검증한다.
+- __NEXT_DATA__가 없거나 깨진 페이지는 CSS 선택자로 추출하는지 검증한다.
+- JSON 파싱 실패는 예외 대신 메시지로 돌려주는지 검증한다.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+from app.crawler.yahoo_crawler import _extract_yahoo, _find_article, _image_from
+
+
+def _page(next_data=None, body_html=""):
+    script = ""
+    if next_data is not None:
+        payload = next_data if isinstance(next_data, str) else json.dumps(next_data)
+        script = f'<script id="__NEXT_DATA__" type="application/json">{payload}</script>'
+    return f"<html><body>{body_html}{script}</body></html>".encode()
+
+
+def test_find_article_returns_first_object_with_body():
+    """중첩된 dict/list를 순회해 body 문자열을 가진 첫 객체를 찾아야 한다."""
+    data = {"props": {"items": [{"id": 1}, {"article": {"body": "<p>본문</p>", "id": 2}}]}}
+
+    assert _find_article(data) == {"body": "<p>본문</p>", "id": 2}
+    assert _find_article({"props": {"body": None}}) is None
+
+
+def test_image_from_accepts_str_dict_and_list():
+    """image 필드는 문자열/{"url"}/{"originalUrl"}/리스트 형태를 모두 처리해야 한다."""
+    assert _image_from("https://img/1.jpg") == "https://img/1.jpg"
+    assert _image_from({"originalUrl": "https://img/2.jpg"}) == "https://img/2.jpg"
+    assert _image_from([{"url": "https://img/3.jpg"}, {"url": "https://img/4.jpg"}]) == "https://img/3.jpg"
+    assert _image_from([]) is None
+    assert _image_from({"width": 100}) is None
+
+
+def test_extract_yahoo_reads_article_from_next_data():
+    """__NEXT_DATA__가 있으면 본문 HTML의 태그를 제거하고 이미지/발행 시간도 함께 추출해야 한다."""
+    next_data = {"props": {"pageProps": {"article": {
+        "body": "<p>Stocks <b>rallied</b></p><p>on Friday.</p>",
+        "image": {"url": "https://img/cover.jpg"},
+        "datePublished": "2026-03-06T21:15:00+00:00",
+    }}}}
+
+    content, image_url, pub_date, json_error = _extract_yahoo(
+        _page(next_data, body_html='<div class="caas-body">CSS 본문</div>')
+    )
+
+    assert content == "Stocks rallied on Friday."
+    assert image_url == "https://img/cover.jpg"
+    assert pub_date == datetime(2026, 3, 6, 21, 15, tzinfo=timezone(timedelta(0)))
+    assert json_error is None
+
+
+def test_extract_yahoo_falls_back_to_css_without_next_data():
+    """__NEXT_DATA__가 없으면 CSS 선택자로 본문/이미지를 추출하고 발행 시간은 None이어야 한다."""
+    content, image_url, pub_date, json_error = _extract_yahoo(_page(
+        body_html='<div class="caas-body"><p>Fallback</p><p>body</p></div>'
+                  '<div class="caas-img"><img src="https://img/css.jpg"></div>'
+    ))
+
+    assert content == "Fallback body"
+    assert image_url == "https://img/css.jpg"
+    assert pub_date is None
+    assert json_error is None
+
+
+def test_extract_yahoo_reports_broken_next_data_and_uses_css():
+    """잘린 __NEXT_DATA__ JSON은 오류 메시지로 돌려주고 CSS 선택자로 본문을 추출해야 한다."""
+    content, _, _, json_error = _extract_yahoo(
+        _page('{"props": {"pageProps": ', body_html="<article>Truncated page body</article>")
+    )
+
+    assert content == "Truncated page body"
+    assert json_error.startswith("__NEXT_DATA__ JSON 파싱 실패")
+
+
+def test_extract_yahoo_returns_marker_when_nothing_found():
+    """본문을 찾지 못하면 대체 문구를 돌려줘야 한다."""
+    content, image_url, _, _ = _extract_yahoo(_page(body_html="<div>nav</div>"))
+
+    assert content == "Content not available"
+    assert image_url is None
@@ -0,0 +1,322 @@
+"""
+CrawlConsumer._run_all_crawlers / _on_message 단위 테스트.
+
+목표:
+- 크롤러들이 순차가 아니라 동시에 실행되는지 검증
+- 특정 크롤러가 실패해도 해당 언론사만 0건으로 기록되는지 검증
+- 먼저 끝난 언론사의 저장이 다른 언론사 크롤링과 겹쳐 진행되는지 검증
+- 크롤러 인스턴스를 메시지마다 새로 만들지 않고 재사용하는지 검증
+- 저장이 확인된(COMMIT된) 뉴스만 중복 필터에 등록하는지 검증
+- crawl()이 yield한 뉴스를 save_batch_size건씩 나눠 저장하고 건수를 누적하는지 검증
+- 처리 결과에 따라 메시지를 ACK/NACK 하는지 검증
+"""
+
+import asyncio
+import itertools
+import json
+import threading
+import uuid
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from app.messaging import consumer as consumer_module
+from app.messaging.consumer import CrawlConsumer
+from app.utils import url_filter
+from app.utils.url_filter import ScalableBloomFilter
+
+JOB_ID = "550e8400-e29b-41d4-a716-446655440000"
+
+_news_ids = itertools.count()
+
+
+def _news():
+    """URL이 겹치지 않는 CrawledNews 더블."""
+    return SimpleNamespace(url=f"https://example.com/news-{next(_news_ids)}", title="제목", content="본문")
+
+
+@pytest.fixture(autouse=True)
+def _isolated_url_filter(monkeypatch):
+    """테스트가 프로세스 전역 중복 필터를 오염시키지 않도록 빈 필터로 교체."""
+    monkeypatch.setattr(url_filter, "SEEN_URLS", ScalableBloomFilter(initial_capacity=100))
+    monkeypatch.setattr(url_filter, "SEEN_CONTENTS", ScalableBloomFilter(initial_capacity=100))
+
+
+class _DBStub:
+    """DBManager 더블: 전달된 뉴스를 모두 INSERT된 것으로 돌려주고 상태 변경을 기록한다."""
+
+    def __init__(self):
+        self.statuses = []
+
+    @contextmanager
+    def session_scope(self):
+        yield "session"
+
+    def save_news_with_analysis_bulk(self, news_list, session=None):
+        return [news.url for news in news_list]
+
+    def update_job_status(self, job_id, status, session=None, **_kwargs):
+        assert session == "session"
+        assert isinstance(job_id, uuid.UUID)
+        self.statuses.append(status)
+
+    def get_job_status(self, job_id, session=None):
+        assert session == "session"
+        assert isinstance(job_id, uuid.UUID)
+        return "RUNNING"
+
+
+class _PublisherStub:
+    """발행된 상태만 기록하는 Publisher 더블."""
+
+    def __init__(self):
+        self.published = []
+
+    def publish(self, job_id, status, *_args):
+        self.published.append(status)
+
+
+class _MessageStub:
+    """aio-pika IncomingMessage의 body/ack/nack만 흉내내는 더블."""
+
+    def __init__(self, payload):
+        self.body = json.dumps(payload).encode()
+        self.acked = False
+        self.nacked = False
+
+    async def ack(self):
+        self.acked = True
+
+    async def nack(self, requeue=True):
+        assert requeue is False
+        self.nacked = True
+
+
+def _consumer_with_stubs(db=None, save_batch_size=100):
+    """__init__(RabbitMQ/분석기 생성) 없이 DB/Publisher 더블만 연결한 CrawlConsumer 생성."""
+    consumer = CrawlConsumer.__new__(CrawlConsumer)
+    consumer.http = None
+    consumer.crawlers = None
+    consumer.save_batch_size = save_batch_size
+    consumer.db = db or _DBStub()
+    consumer.publisher = _PublisherStub()
+    consumer.sentiment_analyzer = None
+    consumer.keyword_extractor = None
+    consumer.stock_matcher = None
+    return consumer
+
+
+def _crawler_stub(started: list, expected: int, fail: bool = False):
+    """모든 크롤러가 시작된 뒤에야 끝나는 크롤러 더블 클래스 생성 (순차 실행이면 멈춤)."""
+
+    class _Crawler:
+        def __init__(self, client=None):
+            pass
+
+        async def crawl(self, max_news=50):
+            started.append(self)
+            while len(started) < expected:
+                await asyncio.sleep(0)
+            if fail:
+                raise RuntimeError("crawl failed")
+            for _ in range(2):
+                yield _news()
+
+    return _Crawler
+
+
+def test_run_all_crawlers_runs_concurrently_and_isolates_failures(monkeypatch):
+    """
+    기대 결과:
+    - 5개 크롤러가 동시에 시작되어 모두 완료
+    - 실패한 크롤러(mk)만 0건, 나머지는 2건씩 저장
+    """
+    started = []
+    names = ["HankyungCrawler", "MKCrawler", "EdailyCrawler", "HeraldCrawler", "ChosunbizCrawler"]
+    for name in names:
+        monkeypatch.setattr(consumer_module, name, _crawler_stub(started, len(names), fail=name == "MKCrawler"))
+
+    consumer = _consumer_with_stubs()
+
+    result = asyncio.run(asyncio.wait_for(consumer._run_all_crawlers(max_articles=2), timeout=5))
+
+    assert result == {"hankyung": 2, "mk": 0, "edaily": 2, "herald": 2, "chosunbiz": 2}
+
+
+def test_on_message_acks_after_completed():
+    """
+    크롤링이 끝나면 COMPLETED 기록 → 완료 이벤트 발행 → ACK 순으로 처리해야 한다.
+
+    상태 업데이트와 저장은 session_scope()로 연 세션 1개를 함께 사용해야 한다.
+    """
+    consumer = _consumer_with_stubs()
+
+    async def _run_all_crawlers(_max_articles, session=None):
+        assert session == "session"
+        return {"hankyung": 3}
+
+    consumer._run_all_crawlers = _run_all_crawlers
+    message = _MessageStub({"jobId": JOB_ID, "maxArticles": 3})
+
+    asyncio.run(consumer._on_message(message))
+
+    assert consumer.db.statuses == ["RUNNING", "COMPLETED"]
+    assert consumer.publisher.published == ["COMPLETED"]
+    assert message.acked and not message.nacked
+
+
+def test_on_message_nacks_and_marks_failed_on_error():
+    """처리 중 예외가 나면 FAILED 기록 → 실패 이벤트 발행 → NACK(requeue=False) 해야 한다."""
+    consumer = _consumer_with_stubs()
+
+    async def _run_all_crawlers(_max_articles, session=None):
+        raise RuntimeError("boom")
+
+    consumer._run_all_crawlers = _run_all_crawlers
+    message = _MessageStub({"jobId": JOB_ID})
+
+    asyncio.run(consumer._on_message(message))
+
+    assert consumer.db.statuses == ["RUNNING", "FAILED"]
+    assert consumer.publisher.published == ["FAILED"]
+    assert message.nacked and not message.acked
+
+
+def test_on_message_nacks_without_db_update_when_job_id_is_invalid():
+    """jobId가 UUID 형식이 아니면 DB 상태를 건드리지 않고 NACK만 해야 한다."""
+    consumer = _consumer_with_stubs()
+    message = _MessageStub({"jobId": "not-a-uuid"})
+
+    asyncio.run(consumer._on_message(message))
+
+    assert consumer.db.statuses == []
+    assert consumer.publisher.published == []
+    assert message.nacked
+
+
+def test_run_all_crawlers_saves_finished_sites_while_others_still_crawl(monkeypatch):
+    """
+    먼저 끝난 언론사는 느린 언론사의 크롤링이 끝나기 전에 저장되어야 한다.
+
+    느린 크롤러(chosunbiz)는 다른 언론사의 저장이 시작된 뒤에야 완료된다.
+    (크롤링이 모두 끝난 뒤에 저장한다면 이 테스트는 시간 초과로 실패)
+    """
+    saved = threading.Event()
+
+    class _FastCrawler:
+        def __init__(self, client=None):
+            pass
+
+        async def crawl(self, max_news=50):
+            yield _news()
+
+    class _SlowCrawler:
+        def __init__(self, client=None):
+            pass
+
+        async def crawl(self, max_news=50):
+            while not saved.is_set():
+                await asyncio.sleep(0.01)
+            for _ in range(3):
+                yield _news()
+
+    class _RecordingDB(_DBStub):
+        def save_news_with_analysis_bulk(self, news_list, session=None):
+            saved.set()
+            return [news.url for news in news_list]
+
+    for name in ["HankyungCrawler", "MKCrawler", "EdailyCrawler", "HeraldCrawler"]:
+        monkeypatch.setattr(consumer_module, name, _FastCrawler)
+    monkeypatch.setattr(consumer_module, "ChosunbizCrawler", _SlowCrawler)
+
+    consumer = _consumer_with_stubs(db=_RecordingDB())
+
+    result = asyncio.run(asyncio.wait_for(consumer._run_all_crawlers(max_articles=3), timeout=5))
+
+    assert result == {"hankyung": 1, "mk": 1, "edaily": 1, "herald": 1, "chosunbiz": 3}
+
+
+def test_run_all_crawlers_saves_streamed_news_in_batches(monkeypatch):
+    """yield된 뉴스는 save_batch_size건씩 저장되고, 언론사별 저장 건수는 누적되어야 한다."""
+    batch_sizes = []
+
+    class _StreamingCrawler:
+        def __init__(self, client=None):
+            pass
+
+        async def crawl(self, max_news=50):
+            for _ in range(max_news):
+                yield _news()
+
+    class _RecordingDB(_DBStub):
+        def save_news_with_analysis_bulk(self, news_list, session=None):
+            batch_sizes.append(len(news_list))
+            return [news.url for news in news_list]
+
+    for name in ["HankyungCrawler", "MKCrawler", "EdailyCrawler", "HeraldCrawler", "ChosunbizCrawler"]:
+        monkeypatch.setattr(consumer_module, name, _StreamingCrawler)
+    consumer = _consumer_with_stubs(db=_RecordingDB(), save_batch_size=2)
+
+    result = asyncio.run(asyncio.wait_for(consumer._run_all_crawlers(max_articles=5), timeout=5))
+
+    assert result == {"hankyung": 5, "mk": 5, "edaily": 5, "herald": 5, "chosunbiz": 5}
+    assert sorted(batch_sizes) == [1] * 5 + [2] * 10
+
+
+def test_run_all_crawlers_reuses_crawler_instances_across_jobs(monkeypatch):
+    """두 번 실행해도 크롤러는 언론사당 1번만 생성되어야 한다."""
+    created = []
+
+    class _CountingCrawler:
+        def __init__(self, client=None):
+            created.append(self)
+
+        async def crawl(self, max_news=50):
+            yield _news()
+
+    for name in ["HankyungCrawler", "MKCrawler", "EdailyCrawler", "HeraldCrawler", "ChosunbizCrawler"]:
+        monkeypatch.setattr(consumer_module, name, _CountingCrawler)
+
+    consumer = _consumer_with_stubs()
+
+    async def _run_twice():
+        first = await consumer._run_all_crawlers(max_articles=1)
+        second = await consumer._run_all_crawlers(max_articles=1)
+        return first, second
+
+    first, second = asyncio.run(asyncio.wait_for(_run_twice(), timeout=5))
+
+    assert first == second == {"hankyung": 1, "mk": 1, "edaily": 1, "herald": 1, "chosunbiz": 1}
+    assert len(created) == 5
+
+
+def test_analyze_and_save_remembers_only_committed_news():
+    """
+    COMMIT된 배치만 중복 필터에 등록해야 한다.
+
+    - RETURNING으로 돌아온 뉴스: URL + 본문 등록
+    - ON CONFLICT로 스킵된 뉴스: URL만 등록
+    - 저장이 실패(ROLLBACK)한 배치: 아무것도 등록하지 않음
+    """
+    inserted, conflicted, failed = _news(), _news(), _news()
+    inserted.content, conflicted.content, failed.content = "새 본문", "기존 본문", "실패 본문"
+
+    class _PartialDB(_DBStub):
+        def save_news_with_analysis_bulk(self, news_list, session=None):
+            if failed in news_list:
+                raise RuntimeError("rollback")
+            return [inserted.url]
+
+    consumer = _consumer_with_stubs(db=_PartialDB())
+
+    assert consumer._analyze_and_save([inserted, conflicted], "session") == 1
+    with pytest.raises(RuntimeError):
+        consumer._analyze_and_save([failed], "session")
+
+    assert inserted.url in url_filter.SEEN_URLS
+    assert conflicted.url in url_filter.SEEN_URLS
+    assert failed.url not in url_filter.SEEN_URLS
+    assert url_filter.is_duplicate_content("새 본문")
+    assert not url_filter.is_duplicate_content("기존 본문")
+    assert not url_filter.is_duplicate_content("실패 본문")
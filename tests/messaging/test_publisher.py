@@ -0,0 +1,87 @@
+"""
+CrawlResultPublisher 단위 테스트.
+
+목표:
+- 실제 RabbitMQ 없이 연결/채널을 발행 간에 재사용하는지 검증한다.
+- 연결이 끊긴 상태에서 발행하면 새로 연결해 1번 재시도하는지 검증한다.
+"""
+
+import json
+
+from pika.exceptions import StreamLostError
+
+from app.messaging import publisher as publisher_module
+from app.messaging.publisher import CrawlResultPublisher
+
+
+class _ChannelStub:
+    """basic_publish 호출을 기록하고, fail_first=True면 첫 호출에서 연결 끊김을 흉내내는 더블."""
+
+    def __init__(self, fail_first=False):
+        self.fail_first = fail_first
+        self.published = []
+        self.confirm = False
+        self.is_closed = False
+
+    def confirm_delivery(self):
+        self.confirm = True
+
+    def basic_publish(self, exchange, routing_key, body, properties):
+        if self.fail_first:
+            self.fail_first = False
+            raise StreamLostError("connection lost")
+        self.published.append(json.loads(body))
+
+
+class _ConnectionFactory:
+    """pika.BlockingConnection 대체: 생성된 연결 수와 채널을 기록한다."""
+
+    def __init__(self, fail_first=False):
+        self.fail_first = fail_first
+        self.channels = []
+
+    def __call__(self, _params):
+        channel = _ChannelStub(fail_first=self.fail_first)
+        self.fail_first = False
+        self.channels.append(channel)
+
+        class _Connection:
+            is_closed = False
+            is_open = True
+
+            def channel(self):
+                return channel
+
+            def close(self):
+                self.is_closed = True
+                self.is_open = False
+
+        return _Connection()
+
+
+def test_publish_reuses_connection_and_enables_confirms(monkeypatch):
+    """두 번 발행해도 연결은 1번만 열고, Publisher Confirm이 켜져 있어야 한다."""
+    factory = _ConnectionFactory()
+    monkeypatch.setattr(publisher_module.pika, "BlockingConnection", factory)
+
+    publisher = CrawlResultPublisher()
+    publisher.publish("job-1", "COMPLETED", 3, {"mk": 3})
+    publisher.publish("job-2", "FAILED")
+    publisher.close()
+
+    assert len(factory.channels) == 1
+    assert factory.channels[0].confirm is True
+    assert [m["jobId"] for m in factory.channels[0].published] == ["job-1", "job-2"]
+
+
+def test_publish_reconnects_once_when_connection_lost(monkeypatch):
+    """발행 중 연결이 끊기면 새 연결로 1번 재시도해 발행해야 한다."""
+    factory = _ConnectionFactory(fail_first=True)
+    monkeypatch.setattr(publisher_module.pika, "BlockingConnection", factory)
+
+    publisher = CrawlResultPublisher()
+    publisher.publish("job-1", "COMPLETED", 3, {"mk": 3})
+
+    assert len(factory.channels) == 2
+    assert factory.channels[0].published == []
+    assert factory.channels[1].published[0]["status"] == "COMPLETED"
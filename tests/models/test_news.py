@@ -0,0 +1,41 @@
+"""
+CrawledNews.to_create_dto 단위 테스트.
+
+목표:
+- 감정 점수를 -1.00 ~ 1.00 범위의 Decimal로 변환하는지 검증한다.
+- NewsCreate의 길이 제약(title/content)을 전송 전에 로컬에서 검증하는지 검증한다.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from pydantic import ValidationError
+
+from app.models.news import CrawledNews
+
+
+def _crawled(title="삼성전자 실적 발표", content="실적이 개선되었습니다.", sentiment=None):
+    return CrawledNews(
+        title=title,
+        content=content,
+        url="https://example.com/news-1",
+        source="MK",
+        published_at=datetime(2026, 3, 8, 10, 0, 0),
+        sentiment_score=sentiment,
+    )
+
+
+def test_to_create_dto_clamps_sentiment_score():
+    """범위를 넘는 감정 점수는 1.0으로 잘리고 Decimal로 변환되어야 한다."""
+    dto = _crawled(sentiment=1.7).to_create_dto()
+
+    assert dto.sentiment_score == Decimal("1.0")
+    assert dto.title == "삼성전자 실적 발표"
+
+
+@pytest.mark.parametrize("title", ["짧음", "가" * 501])
+def test_to_create_dto_rejects_title_outside_length_limits(title):
+    """5자 미만/500자 초과 제목은 Spring으로 보내기 전에 ValidationError가 나야 한다."""
+    with pytest.raises(ValidationError):
+        _crawled(title=title).to_create_dto()
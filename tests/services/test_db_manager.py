@@ -2,11 +2,17 @@
 DBManager 단위 테스트.
 
 목표:
-- 실제 PostgreSQL 연결 없이 save_news_with_analysis()의 제어 흐름을 검증한다.
+- 실제 PostgreSQL 연결 없이 save_news()/save_news_bulk()/save_news_with_analysis()/
+  save_news_with_analysis_bulk()/update_job_status()/session_scope()의 제어 흐름을 검증한다.
 - SessionLocal을 테스트 더블로 치환해 commit/rollback/close 호출 여부를 확인한다.
 """
 
 from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
 
 from app.models.news import CrawledNews
 from app.services.db_manager import DBManager
@@ -29,13 +35,16 @@ class _SessionStub:
     """
     SQLAlchemy Session 최소 동작 더블.
 
-    save_news_with_analysis()가 사용하는 메서드만 구현한다:
+    save_news_with_analysis()/save_news_bulk()가 사용하는 메서드만 구현한다:
     - query/filter/first
-    - add/flush/commit/rollback/close
+    - add/execute/flush/commit/rollback/close
     """
 
-    def __init__(self, duplicate_news=None):
+    def __init__(self, duplicate_news=None, rowcount=0, returned_rows=None):
         self.duplicate_news = duplicate_news
+        self.rowcount = rowcount
+        self.returned_rows = returned_rows or []
+        self.executed = []
         self.added = []
         self.flush_count = 0
         self.commit_count = 0
@@ -48,6 +57,10 @@ class _SessionStub:
     def add(self, obj):
         self.added.append(obj)
 
+    def execute(self, stmt):
+        self.executed.append(stmt)
+        return SimpleNamespace(rowcount=self.rowcount, all=lambda: self.returned_rows)
+
     def flush(self):
         self.flush_count += 1
 
@@ -61,12 +74,12 @@ class _SessionStub:
         self.close_count += 1
 
 
-def _sample_news(sentiment=1.7, keywords=None, stock_codes=None):
+def _sample_news(sentiment=1.7, keywords=None, stock_codes=None, url="https://example.com/news-1"):
     """테스트용 CrawledNews 생성 헬퍼."""
     return CrawledNews(
         title="삼성전자 실적",
         content="실적이 개선되었습니다.",
-        url="https://example.com/news-1",
+        url=url,
         source="hankyung",
         published_at=datetime(2026, 3, 8, 10, 0, 0),
         sentiment_score=sentiment,
@@ -165,3 +178,224 @@ def test_save_news_with_analysis_rolls_back_when_keyword_save_fails(monkeypatch)
     assert session.commit_count == 0
     assert session.rollback_count == 1
     assert session.close_count == 1
+
+
+def test_save_news_uses_on_conflict_instead_of_select(monkeypatch):
+    """
+    save_news()는 사전 SELECT 없이 INSERT ... ON CONFLICT 1회로 저장해야 한다.
+
+    기대 동작:
+    - rowcount=1이면 True, rowcount=0(중복 URL)이면 False
+    - 어느 경우든 execute 1회 + commit 1회
+    """
+    from app.services import db_manager as db_manager_module
+
+    for rowcount, expected in ((1, True), (0, False)):
+        session = _SessionStub(rowcount=rowcount)
+        session.query = None  # SELECT를 시도하면 TypeError
+        monkeypatch.setattr(db_manager_module, "SessionLocal", lambda: session)
+
+        assert DBManager().save_news(_sample_news()) is expected
+        assert len(session.executed) == 1
+        assert session.commit_count == 1
+        assert session.close_count == 1
+
+        sql = str(session.executed[0].compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (url) DO NOTHING" in sql
+
+
+def test_save_news_bulk_issues_single_insert_on_conflict(monkeypatch):
+    """
+    여러 건을 INSERT ... ON CONFLICT (url) DO NOTHING 1회로 저장해야 한다.
+
+    기대 동작:
+    - execute 1회 + commit 1회
+    - 반환값은 DB가 실제로 INSERT한 건수(rowcount)
+    """
+    from app.services import db_manager as db_manager_module
+
+    session = _SessionStub(rowcount=1)
+    monkeypatch.setattr(db_manager_module, "SessionLocal", lambda: session)
+
+    news_list = [
+        _sample_news(url="https://example.com/news-1"),
+        _sample_news(url="https://example.com/news-2"),
+    ]
+    result = DBManager().save_news_bulk(news_list)
+
+    assert result == 1
+    assert len(session.executed) == 1
+    assert session.commit_count == 1
+    assert session.close_count == 1
+
+    sql = str(session.executed[0].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (url) DO NOTHING" in sql
+
+
+def test_save_news_bulk_skips_db_when_empty(monkeypatch):
+    """빈 리스트면 세션을 열지 않고 0을 반환해야 한다."""
+    from app.services import db_manager as db_manager_module
+
+    def _fail():
+        raise AssertionError("SessionLocal should not be called")
+
+    monkeypatch.setattr(db_manager_module, "SessionLocal", _fail)
+
+    assert DBManager().save_news_bulk([]) == 0
+
+
+def test_save_news_with_analysis_bulk_saves_analysis_for_inserted_rows_only(monkeypatch):
+    """
+    INSERT ... ON CONFLICT ... RETURNING 1회 후, 실제 INSERT된 뉴스에만 분석 결과를 저장해야 한다.
+
+    기대 동작:
+    - execute 1회 + commit 1회
+    - RETURNING으로 돌아온 뉴스(news-2)에만 키워드/종목 저장
+    - 반환값은 INSERT된 뉴스 URL 리스트
+    """
+    from app.services import db_manager as db_manager_module
+
+    session = _SessionStub(returned_rows=[("news-2-id", "https://example.com/news-2")])
+    monkeypatch.setattr(db_manager_module, "SessionLocal", lambda: session)
+
+    manager = DBManager()
+    recorded = {"keywords": [], "stocks": []}
+    monkeypatch.setattr(manager, "_save_keywords", lambda _s, news_id, _k: recorded["keywords"].append(news_id))
+    monkeypatch.setattr(manager, "_save_stock_mentions", lambda _s, news_id, _c: recorded["stocks"].append(news_id))
+
+    news_list = [
+        _sample_news(url="https://example.com/news-1"),
+        _sample_news(url="https://example.com/news-2"),
+        _sample_news(url="https://example.com/news-2"),
+    ]
+    result = manager.save_news_with_analysis_bulk(news_list)
+
+    assert result == ["https://example.com/news-2"]
+    assert len(session.executed) == 1
+    assert session.commit_count == 1
+    assert session.close_count == 1
+    assert recorded == {"keywords": ["news-2-id"], "stocks": ["news-2-id"]}
+
+    compiled = session.executed[0].compile(dialect=postgresql.dialect())
+    assert "ON CONFLICT (url) DO NOTHING RETURNING" in str(compiled)
+    # 배치 안의 중복 URL은 1건으로 합쳐서 INSERT
+    urls = [v for k, v in compiled.params.items() if k.startswith("url")]
+    assert urls == ["https://example.com/news-1", "https://example.com/news-2"]
+    # 감정 점수는 -1.00 ~ 1.00 범위로 클램핑
+    scores = [v for k, v in compiled.params.items() if k.startswith("sentiment_score")]
+    assert scores == [Decimal("1.0"), Decimal("1.0")]
+
+
+def test_save_news_with_analysis_bulk_rolls_back_when_keyword_save_fails(monkeypatch):
+    """분석 결과 저장 중 예외가 나면 배치 전체를 rollback하고 예외를 호출자에게 올려야 한다."""
+    from app.services import db_manager as db_manager_module
+
+    session = _SessionStub(returned_rows=[("news-1-id", "https://example.com/news-1")])
+    monkeypatch.setattr(db_manager_module, "SessionLocal", lambda: session)
+
+    manager = DBManager()
+
+    def _raise_error(*_args, **_kwargs):
+        raise RuntimeError("keyword insert failed")
+
+    monkeypatch.setattr(manager, "_save_keywords", _raise_error)
+
+    with pytest.raises(RuntimeError):
+        manager.save_news_with_analysis_bulk([_sample_news()])
+    assert session.commit_count == 0
+    assert session.rollback_count == 1
+    assert session.close_count == 1
+
+
+def test_save_keywords_upserts_keywords_without_select():
+    """
+    키워드는 SELECT 없이 INSERT ... ON CONFLICT (word) DO UPDATE 1회로 저장해야 한다.
+
+    기대 동작:
+    - execute 2회 (keywords UPSERT + news_keywords INSERT)
+    - 공백/빈 단어는 제외하고, 중복 단어는 먼저 나온 rank로 1건만 저장
+    - keywords UPSERT는 단어 순(잠금 순서 고정), tfidf_score는 원래 rank 기준
+    """
+    session = _SessionStub(returned_rows=[("kw-2", "실적"), ("kw-1", "삼성전자")])
+    session.query = None  # SELECT를 시도하면 TypeError
+
+    DBManager()._save_keywords(session, "news-1-id", ["실적", " 삼성전자 ", "실적", ""])
+
+    assert len(session.executed) == 2
+    upsert = session.executed[0].compile(dialect=postgresql.dialect())
+    assert "ON CONFLICT (word) DO UPDATE SET frequency = (keywords.frequency +" in str(upsert)
+    # 잠금 순서가 항상 같도록 rank가 아니라 단어 순으로 UPSERT
+    assert [v for k, v in upsert.params.items() if k.startswith("word")] == ["삼성전자", "실적"]
+
+    mapping = session.executed[1].compile(dialect=postgresql.dialect())
+    assert str(mapping).startswith("INSERT INTO news_keywords")
+    assert [v for k, v in mapping.params.items() if k.startswith("keyword_id")] == ["kw-2", "kw-1"]
+    assert [v for k, v in mapping.params.items() if k.startswith("tfidf_score")] == [
+        Decimal("1.00"), Decimal("0.90"),
+    ]
+
+
+def test_update_job_status_issues_single_update_with_given_session(monkeypatch):
+    """
+    SELECT 없이 UPDATE 1회로 상태를 바꾸고, 호출자가 넘긴 세션은 닫지 않아야 한다.
+
+    기대 동작:
+    - SessionLocal 미호출
+    - execute 1회(UPDATE) + commit 1회, close 미호출 (세션 수명은 session_scope()가 관리)
+    - COMPLETED면 total_articles/media_results/completed_at도 함께 갱신
+    """
+    from app.services import db_manager as db_manager_module
+
+    def _fail():
+        raise AssertionError("SessionLocal should not be called")
+
+    monkeypatch.setattr(db_manager_module, "SessionLocal", _fail)
+
+    session = _SessionStub(rowcount=1)
+    session.query = None  # SELECT를 시도하면 TypeError
+
+    DBManager().update_job_status(
+        "550e8400-e29b-41d4-a716-446655440000", "COMPLETED",
+        total_articles=3, media_results={"mk": 3}, session=session,
+    )
+
+    assert len(session.executed) == 1
+    assert session.commit_count == 1
+    assert session.close_count == 0
+
+    compiled = session.executed[0].compile(dialect=postgresql.dialect())
+    assert str(compiled).startswith("UPDATE crawl_jobs SET")
+    assert compiled.params["status"] == "COMPLETED"
+    assert compiled.params["total_articles"] == 3
+    assert compiled.params["media_results"] == {"mk": 3}
+
+
+def test_update_job_status_rolls_back_when_job_missing(monkeypatch):
+    """대상 Job이 없으면(rowcount=0) commit하지 않고 rollback해야 한다."""
+    from app.services import db_manager as db_manager_module
+
+    session = _SessionStub(rowcount=0)
+    monkeypatch.setattr(db_manager_module, "SessionLocal", lambda: session)
+
+    DBManager().update_job_status("550e8400-e29b-41d4-a716-446655440000", "RUNNING")
+
+    assert session.commit_count == 0
+    assert session.rollback_count == 1
+    assert session.close_count == 1
+
+
+def test_session_scope_closes_session_on_exit(monkeypatch):
+    """session_scope() 블록이 끝나면 예외 여부와 관계없이 세션을 닫아야 한다."""
+    from app.services import db_manager as db_manager_module
+
+    session = _SessionStub()
+    monkeypatch.setattr(db_manager_module, "SessionLocal", lambda: session)
+
+    try:
+        with DBManager().session_scope() as scoped:
+            assert scoped is session
+            raise RuntimeError("job failed")
+    except RuntimeError:
+        pass
+
+    assert session.close_count == 1
@@ -0,0 +1,114 @@
+"""
+NewsService 단위 테스트.
+
+목표:
+- 실제 Spring API 없이 check_urls_exist()가 이미 존재하는 URL만 모아 반환하는지 검증한다.
+- 존재가 확인된 URL을 LRU 캐시로 재사용하는지 검증한다.
+- 주입받은 공유 클라이언트는 close()에서 닫지 않는지 검증한다.
+- httpx.MockTransport로 응답을 흉내낸다.
+"""
+
+import asyncio
+
+import httpx
+
+from app.services import news_service
+from app.services.news_service import NewsService
+
+
+def _exists_handler(existing: set[str]):
+    """/api/v1/news/exists 요청에 existing 포함 여부를 응답하는 핸들러."""
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        url = request.url.params["url"]
+        return httpx.Response(200, json={"data": url in existing})
+
+    return _handler
+
+
+def test_check_urls_exist_returns_only_existing_urls():
+    """이미 존재하는 URL만 결과 집합에 포함되어야 한다."""
+    urls = [f"https://example.com/news-{i}" for i in range(5)]
+    existing = {urls[1], urls[3]}
+
+    async def _run():
+        service = NewsService()
+        await service.client.aclose()
+        service.client = httpx.AsyncClient(transport=httpx.MockTransport(_exists_handler(existing)))
+        try:
+            return await service.check_urls_exist(urls)
+        finally:
+            await service.close()
+
+    assert asyncio.run(_run()) == existing
+
+
+def test_check_urls_exist_treats_failed_checks_as_new():
+    """확인 요청이 실패한 URL은 존재하지 않는 것으로 간주해야 한다."""
+
+    def _handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(500)
+
+    async def _run():
+        service = NewsService()
+        await service.client.aclose()
+        service.client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+        try:
+            return await service.check_urls_exist(["https://example.com/news-1"])
+        finally:
+            await service.close()
+
+    assert asyncio.run(_run()) == set()
+
+
+def test_check_url_exists_uses_cache_for_known_urls():
+    """한 번 존재가 확인된 URL은 다시 API를 호출하지 않아야 한다."""
+    calls = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.params["url"])
+        return httpx.Response(200, json={"data": True})
+
+    async def _run():
+        service = NewsService()
+        await service.client.aclose()
+        service.client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+        try:
+            first = await service.check_url_exists("https://example.com/news-1")
+            second = await service.check_url_exists("https://example.com/news-1")
+            return first, second
+        finally:
+            await service.close()
+
+    assert asyncio.run(_run()) == (True, True)
+    assert calls == ["https://example.com/news-1"]
+
+
+def test_seen_url_cache_evicts_oldest_url(monkeypatch):
+    """캐시가 가득 차면 가장 오래된 URL부터 제거되어야 한다."""
+    monkeypatch.setattr(news_service, "SEEN_URL_CACHE_SIZE", 2)
+
+    async def _run():
+        service = NewsService()
+        try:
+            for i in range(3):
+                service._remember_url(f"https://example.com/news-{i}")
+            return list(service._seen_urls)
+        finally:
+            await service.close()
+
+    assert asyncio.run(_run()) == ["https://example.com/news-1", "https://example.com/news-2"]
+
+
+def test_close_keeps_injected_shared_client_open():
+    """주입받은 공유 클라이언트는 close()에서 닫지 않아야 한다 (소유자가 닫음)."""
+
+    async def _run():
+        shared = httpx.AsyncClient(transport=httpx.MockTransport(_exists_handler(set())))
+        service = NewsService(client=shared)
+        await service.close()
+        closed = shared.is_closed
+        await shared.aclose()
+        return closed
+
+    assert asyncio.run(_run()) is False
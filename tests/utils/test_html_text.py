@@ -0,0 +1,20 @@
+"""
+node_text 단위 테스트.
+
+목표:
+- <script>/<style> 내용은 빼고, 뒤에 이어지는 본문 텍스트는 남기는지 검증한다.
+- 줄바꿈/탭 연속을 공백 1칸으로 정규화하는지 검증한다.
+"""
+
+from lxml import html
+
+from app.utils.html_text import node_text
+
+
+def test_node_text_strips_script_style_and_collapses_whitespace():
+    """script/style 텍스트는 제거되고 tail 텍스트와 본문은 공백 정규화되어야 한다."""
+    node = html.fromstring(
+        "<div>첫 줄\n\n\t\t둘째 <script>var ad = 1;</script>셋째<style>.x{}</style> 끝</div>"
+    )
+
+    assert node_text(node) == "첫 줄 둘째 셋째 끝"
@@ -0,0 +1,85 @@
+"""
+공유 HTTP 클라이언트(get_client/close_client) 단위 테스트.
+
+목표:
+- 같은 이벤트 루프에서는 같은 클라이언트를 재사용하는지 검증한다.
+- 종료 또는 루프 변경 후에는 새 클라이언트를 만드는지 검증한다.
+- fetch_limited()가 최대 수신 크기를 지키는지 검증한다.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.utils import http
+
+
+def test_get_client_reuses_client_within_same_loop():
+    """같은 루프 안에서 여러 번 호출해도 동일 인스턴스를 반환해야 한다."""
+
+    async def _run():
+        first = http.get_client()
+        second = http.get_client()
+        await http.close_client()
+        return first, second
+
+    first, second = asyncio.run(_run())
+
+    assert first is second
+    assert first.is_closed
+
+
+def test_get_client_creates_new_client_for_new_loop():
+    """asyncio.run()마다 루프가 바뀌면 새 클라이언트를 만들어야 한다."""
+
+    async def _get():
+        return http.get_client()
+
+    first = asyncio.run(_get())
+    second = asyncio.run(_get())
+    asyncio.run(http.close_client())
+
+    assert first is not second
+
+
+def test_fetch_limited_stops_reading_at_max_bytes():
+    """본문이 max_bytes보다 크면 max_bytes까지만 반환해야 한다."""
+    transport = httpx.MockTransport(lambda _request: httpx.Response(200, content=b"a" * 10_000))
+
+    async def _run():
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await http.fetch_limited(client, "https://example.com/news", max_bytes=1_000)
+
+    body = asyncio.run(_run())
+
+    assert body == b"a" * 1_000
+
+
+def test_fetch_limited_raises_on_error_status():
+    """4xx/5xx 응답이면 HTTPStatusError를 발생시켜야 한다."""
+    transport = httpx.MockTransport(lambda _request: httpx.Response(404))
+
+    async def _run():
+        async with httpx.AsyncClient(transport=transport) as client:
+            await http.fetch_limited(client, "https://example.com/missing")
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(_run())
+
+
+def test_fetch_limited_with_charset_returns_content_type_charset():
+    """Content-Type 헤더의 charset을 본문과 함께 반환해야 한다."""
+    body = "삼성전자".encode("euc-kr")
+    transport = httpx.MockTransport(
+        lambda _request: httpx.Response(200, content=body, headers={"Content-Type": "text/html; charset=EUC-KR"})
+    )
+
+    async def _run():
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await http.fetch_limited_with_charset(client, "https://example.com/news")
+
+    content, charset = asyncio.run(_run())
+
+    assert content == body
+    assert charset.lower() == "euc-kr"
@@ -0,0 +1,24 @@
+"""
+parse_pool 단위 테스트.
+
+목표:
+- 파싱 프로세스 풀이 fork가 아니라 spawn으로 자식 프로세스를 만드는지 검증한다.
+- 모듈 최상위 함수를 자식 프로세스에서 실행하고 결과를 돌려받는지 검증한다.
+"""
+
+import asyncio
+
+from app.utils import parse_pool
+from app.utils.url_filter import content_digest
+
+
+def test_parse_pool_uses_spawn_start_method():
+    """스레드가 떠 있는 프로세스를 fork하지 않도록 spawn 컨텍스트를 써야 한다."""
+    assert parse_pool.PARSE_POOL._mp_context.get_start_method() == "spawn"
+
+
+def test_run_in_parse_pool_returns_result_from_child_process():
+    """모듈 최상위 함수는 pickle되어 자식 프로세스에서 실행되어야 한다."""
+    result = asyncio.run(parse_pool.run_in_parse_pool(content_digest, "삼성전자  실적"))
+
+    assert result == content_digest("삼성전자 실적")
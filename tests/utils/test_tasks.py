@@ -0,0 +1,56 @@
+"""
+iter_completed 단위 테스트.
+
+목표:
+- 코루틴 결과를 완료 순서대로 넘겨주는지 검증한다.
+- 예외는 올리지 않고 결과 값으로 넘겨주는지 검증한다.
+- 소비를 중간에 멈추면 남은 태스크를 취소하는지 검증한다.
+"""
+
+import asyncio
+
+from app.utils.tasks import iter_completed
+
+
+async def _delayed(value, delay):
+    await asyncio.sleep(delay)
+    return value
+
+
+async def _fail():
+    raise RuntimeError("parse failed")
+
+
+def test_iter_completed_yields_in_completion_order_with_exceptions():
+    """먼저 끝난 결과부터 나오고, 실패한 코루틴은 예외 객체로 나와야 한다."""
+
+    async def _run():
+        return [r async for r in iter_completed([_delayed("slow", 0.05), _fail(), _delayed("fast", 0)])]
+
+    results = asyncio.run(_run())
+
+    assert results[-1] == "slow"
+    assert "fast" in results
+    assert any(isinstance(r, RuntimeError) for r in results)
+
+
+def test_iter_completed_cancels_pending_tasks_on_close():
+    """첫 결과만 받고 멈추면 아직 끝나지 않은 태스크는 취소되어야 한다."""
+    cancelled = []
+
+    async def _slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def _run():
+        results = iter_completed([_delayed("fast", 0), _slow()])
+        first = await results.__anext__()
+        await results.aclose()
+        await asyncio.sleep(0)
+        return first
+
+    assert asyncio.run(_run()) == "fast"
+    assert cancelled == [True]
@@ -0,0 +1,124 @@
+"""
+url_filter 단위 테스트.
+
+목표:
+- Bloom Filter의 포함 판정/확장 동작을 검증한다.
+- 본문 중복 판정이 공백 차이를 무시하고, 저장 확인(remember_saved) 전에는 등록하지 않는지 검증한다.
+- init_filters()가 디스크의 필터를 전역 필터에 합치는지 검증한다.
+- 디스크 저장 후 다시 로드해도 판정 결과가 유지되는지 검증한다.
+- 여러 Worker가 차례로 저장해도 서로의 등록분을 덮어쓰지 않는지 검증한다.
+"""
+
+from app.utils import url_filter
+from app.utils.url_filter import ScalableBloomFilter
+
+
+def test_bloom_filter_contains_added_keys_only():
+    """추가한 URL은 포함, 추가하지 않은 URL은 미포함으로 판정되어야 한다."""
+    bloom = ScalableBloomFilter(initial_capacity=1000, error_rate=1e-4)
+
+    bloom.add("https://example.com/news-1")
+
+    assert "https://example.com/news-1" in bloom
+    assert "https://example.com/news-2" not in bloom
+    assert len(bloom) == 1
+
+
+def test_bloom_filter_grows_beyond_initial_capacity():
+    """초기 용량을 넘겨도 추가한 키를 모두 포함해야 한다."""
+    bloom = ScalableBloomFilter(initial_capacity=10, error_rate=1e-3)
+    urls = [f"https://example.com/news-{i}" for i in range(50)]
+
+    for url in urls:
+        bloom.add(url)
+
+    assert all(url in bloom for url in urls)
+    assert len(bloom) == 50
+
+
+def test_is_duplicate_content_only_after_remember_saved(monkeypatch):
+    """조회만으로는 등록되지 않고, 저장 확인 후 공백만 다른 본문도 중복으로 판정되어야 한다."""
+    monkeypatch.setattr(url_filter, "SEEN_URLS", ScalableBloomFilter(initial_capacity=100))
+    monkeypatch.setattr(url_filter, "SEEN_CONTENTS", ScalableBloomFilter(initial_capacity=100))
+
+    assert url_filter.is_duplicate_content("삼성전자  실적\n개선") is False
+    assert url_filter.is_duplicate_content("삼성전자  실적\n개선") is False
+
+    url_filter.remember_saved("https://example.com/news-1", "삼성전자  실적\n개선")
+
+    assert "https://example.com/news-1" in url_filter.SEEN_URLS
+    assert url_filter.is_duplicate_content(" 삼성전자 실적 개선 ") is True
+    assert url_filter.is_duplicate_content("SK하이닉스 실적 개선") is False
+
+
+def test_remember_saved_skips_no_content_marker(monkeypatch):
+    """본문 없음 대체 문구는 본문 필터에 등록하지 않아야 한다."""
+    monkeypatch.setattr(url_filter, "SEEN_URLS", ScalableBloomFilter(initial_capacity=100))
+    monkeypatch.setattr(url_filter, "SEEN_CONTENTS", ScalableBloomFilter(initial_capacity=100))
+
+    url_filter.remember_saved("https://example.com/news-1", "본문 없음")
+
+    assert len(url_filter.SEEN_CONTENTS) == 0
+    assert url_filter.is_duplicate_content("본문 없음") is False
+
+
+def test_save_and_load_filters_roundtrip(monkeypatch, tmp_path):
+    """저장한 필터를 다시 로드하면 같은 URL/본문을 포함해야 한다."""
+    seen_urls = ScalableBloomFilter(initial_capacity=100)
+    seen_contents = ScalableBloomFilter(initial_capacity=100)
+    seen_urls.add("https://example.com/news-1")
+    seen_contents.add(url_filter.content_digest("본문"))
+    monkeypatch.setattr(url_filter, "SEEN_URLS", seen_urls)
+    monkeypatch.setattr(url_filter, "SEEN_CONTENTS", seen_contents)
+
+    path = tmp_path / "filter.pkl"
+    url_filter.save_filters(path)
+    loaded_urls, loaded_contents = url_filter.load_filters(path)
+
+    assert "https://example.com/news-1" in loaded_urls
+    assert url_filter.content_digest("본문") in loaded_contents
+
+
+def test_load_filters_returns_empty_filters_when_file_missing(tmp_path):
+    """저장 파일이 없으면 빈 필터를 반환해야 한다."""
+    loaded_urls, loaded_contents = url_filter.load_filters(tmp_path / "missing.pkl")
+
+    assert len(loaded_urls) == 0
+    assert len(loaded_contents) == 0
+
+
+def test_init_filters_merges_saved_filters_into_globals(monkeypatch, tmp_path):
+    """init_filters()는 디스크의 필터를 기존 전역 필터 객체에 합쳐야 한다 (참조 유지)."""
+    saved_urls = ScalableBloomFilter()
+    saved_urls.add("https://example.com/news-1")
+    monkeypatch.setattr(url_filter, "SEEN_URLS", saved_urls)
+    monkeypatch.setattr(url_filter, "SEEN_CONTENTS", ScalableBloomFilter())
+    path = tmp_path / "filter.pkl"
+    url_filter.save_filters(path)
+
+    seen_urls = ScalableBloomFilter()
+    seen_urls.add("https://example.com/news-2")
+    monkeypatch.setattr(url_filter, "SEEN_URLS", seen_urls)
+    url_filter.init_filters(path)
+
+    assert url_filter.SEEN_URLS is seen_urls
+    assert "https://example.com/news-1" in seen_urls
+    assert "https://example.com/news-2" in seen_urls
+
+
+def test_save_filters_unions_with_filters_saved_by_other_workers(monkeypatch, tmp_path):
+    """다른 Worker가 먼저 저장한 URL도 나중에 저장한 파일에 남아 있어야 한다."""
+    path = tmp_path / "filter.pkl"
+
+    for url in ("https://example.com/worker-1", "https://example.com/worker-2"):
+        # Worker마다 자기가 등록한 URL만 가진 별도 전역 필터
+        seen_urls = ScalableBloomFilter()
+        seen_urls.add(url)
+        monkeypatch.setattr(url_filter, "SEEN_URLS", seen_urls)
+        monkeypatch.setattr(url_filter, "SEEN_CONTENTS", ScalableBloomFilter())
+        url_filter.save_filters(path)
+
+    loaded_urls, _ = url_filter.load_filters(path)
+
+    assert "https://example.com/worker-1" in loaded_urls
+    assert "https://example.com/worker-2" in loaded_urls